@@ -1,9 +1,10 @@
 import matplotlib
 matplotlib.use('Agg')   # backend sem janelas (gera arquivos PNG)
-import matplotlib.pyplot as plt
 import networkx as nx
 from collections import deque
 import heapq
+from busca_grafo import ArvoreBusca, GrafoCSR, bfs_csr
+from renderizador import renderizador_para
 
 # Criar os grafos
 G_game = nx.Graph()
@@ -47,79 +48,56 @@ for local, pos in locais.items():
 
 # Função Plot Mapa
 def plot_mapa(grafo, caminho_encontrado, titulo='Mapa do reino'):
-    pos = nx.get_node_attributes(grafo, 'pos')
-    pesos = nx.get_edge_attributes(grafo, 'weight')
-
-    plt.figure(figsize=(15, 10))
-
-    # Labels com quebra de linha para caber melhor
-    labels = {node: node.replace(' ', '\n') for node in grafo.nodes()}
-
-    # Cor dos nós: vermelho se estiver no caminho, senão cinza claro
-    node_colors = ['red' if (caminho_encontrado and node in caminho_encontrado) else 'lightgray' for node in grafo.nodes()]
-
-    # Desenha nós (sem labels por enquanto)
-    nx.draw_networkx_nodes(grafo, pos, node_size=1000, node_color=node_colors)
-
-    # Desenha todas as arestas em cinza claro
-    nx.draw_networkx_edges(grafo, pos, width=1.0, alpha=0.6, edge_color='lightgray')
-
-    # Se houver caminho, desenha as arestas do caminho em vermelho e mais grossas
+    # O mapa base é desenhado uma vez por grafo e reaproveitado (renderizador.py);
+    # aqui só entram o caminho e o título.
+    renderizador_para(grafo).desenhar(caminho_encontrado, titulo, "mapa.png")
     if caminho_encontrado and len(caminho_encontrado) >= 2:
-        path_edges = list(zip(caminho_encontrado, caminho_encontrado[1:]))
-        nx.draw_networkx_edges(grafo, pos, edgelist=path_edges, width=3.5, edge_color='red')
         print("Existe um caminho e foi destacado em vermelho.")
     else:
         print("Nenhum caminho para destacar.")
-
-    # Desenha labels (com caixa leve)
-    nx.draw_networkx_labels(grafo, pos, labels=labels, font_size=10, font_weight='bold',
-                            bbox=dict(facecolor='lightblue', alpha=0.5, edgecolor='none', boxstyle='round,pad=0.2'))
-
-    # Desenha os pesos das arestas
-    nx.draw_networkx_edge_labels(grafo, pos, edge_labels=pesos, font_size=8, label_pos=0.5)
-
-    plt.title(titulo)
-    plt.axis('off')
-    plt.tight_layout()
-    plt.savefig("mapa.png")
     print("Arquivo salvo: mapa.png")
 
 
 # Função BFS
 def bfs_game(grafo, inicio, objetivo):
+    # Grafo já compilado (busca_grafo.compilar_grafo): roda direto nos arrays CSR
+    if isinstance(grafo, GrafoCSR):
+        return bfs_csr(grafo, inicio, objetivo)
+
     visitados = set()
-    fila = deque([(inicio, [inicio], 0)])  # nó, caminho até aqui, custo até aqui
+    arvore = ArvoreBusca()  # nó, pai e custo até aqui (sem copiar o caminho)
+    fila = deque([arvore.adicionar(inicio, -1, 0)])
 
     while fila:
-        no_atual, caminho, custo_total = fila.popleft()
+        entrada = fila.popleft()
+        no_atual = arvore.nos[entrada]
 
         if no_atual == objetivo:
-            return caminho, custo_total
+            return arvore.caminho(entrada), arvore.custos[entrada]
 
         if no_atual not in visitados:
             visitados.add(no_atual)
-            for vizinho in grafo[no_atual]:
+            custo_total = arvore.custos[entrada]
+            for vizinho, atributos in grafo[no_atual].items():
                 if vizinho not in visitados:
-                    novo_custo = custo_total + grafo[no_atual][vizinho]['weight']
-                    novo_caminho = list(caminho)
-                    novo_caminho.append(vizinho)
-                    fila.append((vizinho, novo_caminho, novo_custo))
+                    novo_custo = custo_total + atributos['weight']
+                    fila.append(arvore.adicionar(vizinho, entrada, novo_custo))
     return None, float('inf')
 
 
-# Teste do BFS
-inicio_heroi = 'Castelo do heroi'
-objetivo_heroi = 'Caverna da Bruxa'
-caminho_bfs, custo_bfs = bfs_game(G_game, inicio_heroi, objetivo_heroi)
+if __name__ == '__main__':
+    # Teste do BFS
+    inicio_heroi = 'Castelo do heroi'
+    objetivo_heroi = 'Caverna da Bruxa'
+    caminho_bfs, custo_bfs = bfs_game(G_game, inicio_heroi, objetivo_heroi)
 
-if caminho_bfs:
-    print(f"Caminho encontrado: {caminho_bfs}")
-    print(f"Custo total: {custo_bfs}")
-else:
-    print("Deu errado - nenhum caminho encontrado")
+    if caminho_bfs:
+        print(f"Caminho encontrado: {caminho_bfs}")
+        print(f"Custo total: {custo_bfs}")
+    else:
+        print("Deu errado - nenhum caminho encontrado")
 
-# Gera o mapa com o caminho encontrado destacado
-plot_mapa(G_game, caminho_bfs, titulo='Mapa do Reino - Caminho do Herói')
+    # Gera o mapa com o caminho encontrado destacado
+    plot_mapa(G_game, caminho_bfs, titulo='Mapa do Reino - Caminho do Herói')
 
 ## Busca Gulosa
\ No newline at end of file
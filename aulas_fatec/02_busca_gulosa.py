@@ -4,6 +4,11 @@ matplotlib.use('Agg')   # backend sem janelas
 import matplotlib.pyplot as plt
 import networkx as nx
 import heapq
+import numpy as np
+from matplotlib.collections import LineCollection
+from busca_grafo import (ArvoreBusca, GrafoCSR, busca_bidirecional, cache_heuristica, compilar_grafo,
+                         dijkstra_csr, gulosa_csr)
+from renderizador import renderizador_para
 
 # --- Montagem do grafo original (arestas com pesos dados) ---
 G_game = nx.Graph()
@@ -45,9 +50,8 @@ G_game.add_edge('Bonafail Cay','Caverna da Bruxa', weight=40)
 
 # --- utilitários ---
 def euclid(a, b):
-    pa = G_game.nodes[a]['pos']
-    pb = G_game.nodes[b]['pos']
-    return math.hypot(pa[0] - pb[0], pa[1] - pb[1])
+    # tabela de distâncias até b calculada uma vez (cache LRU por objetivo)
+    return cache_heuristica(G_game).distancia(a, b)
 
 def custo_por_pesos(grafo, caminho):
     """Soma dos weights das arestas ao longo do caminho (assume caminho lista de nós)."""
@@ -71,147 +75,123 @@ def custo_euclidiano_along_path(grafo, caminho):
 
 # --- Plot padrão que você pediu (igual ao anterior) ---
 def plot_mapa_path(grafo, caminho_encontrado=None, titulo='Mapa do reino', arquivo_saida='mapa.png'):
-    pos = nx.get_node_attributes(grafo, 'pos')
-    pesos = nx.get_edge_attributes(grafo, 'weight')
-
-    plt.figure(figsize=(15, 10))
-    labels = {node: node.replace(' ', '\n') for node in grafo.nodes()}
-
-    # Cor dos nós: vermelho se estiver no caminho, senão cinza claro
-    node_colors = ['red' if (caminho_encontrado and node in caminho_encontrado) else 'lightgray' for node in grafo.nodes()]
-
-    # Desenha nós e arestas de base
-    nx.draw_networkx_nodes(grafo, pos, node_size=1000, node_color=node_colors)
-    nx.draw_networkx_edges(grafo, pos, width=1.0, alpha=0.6, edge_color='lightgray')
-
-    # Se houver caminho, desenha as arestas do caminho em vermelho e mais grossas
+    # mapa base em cache por grafo (renderizador.py): só o caminho e o título são desenhados
+    renderizador_para(grafo).desenhar(caminho_encontrado, titulo, arquivo_saida)
     if caminho_encontrado and len(caminho_encontrado) >= 2:
-        path_edges = list(zip(caminho_encontrado, caminho_encontrado[1:]))
-        nx.draw_networkx_edges(grafo, pos, edgelist=path_edges, width=3.5, edge_color='red')
         print("Existe um caminho e foi destacado em vermelho.")
     else:
         print("Nenhum caminho para destacar.")
-
-    # Desenha labels (com caixa leve)
-    nx.draw_networkx_labels(grafo, pos, labels=labels, font_size=10, font_weight='bold',
-                            bbox=dict(facecolor='lightblue', alpha=0.5, edgecolor='none', boxstyle='round,pad=0.2'))
-
-    # Desenha os pesos das arestas
-    nx.draw_networkx_edge_labels(grafo, pos, edge_labels=pesos, font_size=8, label_pos=0.5)
-
-    plt.title(titulo)
-    plt.axis('off')
-    plt.tight_layout()
-    plt.savefig(arquivo_saida)
     print(f"Arquivo salvo: {arquivo_saida}")
-    plt.close()
 
 # --- Busca Gulosa (Greedy Best-First) sobre o grafo original ---
 def busca_gulosa(grafo, inicio, objetivo):
     """Greedy best-first: prioridade = heuristica(estado, objetivo). Retorna caminho (ou None)."""
+    # Grafo já compilado (busca_grafo.compilar_grafo): roda direto nos arrays CSR
+    if isinstance(grafo, GrafoCSR):
+        return gulosa_csr(grafo, inicio, objetivo)
+
+    cache = cache_heuristica(grafo)
+    distancias, ids = cache.lista(objetivo), cache.ids
+
+    def h(no):
+        return distancias[ids[no]]
+
     visited = set()
+    arvore = ArvoreBusca()
     pq = []
-    # (prioridade, nó_atual, caminho)
-    heapq.heappush(pq, (euclid(inicio, objetivo), inicio, [inicio]))
+    # (prioridade, nó_atual, chave do caminho); empates comparam o caminho como antes
+    heapq.heappush(pq, (h(inicio), inicio, arvore.chave(arvore.adicionar(inicio, -1, 0))))
 
     while pq:
-        pri, nodo, caminho = heapq.heappop(pq)
+        pri, nodo, chave = heapq.heappop(pq)
+        entrada = chave.entrada
         if nodo == objetivo:
-            return caminho
+            return arvore.caminho(entrada)
         if nodo in visited:
             continue
         visited.add(nodo)
-        for viz in grafo[nodo]:
+        custo = arvore.custos[entrada]
+        for viz, atributos in grafo[nodo].items():
             if viz not in visited:
-                novo_caminho = caminho + [viz]
-                heapq.heappush(pq, (euclid(viz, objetivo), viz, novo_caminho))
+                novo = arvore.adicionar(viz, entrada, custo + atributos.get('weight', 0.0))
+                heapq.heappush(pq, (h(viz), viz, arvore.chave(novo)))
     return None
 
 # --- Funções pré-existentes: linha reta direta e grafo completo / A* (mantive elas) ---
 def plot_mapa_com_linha_direta(grafo, inicio, destino, arquivo_saida='mapa_direto.png'):
-    pos = nx.get_node_attributes(grafo, 'pos')
-    pesos = nx.get_edge_attributes(grafo, 'weight')
-
-    plt.figure(figsize=(14,9))
-    labels = {n: n.replace(' ', '\n') for n in grafo.nodes()}
-
-    # desenha nós
-    node_colors = ['lightgray' for _ in grafo.nodes()]
-    nx.draw_networkx_nodes(grafo, pos, node_size=900, node_color=node_colors)
-
-    # desenha arestas originais atenuadas (para referência)
-    nx.draw_networkx_edges(grafo, pos, width=1.0, alpha=0.4, edge_color='gray')
-
-    # desenha labels e pesos (opcionais)
-    nx.draw_networkx_labels(grafo, pos, labels=labels, font_size=10, font_weight='bold',
-                            bbox=dict(facecolor='lightblue', alpha=0.5, edgecolor='none', boxstyle='round,pad=0.2'))
-    nx.draw_networkx_edge_labels(grafo, pos, edge_labels=pesos, font_size=7, label_pos=0.5)
-
-    # linha reta direta entre inicio e destino (destaca: cor vermelha)
-    p_ini = pos[inicio]
-    p_dst = pos[destino]
-    distancia_direta = math.hypot(p_ini[0]-p_dst[0], p_ini[1]-p_dst[1])
-
-    # desenha a linha (solid, mais grossa)
-    plt.plot([p_ini[0], p_dst[0]], [p_ini[1], p_dst[1]], color='red', linewidth=3, linestyle='-')
-
-    # destaca os nós inicio/destino em vermelho
-    nx.draw_networkx_nodes(grafo, pos, nodelist=[inicio, destino], node_size=1100, node_color='red')
-
-    # anota o custo (distância) próximo ao meio da linha
-    meio_x = (p_ini[0] + p_dst[0]) / 2.0
-    meio_y = (p_ini[1] + p_dst[1]) / 2.0
-    plt.text(meio_x, meio_y, f'{distancia_direta:.2f}', fontsize=12, fontweight='bold', color='black',
-             bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2'))
-
-    plt.title(f'Linha reta entre \"{inicio}\" e \"{destino}\" — custo (euclid) = {distancia_direta:.2f}')
-    plt.axis('off')
-    plt.tight_layout()
-    plt.savefig(arquivo_saida)
+    # mesmo mapa base em cache do plot_mapa_path: só a linha, os dois nós e o custo são desenhados
+    _, distancia_direta = renderizador_para(grafo).desenhar_linha_direta(inicio, destino, arquivo_saida)
     print(f"Gerado: {arquivo_saida} (distância direta = {distancia_direta:.2f})")
-    plt.close()
+
+def matriz_distancias(coords):
+    """Distâncias euclidianas entre todos os pares de pontos (n x n), via broadcasting."""
+    diff = coords[:, None, :] - coords[None, :, :]
+    return np.hypot(diff[..., 0], diff[..., 1])
+
+def astar_grafo_completo(dist, origem, alvo):
+    """
+    A* sobre o grafo completo implícito dado pela matriz de distâncias: a
+    aresta (u, v) custa dist[u, v] e a heurística é a coluna dist[:, alvo].
+    Versão densa: a cada passo escolhe o menor f entre os abertos e relaxa
+    todos os vizinhos de uma vez. Uma única busca devolve caminho e custo.
+    Retorna (lista de índices, custo) ou (None, inf).
+    """
+    n = dist.shape[0]
+    h = dist[:, alvo]
+    g = np.full(n, np.inf)
+    pais = np.full(n, -1)
+    abertos = np.zeros(n, dtype=bool)
+    g[origem] = 0.0
+    abertos[origem] = True
+
+    while abertos.any():
+        f = np.where(abertos, g + h, np.inf)
+        u = int(np.argmin(f))
+        if u == alvo:
+            caminho = [u]
+            while pais[caminho[-1]] >= 0:
+                caminho.append(int(pais[caminho[-1]]))
+            return caminho[::-1], float(g[alvo])
+        abertos[u] = False
+        novo_g = g[u] + dist[u]
+        melhora = novo_g < g
+        g[melhora] = novo_g[melhora]
+        pais[melhora] = u
+        abertos |= melhora
+    return None, float('inf')
 
 def criar_grafo_completo_e_astar(grafo_original, inicio, destino, arquivo_saida='mapa_grafo_completo.png'):
-    # monta grafo completo (cada par de nós conectado com peso = distância euclidiana)
-    Gc = nx.Graph()
+    # grafo completo implícito (cada par de nós ligado com peso = distância euclidiana),
+    # representado só pela matriz de distâncias par a par
     pos = nx.get_node_attributes(grafo_original, 'pos')
-    for n, p in pos.items():
-        Gc.add_node(n, pos=p)
-    nodes = list(Gc.nodes())
-    for i in range(len(nodes)):
-        for j in range(i+1, len(nodes)):
-            a = nodes[i]; b = nodes[j]
-            d = math.hypot(pos[a][0]-pos[b][0], pos[a][1]-pos[b][1])
-            Gc.add_edge(a, b, weight=d)
-
-    # heurística euclidiana
-    def h(u, v):
-        pu = Gc.nodes[u]['pos']; pv = Gc.nodes[v]['pos']
-        return math.hypot(pu[0]-pv[0], pu[1]-pv[1])
-
-    try:
-        caminho = nx.astar_path(Gc, inicio, destino, heuristic=h, weight='weight')
-        custo = nx.astar_path_length(Gc, inicio, destino, heuristic=h, weight='weight')
+    nodes = list(pos)
+    coords = np.array([pos[n] for n in nodes], dtype=np.float64)
+    dist = matriz_distancias(coords)
+
+    indices, custo = astar_grafo_completo(dist, nodes.index(inicio), nodes.index(destino))
+    if indices is not None:
+        caminho = [nodes[i] for i in indices]
         print("A* no grafo completo — caminho:", caminho)
         print("Custo (A* no completo):", custo)
-    except nx.NetworkXNoPath:
+    else:
         print("A* no grafo completo: nenhum caminho encontrado")
         caminho = []
         custo = float('inf')
 
-    # plot — se o caminho for direto entre inicio e destino, a aresta será desenhada automaticamente porque existe no grafo completo
-    pos = nx.get_node_attributes(Gc, 'pos')
+    # plot — as arestas do grafo completo saem direto da matriz de coordenadas
     plt.figure(figsize=(14,9))
-    labels = {n: n.replace(' ', '\n') for n in Gc.nodes()}
-    nx.draw_networkx_nodes(Gc, pos, node_size=900, node_color='lightgray')
+    labels = {n: n.replace(' ', '\n') for n in nodes}
+    nx.draw_networkx_nodes(grafo_original, pos, nodelist=nodes, node_size=900, node_color='lightgray')
     # todas as arestas do grafo completo em alpha baixo
-    nx.draw_networkx_edges(Gc, pos, width=0.7, alpha=0.2, edge_color='gray')
+    i, j = np.triu_indices(len(nodes), k=1)
+    plt.gca().add_collection(LineCollection(np.stack([coords[i], coords[j]], axis=1),
+                                            linewidths=0.7, alpha=0.2, colors='gray'))
 
     # destaca arestas do caminho A* (se houver)
     if caminho and len(caminho) >= 2:
-        path_edges = list(zip(caminho, caminho[1:]))
-        nx.draw_networkx_edges(Gc, pos, edgelist=path_edges, width=3.5, edge_color='red')
-    nx.draw_networkx_labels(Gc, pos, labels=labels, font_size=10, font_weight='bold',
+        segmentos = [(pos[a], pos[b]) for a, b in zip(caminho, caminho[1:])]
+        plt.gca().add_collection(LineCollection(segmentos, linewidths=3.5, colors='red'))
+    nx.draw_networkx_labels(grafo_original, pos, labels=labels, font_size=10, font_weight='bold',
                             bbox=dict(facecolor='lightblue', alpha=0.5, edgecolor='none', boxstyle='round,pad=0.2'))
 
     plt.title(f'A* sobre grafo completo — custo = {custo:.2f}')
@@ -247,3 +227,17 @@ if __name__ == '__main__':
         plot_mapa_path(G_game, caminho_encontrado=caminho_gulosa, titulo=titulo, arquivo_saida='mapa_gulosa.png')
     else:
         print("Gulosa - Nenhum caminho encontrado")
+
+    # 4) Referência ótima: Dijkstra sobre o grafo compilado em CSR
+    grafo_csr = compilar_grafo(G_game)
+    caminho_dijkstra, custo_dijkstra = dijkstra_csr(grafo_csr, inicio, destino)
+    print("\n--- Dijkstra (grafo compilado) ---")
+    print("Caminho (dijkstra):", caminho_dijkstra)
+    print(f"Custo total (soma dos weights): {custo_dijkstra:.2f}")
+
+    # 5) Dijkstra bidirecional: fronteiras saindo do início e do destino
+    caminho_bi, custo_bi, tempo_bi, expandidos_bi = busca_bidirecional(grafo_csr, inicio, destino)
+    print("\n--- Dijkstra bidirecional ---")
+    print("Caminho (bidirecional):", caminho_bi)
+    print(f"Custo total (soma dos weights): {custo_bi:.2f}")
+    print(f"Nós expandidos: {expandidos_bi} | Tempo: {tempo_bi:.6f}s")
@@ -1,9 +1,20 @@
 import os
+import sys
+import tempfile
 import time
 import numpy as np
 import matplotlib.pyplot as plt
+import hashlib
 import heapq
-import random
+import json
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
+from scipy import ndimage
+from scipy.sparse import coo_matrix, csgraph
+from renderizador import salvar_grades_lote
 
 # --- Funções do Algoritmo A* (Mantidas) ---
 
@@ -11,20 +22,94 @@ def heuristica(a, b):
     """Heurística de Distância de Manhattan."""
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
-def a_star_grid(grid, start, goal):
+# --- Índice de componentes conectados ---
+
+class ComponentIndex:
+    """
+    Rótulos das regiões livres conectadas de uma grade, guardados junto com ela.
+    A rotulagem é uma única passada vetorizada (scipy.ndimage.label) feita sob
+    demanda; alterar a grade só marca o índice como sujo (O(1)) e a próxima
+    consulta reconstrói. Como o 8-conectado não corta quinas, as regiões são
+    as mesmas para 4 e 8 vizinhos.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.labels = None
+        self.n_components = 0
+        self.version = 0
+
+    def invalidate(self):
+        """Descarta os rótulos; a grade mudou."""
+        self.labels = None
+        self.version += 1
+
+    def rebuild(self):
+        """Rotula as componentes livres da grade atual."""
+        self.labels, self.n_components = ndimage.label(np.asarray(self.grid) == 0)
+        return self.labels
+
+    def set_cell(self, cell, value):
+        """Altera uma célula da grade (0 = livre, 1 = obstáculo) e invalida o índice."""
+        self.grid[cell[0], cell[1]] = value
+        self.invalidate()
+
+    def component(self, cell):
+        """Rótulo da componente da célula (0 para obstáculo)."""
+        if self.labels is None:
+            self.rebuild()
+        return int(self.labels[cell[0], cell[1]])
+
+    def connected(self, start, goal):
+        """
+        True/False quando dá para decidir pelos rótulos; None quando start ou
+        goal estão sobre obstáculos (os motores os tratam como livres).
+        """
+        a, b = self.component(start), self.component(goal)
+        if a == 0 or b == 0:
+            return None
+        return a == b
+
+def a_star_grid(grid, start, goal, engine="auto", connectivity=4, heuristic=None, components=None):
     """
     Implementação do Algoritmo A* com medição de desempenho.
+    engine: "dict" (lista de listas + dicionários), "array" (np.ndarray +
+    arrays planos) ou "auto" (escolhe "array" quando a grade é um np.ndarray).
+    connectivity/heuristic: ver a_star_grid_array (o motor "dict" é só 4-conectado).
+    components: ComponentIndex da grade; se start e goal estão em regiões
+    diferentes, retorna sem buscar (nodes_explored = 0).
+    Nos dois motores nodes_explored conta as células fechadas (expandidas);
+    entradas obsoletas do heap (célula já fechada) são descartadas sem contar.
     Retorna: (path, path_length, time_taken, nodes_explored)
     """
+    if components is not None:
+        start_time = time.time()
+        if components.connected(start, goal) is False:
+            return None, 0, time.time() - start_time, 0
+
+    if engine == "auto":
+        use_array = isinstance(grid, np.ndarray) or connectivity != 4 or heuristic is not None
+        engine = "array" if use_array else "dict"
+    if engine == "array":
+        return a_star_grid_array(grid, start, goal, connectivity, heuristic)
+    if engine != "dict":
+        raise ValueError(f"Engine desconhecida: {engine}")
+    if connectivity != 4 or heuristic not in (None, "manhattan"):
+        raise ValueError("O motor 'dict' suporta apenas 4-conectividade com Manhattan")
+
     start_time = time.time()
     rows, cols = len(grid), len(grid[0])
     open_heap = [(0, start)]
     came_from = {}
     g_score = {start: 0}
+    closed = set()
     nodes_explored = 0
 
     while open_heap:
         f, current = heapq.heappop(open_heap)
+        if current in closed:
+            continue
+        closed.add(current)
         nodes_explored += 1 
         
         if current == goal:
@@ -58,27 +143,1040 @@ def a_star_grid(grid, start, goal):
     time_taken = end_time - start_time
     return None, 0, time_taken, nodes_explored
 
+# --- Modelos de movimento e motor sobre arrays ---
+
+# Custos inteiros (ortogonal, diagonal) de cada heurística. Com custos inteiros
+# a chave do heap continua sendo um único inteiro. "octile" aproxima sqrt(2)
+# com 5 casas decimais; "chebyshev" dá custo 1 também ao passo diagonal.
+CUSTOS_MOVIMENTO = {
+    "manhattan": (1, 2),
+    "octile": (100000, 141421),
+    "chebyshev": (1, 1),
+}
+
+def movement_model(connectivity=4, heuristic=None):
+    """Valida conectividade/heurística e devolve (heurística, custo_orto, custo_diag)."""
+    if connectivity == 4:
+        heuristic = heuristic or "manhattan"
+        if heuristic != "manhattan":
+            raise ValueError("4-conectividade usa somente a heurística de Manhattan")
+    elif connectivity == 8:
+        heuristic = heuristic or "octile"
+        if heuristic not in ("octile", "chebyshev"):
+            raise ValueError("8-conectividade usa a heurística 'octile' ou 'chebyshev'")
+    else:
+        raise ValueError(f"Conectividade inválida: {connectivity} (use 4 ou 8)")
+    orth_cost, diag_cost = CUSTOS_MOVIMENTO[heuristic]
+    return heuristic, orth_cost, diag_cost
+
+def padded_free_mask(grid):
+    """
+    Máscara de células livres (1 byte por célula) com uma borda de
+    obstáculos ao redor, para dispensar testes de limite nos motores.
+    Retorna: (free, width), com índice linear (row+1)*width + (col+1).
+    """
+    grid = np.asarray(grid)
+    rows, cols = grid.shape
+    free_mask = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+    free_mask[1:-1, 1:-1] = grid == 0
+    return bytearray(free_mask.tobytes()), cols + 2
+
+def a_star_grid_array(grid, start, goal, connectivity=4, heuristic=None):
+    """
+    A* direto sobre o np.ndarray, sem converter a grade para lista.
+    Cada célula vira um índice linear row*cols+col sobre a grade com uma
+    borda de obstáculos (dispensa testes de limite); g-score, pai e
+    fechados ficam em arrays planos pré-alocados e o heap guarda chaves
+    inteiras f*N + índice (mesma ordem de desempate que (f, (row, col))).
+    Entradas obsoletas do heap são descartadas sem contar como exploradas.
+    connectivity=8 libera os passos diagonais (sem cortar quinas de
+    obstáculos), com heurística "octile" (diagonal custa sqrt(2)) ou
+    "chebyshev" (diagonal custa 1).
+    heuristic também aceita um DistanceField desta grade e deste objetivo
+    (heurística exata); células que não alcançam o objetivo nem entram no heap.
+    Retorna: (path, path_length, time_taken, nodes_explored)
+    """
+    start_time = time.time()
+    exact_h = None
+    if isinstance(heuristic, DistanceField):
+        if not heuristic.matches(grid, goal) or heuristic.connectivity != connectivity:
+            raise ValueError("DistanceField de outra grade, objetivo ou conectividade")
+        exact_h = heuristic.padded_view
+        heuristic = heuristic.heuristic
+    _, orth_cost, diag_cost = movement_model(connectivity, heuristic)
+    diag_extra = diag_cost - 2 * orth_cost if connectivity == 8 else 0
+
+    free, width = padded_free_mask(grid)
+    n_cells = len(free)
+    g_arr = np.full(n_cells, -1, dtype=np.int64)
+    parent_arr = np.full(n_cells, -1, dtype=np.int64)
+    g_score = memoryview(g_arr)
+    came_from = memoryview(parent_arr)
+    closed = bytearray(n_cells)
+
+    start_idx = (int(start[0]) + 1) * width + int(start[1]) + 1
+    goal_idx = (int(goal[0]) + 1) * width + int(goal[1]) + 1
+    goal_r, goal_c = divmod(goal_idx, width)
+    free[start_idx] = free[goal_idx] = 1
+
+    g_score[start_idx] = 0
+    start_r, start_c = divmod(start_idx, width)
+    dr, dc = abs(start_r - goal_r), abs(start_c - goal_c)
+    h_start = (dr + dc) * orth_cost + diag_extra * min(dr, dc)
+    if exact_h is not None:
+        h_start = max(exact_h[start_idx], 0)
+    open_heap = [h_start * n_cells + start_idx]
+    heappush, heappop = heapq.heappush, heapq.heappop
+    # Mesma ordem de vizinhos do motor original: direita, esquerda, baixo, cima
+    steps = (1, -1, width, -width)
+    # Diagonais: (passo, vizinho vertical, vizinho horizontal) para vetar quinas
+    diagonal_steps = ()
+    if connectivity == 8:
+        diagonal_steps = tuple((dr + dc, dr, dc) for dr in (width, -width) for dc in (1, -1))
+    nodes_explored = 0
+
+    while open_heap:
+        current = heappop(open_heap) % n_cells
+        if closed[current]:
+            continue
+        closed[current] = 1
+        nodes_explored += 1
+
+        if current == goal_idx:
+            path = []
+            while current != start_idx:
+                r, c = divmod(current, width)
+                path.append((r - 1, c - 1))
+                current = came_from[current]
+            path.append(start)
+
+            time_taken = time.time() - start_time
+            path_length = len(path) - 1
+            return path[::-1], path_length, time_taken, nodes_explored
+
+        g_current = g_score[current]
+        tentative_g = g_current + orth_cost
+        for step in steps:
+            neighbor = current + step
+            if not free[neighbor] or closed[neighbor]:
+                continue
+            old_g = g_score[neighbor]
+            if old_g < 0 or tentative_g < old_g:
+                if exact_h is None:
+                    r, c = divmod(neighbor, width)
+                    dr, dc = abs(r - goal_r), abs(c - goal_c)
+                    h = (dr + dc) * orth_cost
+                    if diag_extra:
+                        h += diag_extra * (dr if dr < dc else dc)
+                else:
+                    h = exact_h[neighbor]
+                    if h < 0:
+                        continue
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                heappush(open_heap, (tentative_g + h) * n_cells + neighbor)
+
+        tentative_g = g_current + diag_cost
+        for step, side_r, side_c in diagonal_steps:
+            neighbor = current + step
+            if not free[neighbor] or closed[neighbor]:
+                continue
+            if not (free[current + side_r] and free[current + side_c]):
+                continue
+            old_g = g_score[neighbor]
+            if old_g < 0 or tentative_g < old_g:
+                if exact_h is None:
+                    r, c = divmod(neighbor, width)
+                    dr, dc = abs(r - goal_r), abs(c - goal_c)
+                    h = (dr + dc) * orth_cost + diag_extra * (dr if dr < dc else dc)
+                else:
+                    h = exact_h[neighbor]
+                    if h < 0:
+                        continue
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                heappush(open_heap, (tentative_g + h) * n_cells + neighbor)
+
+    time_taken = time.time() - start_time
+    return None, 0, time_taken, nodes_explored
+
+
+# --- Campos de distância (um objetivo, muitos agentes) ---
+
+def grid_fingerprint(grid):
+    """Hash do conteúdo da grade (forma + máscara de obstáculos); muda quando qualquer célula muda."""
+    blocked = np.asarray(grid) != 0
+    digest = hashlib.blake2b(np.packbits(blocked).tobytes(), digest_size=16)
+    digest.update(repr(blocked.shape).encode())
+    return digest.hexdigest()
+
+class DistanceField:
+    """
+    Custo até o objetivo de todas as células livres de uma grade, no mesmo
+    modelo de movimento de a_star_grid_array (custos inteiros de
+    CUSTOS_MOVIMENTO, sem cortar quinas). Com custos unitários (4-conectado
+    ou "chebyshev") é uma busca em largura a partir do objetivo em que cada
+    onda é um array de índices expandido de uma vez pelo NumPy; "octile"
+    (custos diferentes) usa o Dijkstra do scipy.sparse.csgraph.
+    Depois de montado, o caminho de qualquer início sai descendo o gradiente
+    em O(comprimento do caminho), e o próprio campo serve de heurística
+    exata para a_star_grid (heuristic=campo).
+    """
+
+    def __init__(self, grid, goal, connectivity=4, heuristic=None):
+        self.heuristic, self.orth_cost, self.diag_cost = movement_model(connectivity, heuristic)
+        self.connectivity = connectivity
+        self.goal = (int(goal[0]), int(goal[1]))
+        self.shape = np.asarray(grid).shape
+
+        free_mask, self.width = padded_free_mask(grid)
+        self.goal_idx = (self.goal[0] + 1) * self.width + self.goal[1] + 1
+        free_mask[self.goal_idx] = 1   # como nos motores, o objetivo conta como livre
+        self.free = free = np.frombuffer(free_mask, dtype=np.uint8).astype(bool)
+        self.steps = (1, -1, self.width, -self.width)
+        self.diagonal_steps = ()
+        if connectivity == 8:
+            self.diagonal_steps = tuple((dr + dc, dr, dc) for dr in (self.width, -self.width) for dc in (1, -1))
+
+        start_time = time.time()
+        if self.orth_cost == self.diag_cost or connectivity == 4:
+            self.padded = self._wavefront()
+        else:
+            self.padded = self._dijkstra()
+        self.build_time = time.time() - start_time
+        # custo por célula (-1 = não alcança o objetivo), no formato da grade
+        self.dist = self.padded.reshape(-1, self.width)[1:-1, 1:-1]
+        self.padded_view = memoryview(self.padded)
+        self._free_view = memoryview(free_mask)
+
+    def _wavefront(self):
+        """Busca em largura vetorizada: cada onda é o conjunto de células a um passo da anterior."""
+        free = self.free
+        dist = np.full(free.size, -1, dtype=np.int64)
+        dist[self.goal_idx] = 0
+        frontier = np.array([self.goal_idx], dtype=np.int64)
+        orth = np.array(self.steps, dtype=np.int64)
+        wave = 0
+        while frontier.size:
+            wave += 1
+            candidates = [(frontier[:, None] + orth).ravel()]
+            for step, side_r, side_c in self.diagonal_steps:
+                ok = free[frontier + side_r] & free[frontier + side_c]
+                candidates.append(frontier[ok] + step)
+            candidates = np.concatenate(candidates)
+            candidates = np.unique(candidates[free[candidates] & (dist[candidates] < 0)])
+            dist[candidates] = wave * self.orth_cost
+            frontier = candidates
+        return dist
+
+    def _dijkstra(self):
+        """Dijkstra (scipy) sobre o grafo das células livres com custos ortogonal/diagonal."""
+        free = self.free
+        cells = np.flatnonzero(free)
+        sources, targets, weights = [], [], []
+        for step in (1, self.width):
+            ok = free[cells + step]
+            sources.append(cells[ok])
+            targets.append(cells[ok] + step)
+            weights.append(np.full(ok.sum(), self.orth_cost))
+        for step, side_r, side_c in self.diagonal_steps[:2]:   # as outras duas são as mesmas arestas ao contrário
+            ok = free[cells + step] & free[cells + side_r] & free[cells + side_c]
+            sources.append(cells[ok])
+            targets.append(cells[ok] + step)
+            weights.append(np.full(ok.sum(), self.diag_cost))
+        graph = coo_matrix((np.concatenate(weights).astype(np.float64),
+                            (np.concatenate(sources), np.concatenate(targets))),
+                           shape=(free.size, free.size)).tocsr()
+        costs = csgraph.dijkstra(graph, directed=False, indices=self.goal_idx)
+        dist = np.full(free.size, -1, dtype=np.int64)
+        reachable = np.isfinite(costs)
+        dist[reachable] = np.rint(costs[reachable]).astype(np.int64)
+        return dist
+
+    def cost(self, cell):
+        """Custo ótimo de cell até o objetivo (None se não alcança)."""
+        value = int(self.dist[cell[0], cell[1]])
+        return value if value >= 0 else None
+
+    def _best_step(self, current):
+        """Vizinho que minimiza custo do passo + campo (mesma ordem de vizinhos do A*); -1 se nenhum."""
+        dist, free = self.padded_view, self._free_view
+        best, best_cost = -1, -1
+        for step in self.steps:
+            neighbor = current + step
+            value = dist[neighbor]
+            if value >= 0 and (best < 0 or value + self.orth_cost < best_cost):
+                best, best_cost = neighbor, value + self.orth_cost
+        for step, side_r, side_c in self.diagonal_steps:
+            neighbor = current + step
+            value = dist[neighbor]
+            if value >= 0 and free[current + side_r] and free[current + side_c] \
+                    and (best < 0 or value + self.diag_cost < best_cost):
+                best, best_cost = neighbor, value + self.diag_cost
+        return best
+
+    def path(self, start):
+        """
+        Caminho ótimo de start até o objetivo descendo o gradiente do campo.
+        Retorna: (path, path_length, time_taken, nodes_explored), com
+        nodes_explored = células visitadas na descida.
+        """
+        start_time = time.time()
+        width = self.width
+        current = (int(start[0]) + 1) * width + int(start[1]) + 1
+        if self.padded[current] < 0:
+            # início sobre obstáculo (os motores o tratam como livre): o primeiro passo decide
+            current = self._best_step(current) if not self.free[current] else -1
+            if current < 0:
+                return None, 0, time.time() - start_time, 0
+            path = [tuple(start)]
+        else:
+            path = []
+        while True:
+            r, c = divmod(current, width)
+            path.append((r - 1, c - 1))
+            if current == self.goal_idx:
+                break
+            current = self._best_step(current)
+        path[0] = tuple(start)
+        return path, len(path) - 1, time.time() - start_time, len(path)
+
+    def matches(self, grid, goal):
+        """True se o campo foi montado para esta forma de grade e este objetivo."""
+        return np.asarray(grid).shape == self.shape and (int(goal[0]), int(goal[1])) == self.goal
+
+class DistanceFieldCache:
+    """
+    Campos de distância em LRU, por (impressão digital da grade, objetivo,
+    conectividade, heurística). A chave usa o conteúdo da grade, então uma
+    grade alterada nunca reaproveita um campo antigo. Para muitas consultas
+    seguidas sobre a mesma grade, passe fingerprint (grid_fingerprint calculado
+    uma vez) e evite refazer o hash a cada chamada.
+    """
+
+    def __init__(self, max_fields=16):
+        self.max_fields = max_fields
+        self.fields = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, grid, goal, connectivity=4, heuristic=None, fingerprint=None):
+        heuristic = movement_model(connectivity, heuristic)[0]
+        if fingerprint is None:
+            fingerprint = grid_fingerprint(grid)
+        key = (fingerprint, int(goal[0]), int(goal[1]), connectivity, heuristic)
+        field = self.fields.get(key)
+        if field is not None:
+            self.fields.move_to_end(key)
+            self.hits += 1
+            return field
+        self.misses += 1
+        field = self.fields[key] = DistanceField(grid, goal, connectivity, heuristic)
+        if len(self.fields) > self.max_fields:
+            self.fields.popitem(last=False)
+        return field
+
+    def clear(self):
+        self.fields.clear()
+
+# Cache padrão do distance_field_grid (um por processo)
+FIELD_CACHE = DistanceFieldCache()
+
+def distance_field_grid(grid, start, goal, connectivity=4, heuristic=None, cache=FIELD_CACHE, fingerprint=None):
+    """
+    Solver com a mesma assinatura de a_star_grid: busca (ou monta) o campo do
+    objetivo no cache e desce o gradiente a partir de start. O tempo inclui a
+    montagem do campo quando ela acontece.
+    Retorna: (path, path_length, time_taken, nodes_explored)
+    """
+    start_time = time.time()
+    field = cache.get(grid, goal, connectivity, heuristic, fingerprint)
+    path, path_length, _, nodes_explored = field.path(start)
+    return path, path_length, time.time() - start_time, nodes_explored
+
+
+# --- Cache de resultados de caminho ---
+
+class PathCache:
+    """
+    Cache LRU na frente de um solver de grade (mesma assinatura de a_star_grid).
+    A chave é (impressão digital da grade, start, goal): grid_fingerprint do
+    conteúdo ou, com components, o contador de versão do ComponentIndex
+    (O(1), vale enquanto a grade só muda por set_cell). Quando a mesma grade
+    (ou o mesmo ComponentIndex) chega com outra impressão digital, as entradas
+    antigas dela são descartadas.
+    Como todo trecho final de um caminho ótimo também é ótimo, uma consulta
+    (c, goal) com c sobre um caminho guardado para goal é respondida pelo
+    sufixo, sem busca (desligue reuse_suffixes para solvers não ótimos, como o HPA*).
+    A memória é limitada por max_entries e por max_cells (células guardadas).
+    """
+
+    def __init__(self, solver=a_star_grid, max_entries=4096, max_cells=10**6, reuse_suffixes=True):
+        self.solver = solver
+        self.max_entries = max_entries
+        self.max_cells = max_cells
+        self.reuse_suffixes = reuse_suffixes
+        self.entries = OrderedDict()   # (impressão, start, goal) -> (caminho, comprimento, indexado)
+        self.suffixes = {}             # (impressão, goal) -> {célula: (chave da entrada, posição)}
+        self.grid_versions = {}        # id da grade/ComponentIndex -> última impressão vista
+        self.n_cells = 0
+        self.hits = 0
+        self.suffix_hits = 0
+        self.misses = 0
+
+    def fingerprint(self, grid, components=None):
+        """Impressão digital atual da grade; descarta as entradas de uma versão anterior dela."""
+        if components is not None:
+            owner = id(components)
+            fingerprint = ("version", owner, components.version)
+        else:
+            owner = id(grid)
+            fingerprint = grid_fingerprint(grid)
+        previous = self.grid_versions.get(owner)
+        if previous is not None and previous != fingerprint:
+            self.invalidate(previous)
+        self.grid_versions[owner] = fingerprint
+        return fingerprint
+
+    def solve(self, grid, start, goal, components=None, fingerprint=None):
+        """
+        Resposta do cache (exata ou por sufixo) ou do solver.
+        Retorna: (path, path_length, time_taken, nodes_explored), com
+        nodes_explored = 0 quando não houve busca.
+        """
+        start_time = time.time()
+        start, goal = (int(start[0]), int(start[1])), (int(goal[0]), int(goal[1]))
+        if fingerprint is None:
+            fingerprint = self.fingerprint(grid, components)
+        key = (fingerprint, start, goal)
+
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            path = list(entry[0]) if entry[0] is not None else None
+            return path, entry[1], time.time() - start_time, 0
+
+        if self.reuse_suffixes:
+            found = self.suffixes.get((fingerprint, goal), {}).get(start)
+            if found is not None:
+                source, position = found
+                self.entries.move_to_end(source)
+                self.suffix_hits += 1
+                path = list(self.entries[source][0][position:])
+                return path, len(path) - 1, time.time() - start_time, 0
+
+        self.misses += 1
+        path, path_length, _, nodes_explored = self.solver(grid, start, goal)
+        # início sobre obstáculo entra como livre só nessa busca: não indexa os sufixos
+        indexed = self.reuse_suffixes and path is not None and len(path) > 1 and grid[start[0]][start[1]] == 0
+        self._store(key, path, path_length, indexed)
+        return path, path_length, time.time() - start_time, nodes_explored
+
+    __call__ = solve
+
+    def _store(self, key, path, path_length, indexed):
+        path = tuple(path) if path is not None else None
+        self.entries[key] = (path, path_length, indexed)
+        self.n_cells += len(path) if path else 1
+        if indexed:
+            index = self.suffixes.setdefault((key[0], key[2]), {})
+            for position, cell in enumerate(path[:-1]):
+                index[cell] = (key, position)
+        while self.entries and (len(self.entries) > self.max_entries or self.n_cells > self.max_cells):
+            self._drop(next(iter(self.entries)))
+
+    def _drop(self, key):
+        path, _, indexed = self.entries.pop(key)
+        self.n_cells -= len(path) if path else 1
+        index_key = (key[0], key[2])
+        index = self.suffixes.get(index_key) if indexed else None
+        if index is not None:
+            # células sobrescritas por entradas mais novas continuam apontando para elas
+            for cell in path[:-1]:
+                if index.get(cell, (None,))[0] == key:
+                    del index[cell]
+            if not index:
+                del self.suffixes[index_key]
+
+    def invalidate(self, fingerprint=None):
+        """Descarta as entradas de uma impressão digital (ou todas, sem argumento)."""
+        if fingerprint is None:
+            self.entries.clear()
+            self.suffixes.clear()
+            self.grid_versions.clear()
+            self.n_cells = 0
+            return
+        for key in [key for key in self.entries if key[0] == fingerprint]:
+            self._drop(key)
+
+    def stats(self):
+        queries = self.hits + self.suffix_hits + self.misses
+        return {
+            "Acertos": self.hits,
+            "Acertos por Sufixo": self.suffix_hits,
+            "Falhas": self.misses,
+            "Taxa de Acerto": (self.hits + self.suffix_hits) / queries if queries else 0.0,
+            "Entradas": len(self.entries),
+            "Células": self.n_cells,
+        }
+
+
+# --- Jump Point Search (8-conectado, custos octile) ---
+
+def _jps_jump_straight(free, idx, step, side, goal_idx):
+    """
+    Avança em linha reta a partir de idx. Para no objetivo ou num ponto com
+    vizinho forçado (célula lateral livre cuja anterior está bloqueada).
+    Retorna o índice do ponto de salto ou -1.
+    """
+    while True:
+        idx += step
+        if not free[idx]:
+            return -1
+        if idx == goal_idx:
+            return idx
+        if ((free[idx + side] and not free[idx - step + side])
+                or (free[idx - side] and not free[idx - step - side])):
+            return idx
+
+def _jps_jump_diagonal(free, idx, step_r, step_c, goal_idx):
+    """
+    Avança na diagonal (sem cortar quinas). Para no objetivo ou quando um
+    salto reto na horizontal ou na vertical encontra um ponto de salto.
+    """
+    width = abs(step_r)
+    while True:
+        if not (free[idx + step_r] and free[idx + step_c]):
+            return -1
+        idx += step_r + step_c
+        if not free[idx]:
+            return -1
+        if idx == goal_idx:
+            return idx
+        if (_jps_jump_straight(free, idx, step_c, width, goal_idx) >= 0
+                or _jps_jump_straight(free, idx, step_r, 1, goal_idx) >= 0):
+            return idx
+
+def _jps_directions(free, idx, parent_idx, width):
+    """
+    Direções podadas a partir de idx: naturais + forçadas, dadas pela
+    direção de chegada. Cada direção é (passo_linha, passo_coluna).
+    """
+    if parent_idx < 0:
+        return [(dr, dc) for dr in (-width, 0, width) for dc in (-1, 0, 1) if dr or dc]
+    r, c = divmod(idx, width)
+    pr, pc = divmod(parent_idx, width)
+    dr = width if r > pr else (-width if r < pr else 0)
+    dc = 1 if c > pc else (-1 if c < pc else 0)
+    if dr and dc:
+        return [(0, dc), (dr, 0), (dr, dc)]
+    directions = [(dr, dc)]
+    step = dr or dc
+    side = 1 if dr else width
+    for s in (side, -side):
+        if free[idx + s] and not free[idx - step + s]:
+            perpendicular = (0, s) if dr else (s, 0)
+            directions.append(perpendicular)
+            directions.append((dr or s, dc or s))
+    return directions
+
+def jps_grid(grid, start, goal, components=None):
+    """
+    Jump Point Search sobre o np.ndarray (8-conectado, sem cortar quinas,
+    custos octile). Poda expansões simétricas: só os pontos de salto entram
+    no heap. nodes_explored conta os pontos de salto expandidos e o caminho
+    devolvido é expandido célula a célula.
+    components: ComponentIndex opcional, como em a_star_grid.
+    Retorna: (path, path_length, time_taken, nodes_explored)
+    """
+    start_time = time.time()
+    if components is not None and components.connected(start, goal) is False:
+        return None, 0, time.time() - start_time, 0
+    _, orth_cost, diag_cost = movement_model(8, "octile")
+    diag_extra = diag_cost - 2 * orth_cost
+
+    free, width = padded_free_mask(grid)
+    n_cells = len(free)
+    g_arr = np.full(n_cells, -1, dtype=np.int64)
+    parent_arr = np.full(n_cells, -1, dtype=np.int64)
+    g_score = memoryview(g_arr)
+    came_from = memoryview(parent_arr)
+    closed = bytearray(n_cells)
+
+    start_idx = (int(start[0]) + 1) * width + int(start[1]) + 1
+    goal_idx = (int(goal[0]) + 1) * width + int(goal[1]) + 1
+    goal_r, goal_c = divmod(goal_idx, width)
+    free[start_idx] = free[goal_idx] = 1
+
+    g_score[start_idx] = 0
+    open_heap = [start_idx]
+    heappush, heappop = heapq.heappush, heapq.heappop
+    nodes_explored = 0
+
+    while open_heap:
+        current = heappop(open_heap) % n_cells
+        if closed[current]:
+            continue
+        closed[current] = 1
+        nodes_explored += 1
+
+        if current == goal_idx:
+            jump_points = []
+            while current != start_idx:
+                jump_points.append(current)
+                current = came_from[current]
+            jump_points.append(start_idx)
+            jump_points.reverse()
+
+            # Expande os segmentos retos/diagonais entre pontos de salto
+            path = [start]
+            for a, b in zip(jump_points, jump_points[1:]):
+                ar, ac = divmod(a, width)
+                br, bc = divmod(b, width)
+                sr = (br > ar) - (br < ar)
+                sc = (bc > ac) - (bc < ac)
+                while (ar, ac) != (br, bc):
+                    ar, ac = ar + sr, ac + sc
+                    path.append((ar - 1, ac - 1))
+
+            time_taken = time.time() - start_time
+            return path, len(path) - 1, time_taken, nodes_explored
+
+        cur_r, cur_c = divmod(current, width)
+        g_current = g_score[current]
+        for dr, dc in _jps_directions(free, current, came_from[current], width):
+            if dr and dc:
+                jump = _jps_jump_diagonal(free, current, dr, dc, goal_idx)
+            else:
+                jump = _jps_jump_straight(free, current, dr or dc, 1 if dr else width, goal_idx)
+            if jump < 0 or closed[jump]:
+                continue
+            r, c = divmod(jump, width)
+            dist_r, dist_c = abs(r - cur_r), abs(c - cur_c)
+            tentative_g = g_current + (dist_r + dist_c) * orth_cost + diag_extra * min(dist_r, dist_c)
+            old_g = g_score[jump]
+            if old_g < 0 or tentative_g < old_g:
+                came_from[jump] = current
+                g_score[jump] = tentative_g
+                hr, hc = abs(r - goal_r), abs(c - goal_c)
+                h = (hr + hc) * orth_cost + diag_extra * min(hr, hc)
+                heappush(open_heap, (tentative_g + h) * n_cells + jump)
+
+    time_taken = time.time() - start_time
+    return None, 0, time_taken, nodes_explored
+
+
+# --- Replanejamento incremental (D* Lite) ---
+
+class DStarLitePlanner:
+    """
+    Planejador D* Lite com estado, sobre a mesma grade (máscara com borda e
+    índices lineares) e os mesmos modelos de movimento de a_star_grid_array.
+    A busca vai do objetivo para o início; set_obstacle/clear_obstacle só
+    reabrem os vértices vizinhos da célula alterada e plan() repara a
+    solução anterior em vez de descartar g/rhs. A grade recebida é mantida
+    em sincronia com as alterações.
+    """
+
+    def __init__(self, grid, start, goal, connectivity=4, heuristic=None):
+        self.grid = grid
+        self.connectivity = connectivity
+        _, self.orth_cost, self.diag_cost = movement_model(connectivity, heuristic)
+        self.diag_extra = self.diag_cost - 2 * self.orth_cost if connectivity == 8 else 0
+
+        self.free, self.width = padded_free_mask(grid)
+        n_cells = len(self.free)
+        self.g = memoryview(np.full(n_cells, np.inf))
+        self.rhs = memoryview(np.full(n_cells, np.inf))
+
+        self.start_idx = self._index(start)
+        self.goal_idx = self._index(goal)
+        self.last_start_idx = self.start_idx
+        self.free[self.start_idx] = self.free[self.goal_idx] = 1
+        self.km = 0
+
+        w = self.width
+        self.orth_steps = (1, -1, w, -w)
+        self.diag_steps = ()
+        if connectivity == 8:
+            self.diag_steps = tuple((dr + dc, dr, dc) for dr in (w, -w) for dc in (1, -1))
+
+        # Fila de prioridade com remoção preguiçosa: open_keys guarda a chave válida
+        self.open_heap = []
+        self.open_keys = {}
+        self.rhs[self.goal_idx] = 0
+        self._update_vertex(self.goal_idx)
+
+    def _index(self, cell):
+        return (int(cell[0]) + 1) * self.width + int(cell[1]) + 1
+
+    def _h(self, a, b):
+        ar, ac = divmod(a, self.width)
+        br, bc = divmod(b, self.width)
+        dr, dc = abs(ar - br), abs(ac - bc)
+        return (dr + dc) * self.orth_cost + self.diag_extra * min(dr, dc)
+
+    def _key(self, u):
+        m = min(self.g[u], self.rhs[u])
+        return (m + self._h(self.start_idx, u) + self.km, m)
+
+    def _neighbors(self, u):
+        """Vizinhos transitáveis de u com o custo da aresta (grafo simétrico)."""
+        free = self.free
+        if not free[u]:
+            return []
+        result = [(u + step, self.orth_cost) for step in self.orth_steps if free[u + step]]
+        for step, side_r, side_c in self.diag_steps:
+            if free[u + step] and free[u + side_r] and free[u + side_c]:
+                result.append((u + step, self.diag_cost))
+        return result
+
+    def _best_rhs(self, u):
+        g = self.g
+        return min((cost + g[v] for v, cost in self._neighbors(u)), default=np.inf)
+
+    def _update_vertex(self, u):
+        if self.g[u] != self.rhs[u]:
+            key = self._key(u)
+            self.open_keys[u] = key
+            heapq.heappush(self.open_heap, (key[0], key[1], u))
+        else:
+            self.open_keys.pop(u, None)
+
+    def _top(self):
+        heap = self.open_heap
+        while heap:
+            k1, k2, u = heap[0]
+            if self.open_keys.get(u) == (k1, k2):
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def _compute_shortest_path(self):
+        g, rhs = self.g, self.rhs
+        start, goal = self.start_idx, self.goal_idx
+        nodes_explored = 0
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            k_old = (top[0], top[1])
+            if not (k_old < self._key(start) or rhs[start] > g[start]):
+                break
+            u = top[2]
+            k_new = self._key(u)
+            if k_old < k_new:
+                self.open_keys[u] = k_new
+                heapq.heappush(self.open_heap, (k_new[0], k_new[1], u))
+                continue
+            heapq.heappop(self.open_heap)
+            del self.open_keys[u]
+            nodes_explored += 1
+
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]
+                for v, cost in self._neighbors(u):
+                    if v != goal and cost + g[u] < rhs[v]:
+                        rhs[v] = cost + g[u]
+                    self._update_vertex(v)
+            else:
+                g_old = g[u]
+                g[u] = np.inf
+                for v, cost in self._neighbors(u) + [(u, 0)]:
+                    if v != goal and rhs[v] == cost + g_old:
+                        rhs[v] = self._best_rhs(v)
+                    self._update_vertex(v)
+        return nodes_explored
+
+    def _set_cell(self, cell, blocked):
+        u = self._index(cell)
+        if bool(self.free[u]) != blocked:
+            return
+        # Ajuste de km do D* Lite: o início pode ter andado desde a última mudança
+        if self.start_idx != self.last_start_idx:
+            self.km += self._h(self.last_start_idx, self.start_idx)
+            self.last_start_idx = self.start_idx
+        self.free[u] = 0 if blocked else 1
+        self.grid[cell[0], cell[1]] = 1 if blocked else 0
+
+        # Só mudam as arestas que tocam u e as diagonais que passam pela quina de u
+        w = self.width
+        for v in (u, u + 1, u - 1, u + w, u - w, u + w + 1, u + w - 1, u - w + 1, u - w - 1):
+            if v != self.goal_idx:
+                self.rhs[v] = self._best_rhs(v)
+            self._update_vertex(v)
+
+    def set_obstacle(self, cell):
+        """Marca a célula como obstáculo."""
+        self._set_cell(cell, True)
+
+    def clear_obstacle(self, cell):
+        """Libera a célula."""
+        self._set_cell(cell, False)
+
+    def move_start(self, cell):
+        """Atualiza a posição do agente (o início da busca)."""
+        self.start_idx = self._index(cell)
+
+    def plan(self):
+        """
+        Repara a solução com as mudanças acumuladas desde a última chamada.
+        Retorna: (path, path_length, time_taken, nodes_explored)
+        """
+        start_time = time.time()
+        nodes_explored = self._compute_shortest_path()
+        g, width = self.g, self.width
+
+        # Com a condição de parada do D* Lite, rhs(início) já é o custo ótimo
+        current = self.start_idx
+        if self.rhs[current] == np.inf:
+            return None, 0, time.time() - start_time, nodes_explored
+        path = []
+        while True:
+            r, c = divmod(current, width)
+            path.append((r - 1, c - 1))
+            if current == self.goal_idx:
+                break
+            current = min(self._neighbors(current), key=lambda item: item[1] + g[item[0]])[0]
+
+        time_taken = time.time() - start_time
+        return path, len(path) - 1, time_taken, nodes_explored
+
+
+# --- Busca hierárquica (HPA*) ---
+
+def _cluster_graph(free_block):
+    """Grafo esparso 4-conectado (custo 1) das células livres de um bloco."""
+    h, w = free_block.shape
+    ids = np.arange(h * w).reshape(h, w)
+    horiz = free_block[:, :-1] & free_block[:, 1:]
+    vert = free_block[:-1, :] & free_block[1:, :]
+    src = np.concatenate([ids[:, :-1][horiz], ids[:-1, :][vert]])
+    dst = np.concatenate([ids[:, 1:][horiz], ids[1:, :][vert]])
+    return coo_matrix((np.ones(src.size), (src, dst)), shape=(h * w, h * w)).tocsr()
+
+class HPAStar:
+    """
+    Abstração hierárquica (HPA*) de uma grade 4-conectada. A grade é dividida
+    em clusters cluster_size x cluster_size; as entradas entre clusters
+    vizinhos viram nós abstratos e as distâncias entre entradas de um mesmo
+    cluster são pré-calculadas uma única vez. A consulta liga start/goal às
+    entradas do próprio cluster, busca no grafo abstrato e refina cada trecho
+    com A* local. O caminho é quase ótimo (não necessariamente ótimo).
+    A abstração é gravada em .npz (save/load) para ser montada offline.
+    """
+
+    def __init__(self, free, cluster_size, node_cells, indptr, indices, costs):
+        self.free = free
+        self.cluster_size = cluster_size
+        self.node_cells = node_cells
+        self.indptr = indptr
+        self.indices = indices
+        self.costs = costs
+        self._index_clusters()
+
+    def _index_clusters(self):
+        c = self.cluster_size
+        self.node_of_cell = {(int(r), int(col)): i for i, (r, col) in enumerate(self.node_cells)}
+        self.cluster_nodes = {}
+        for i, (r, col) in enumerate(self.node_cells):
+            self.cluster_nodes.setdefault((int(r) // c, int(col) // c), []).append(i)
+
+    @classmethod
+    def build(cls, grid, cluster_size=32):
+        """Monta a abstração: entradas, arestas entre clusters e distâncias internas."""
+        free = np.asarray(grid) == 0
+        rows, cols = free.shape
+        c = cluster_size
+        cells = {}
+        edges = []
+
+        def node(cell):
+            return cells.setdefault(cell, len(cells))
+
+        def add_entrances(run_mask, make_pair):
+            # Trechos contíguos livres dos dois lados: 1 transição no meio (<6) ou 2 nas pontas
+            padded = np.concatenate(([0], run_mask.astype(np.int8), [0]))
+            bounds = np.flatnonzero(np.diff(padded))
+            for a, b in zip(bounds[::2], bounds[1::2] - 1):
+                offsets = [(a + b) // 2] if b - a + 1 < 6 else [a, b]
+                for k in offsets:
+                    u, v = make_pair(int(k))
+                    edges.append((node(u), node(v), 1))
+
+        for border in range(c, cols, c):
+            for r0 in range(0, rows, c):
+                r1 = min(r0 + c, rows)
+                mask = free[r0:r1, border - 1] & free[r0:r1, border]
+                add_entrances(mask, lambda k: ((r0 + k, border - 1), (r0 + k, border)))
+        for border in range(c, rows, c):
+            for c0 in range(0, cols, c):
+                c1 = min(c0 + c, cols)
+                mask = free[border - 1, c0:c1] & free[border, c0:c1]
+                add_entrances(mask, lambda k: ((border - 1, c0 + k), (border, c0 + k)))
+
+        node_cells = np.array(list(cells), dtype=np.int32).reshape(-1, 2)
+        by_cluster = {}
+        for i, (r, col) in enumerate(node_cells):
+            by_cluster.setdefault((int(r) // c, int(col) // c), []).append(i)
+
+        # Distâncias internas: uma BFS (csgraph) por cluster, a partir de todas as entradas
+        for (cr, cc), nodes in by_cluster.items():
+            r0, c0 = cr * c, cc * c
+            block = free[r0:r0 + c, c0:c0 + c]
+            local = [(node_cells[i, 0] - r0) * block.shape[1] + node_cells[i, 1] - c0 for i in nodes]
+            dist = csgraph.shortest_path(_cluster_graph(block), directed=False,
+                                         unweighted=True, indices=local)
+            for a in range(len(nodes)):
+                for b in range(a + 1, len(nodes)):
+                    d = dist[a, local[b]]
+                    if np.isfinite(d):
+                        edges.append((nodes[a], nodes[b], int(d)))
+
+        edges = np.array(edges, dtype=np.int64).reshape(-1, 3)
+        # Lista de adjacência em CSR (arestas nos dois sentidos)
+        src = np.concatenate([edges[:, 0], edges[:, 1]])
+        dst = np.concatenate([edges[:, 1], edges[:, 0]])
+        cost = np.concatenate([edges[:, 2], edges[:, 2]])
+        order = np.argsort(src, kind="stable")
+        indptr = np.zeros(len(node_cells) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=len(node_cells)), out=indptr[1:])
+        return cls(free, c, node_cells, indptr, dst[order].astype(np.int32), cost[order].astype(np.int32))
+
+    def save(self, path):
+        """Grava a abstração (e a máscara da grade) num .npz comprimido."""
+        np.savez_compressed(path, free_bits=np.packbits(self.free), shape=self.free.shape,
+                            cluster_size=self.cluster_size, node_cells=self.node_cells,
+                            indptr=self.indptr, indices=self.indices, costs=self.costs)
+
+    @classmethod
+    def load(cls, path):
+        """Carrega uma abstração gravada por save()."""
+        data = np.load(path)
+        shape = tuple(data["shape"])
+        free = np.unpackbits(data["free_bits"], count=shape[0] * shape[1]).reshape(shape).astype(bool)
+        return cls(free, int(data["cluster_size"]), data["node_cells"],
+                   data["indptr"], data["indices"], data["costs"])
+
+    def _cluster_bounds(self, cell):
+        c = self.cluster_size
+        r0, c0 = (cell[0] // c) * c, (cell[1] // c) * c
+        return r0, c0, self.free[r0:r0 + c, c0:c0 + c]
+
+    def _connect(self, cell):
+        """Distâncias de `cell` até as entradas do seu cluster (busca local)."""
+        c = self.cluster_size
+        r0, c0, block = self._cluster_bounds(cell)
+        block = block.copy()
+        block[cell[0] - r0, cell[1] - c0] = True
+        dist = csgraph.shortest_path(_cluster_graph(block), directed=False, unweighted=True,
+                                     indices=(cell[0] - r0) * block.shape[1] + cell[1] - c0)
+        links = {}
+        for i in self.cluster_nodes.get((cell[0] // c, cell[1] // c), []):
+            r, col = self.node_cells[i]
+            d = dist[(r - r0) * block.shape[1] + col - c0]
+            if np.isfinite(d):
+                links[i] = int(d)
+        return links, dist, block.shape[1]
+
+    def _refine(self, a, b):
+        """Trecho célula a célula entre dois pontos do mesmo cluster (ou vizinhos)."""
+        if abs(a[0] - b[0]) + abs(a[1] - b[1]) <= 1:
+            return [a, b] if a != b else [a], 0
+        r0, c0, block = self._cluster_bounds(a)
+        local, _, _, explored = a_star_grid_array(~block, (a[0] - r0, a[1] - c0), (b[0] - r0, b[1] - c0))
+        return [(r + r0, col + c0) for r, col in local], explored
+
+    def search(self, start, goal):
+        """
+        Consulta start -> goal no grafo abstrato seguida de refinamento local.
+        Retorna: (path, path_length, time_taken, nodes_explored)
+        """
+        start_time = time.time()
+        start = (int(start[0]), int(start[1]))
+        goal = (int(goal[0]), int(goal[1]))
+        c = self.cluster_size
+        start_links, start_dist, block_w = self._connect(start)
+        goal_links = self._connect(goal)[0]
+
+        # Nós temporários: -1 = start, -2 = goal
+        START, GOAL = -1, -2
+        g_score = {START: 0}
+        came_from = {}
+        if (start[0] // c, start[1] // c) == (goal[0] // c, goal[1] // c):
+            r0, c0 = (start[0] // c) * c, (start[1] // c) * c
+            d = start_dist[(goal[0] - r0) * block_w + goal[1] - c0]
+            if np.isfinite(d):
+                g_score[GOAL] = int(d)
+                came_from[GOAL] = START
+
+        def h(i):
+            r, col = (goal if i == GOAL else start if i == START else self.node_cells[i])
+            return abs(int(r) - goal[0]) + abs(int(col) - goal[1])
+
+        open_heap = [(h(START), START)]
+        if GOAL in g_score:
+            heapq.heappush(open_heap, (g_score[GOAL], GOAL))
+        closed = set()
+        nodes_explored = 0
+        while open_heap:
+            _, u = heapq.heappop(open_heap)
+            if u in closed:
+                continue
+            closed.add(u)
+            nodes_explored += 1
+            if u == GOAL:
+                break
+            if u == START:
+                neighbors = list(start_links.items())
+            else:
+                lo, hi = self.indptr[u], self.indptr[u + 1]
+                neighbors = list(zip(self.indices[lo:hi].tolist(), self.costs[lo:hi].tolist()))
+                if u in goal_links:
+                    neighbors.append((GOAL, goal_links[u]))
+            for v, cost in neighbors:
+                tentative_g = g_score[u] + cost
+                if tentative_g < g_score.get(v, float('inf')):
+                    g_score[v] = tentative_g
+                    came_from[v] = u
+                    heapq.heappush(open_heap, (tentative_g + h(v), v))
+
+        if GOAL not in closed:
+            return None, 0, time.time() - start_time, nodes_explored
+
+        abstract = [GOAL]
+        while abstract[-1] != START:
+            abstract.append(came_from[abstract[-1]])
+        abstract.reverse()
+        cells = [start if i == START else goal if i == GOAL else tuple(int(x) for x in self.node_cells[i])
+                 for i in abstract]
+
+        path = [start]
+        for a, b in zip(cells, cells[1:]):
+            segment, explored = self._refine(a, b)
+            nodes_explored += explored
+            path.extend(segment[1:])
+        return path, len(path) - 1, time.time() - start_time, nodes_explored
+
 
 # --- Funções de Criação de Cenários ---
 
 def create_scenario_random(size, obs_density, seed, name):
-    """Cria um cenário aleatório (mantido do código original)."""
-    np.random.seed(seed)
+    """
+    Cria um cenário aleatório. Tudo sai de um np.random.Generator com a
+    semente dada (grade e início/fim), então o mesmo seed gera o mesmo cenário.
+    """
+    rng = np.random.default_rng(seed)
     grid = np.zeros((size, size))
-    grid[np.random.rand(size, size) < obs_density] = 1 
-
-    free_cells = list(zip(*np.where(grid == 0)))
-    if len(free_cells) < 2:
-         return None, name, "Células insuficientes"
-         
-    start = random.choice(free_cells)
-    goal = random.choice(free_cells)
-    while goal == start:
-        goal = random.choice(free_cells)
-        
-    grid[start] = 0
-    grid[goal] = 0
-    return grid, start, goal, name
+    grid[rng.random((size, size)) < obs_density] = 1
+
+    queries = sample_queries(grid, 1, rng)
+    if len(queries) == 0:
+        return None, None, None, name
+
+    r0, c0, r1, c1 = queries[0].tolist()
+    return grid, (r0, c0), (r1, c1), name
 
 def create_scenario_dense_labyrinth(size, name):
     """Cenário 1: O Labirinto Densa (30% obstáculos)."""
@@ -140,17 +1238,99 @@ def create_scenario_unreachable(size, name):
     goal = (size//4, size//2 + 1)
     return grid, start, goal, name
 
+# --- Gerador determinístico e corpus de cenários em disco ---
+
+def sample_queries(grid, n_queries, rng):
+    """
+    Sorteia n_queries pares (início, fim) distintos entre as células livres,
+    por índice sobre np.flatnonzero (sem lista de tuplas). Retorna um array
+    (n_queries, 4) com r0, c0, r1, c1; vazio se houver menos de 2 células livres.
+    """
+    grid = np.asarray(grid)
+    free_cells = np.flatnonzero(grid.ravel() == 0)
+    if free_cells.size < 2:
+        return np.empty((0, 4), dtype=np.int32)
+    starts = rng.integers(0, free_cells.size, n_queries)
+    # deslocamento em [1, n) garante fim != início sem rejeição
+    goals = (starts + rng.integers(1, free_cells.size, n_queries)) % free_cells.size
+    cols = grid.shape[1]
+    queries = np.empty((n_queries, 4), dtype=np.int32)
+    queries[:, 0], queries[:, 1] = np.divmod(free_cells[starts], cols)
+    queries[:, 2], queries[:, 3] = np.divmod(free_cells[goals], cols)
+    return queries
+
+def queries_to_pairs(queries):
+    """Array (n, 4) de sample_queries -> lista de ((r0, c0), (r1, c1)) para os solvers/run_batch_queries."""
+    return [((r0, c0), (r1, c1)) for r0, c0, r1, c1 in np.asarray(queries).tolist()]
+
+def write_scenario_corpus(directory, sizes, densities, n_queries=1000, seed=0, compress=False):
+    """
+    Gera uma grade aleatória (uint8) e n_queries consultas para cada
+    (tamanho, densidade) e grava em `directory`:
+      - compress=False: <nome>.grid.npy e <nome>.queries.npy, que podem ser
+        abertos com mmap (e o .npy da grade vai direto para run_batch_queries);
+      - compress=True: um único corpus.npz comprimido.
+    Cada cenário usa um gerador filho do SeedSequence(seed), então o conteúdo
+    não depende da ordem nem de quais cenários foram pedidos junto.
+    Um index.json descreve os cenários. Retorna a lista do índice.
+    """
+    os.makedirs(directory, exist_ok=True)
+    entries = []
+    arrays = {}
+    for size in sizes:
+        for density in densities:
+            name = f"random_{size}_{round(density * 100):02d}"
+            rng = np.random.default_rng(np.random.SeedSequence([seed, size, round(density * 10**6)]))
+            grid = (rng.random((size, size)) < density).astype(np.uint8)
+            queries = sample_queries(grid, n_queries, rng)
+            entries.append({"nome": name, "tamanho": size, "densidade": density, "n_consultas": len(queries)})
+            if compress:
+                arrays[f"{name}.grid"] = grid
+                arrays[f"{name}.queries"] = queries
+            else:
+                np.save(os.path.join(directory, f"{name}.grid.npy"), grid)
+                np.save(os.path.join(directory, f"{name}.queries.npy"), queries)
+    if compress:
+        np.savez_compressed(os.path.join(directory, "corpus.npz"), **arrays)
+    with open(os.path.join(directory, "index.json"), "w", encoding="utf-8") as f:
+        json.dump({"formato": "npz" if compress else "npy", "seed": seed, "cenarios": entries}, f, indent=2)
+    return entries
+
+def load_scenario_corpus(directory):
+    """
+    Percorre um corpus gravado por write_scenario_corpus, um cenário por vez:
+    gera (entrada do índice, grade, consultas). No formato npy os arrays são
+    mapeados (mmap_mode="r") e a entrada traz "grid_path"; no npz cada
+    cenário só é descomprimido quando chega a vez dele.
+    """
+    with open(os.path.join(directory, "index.json"), encoding="utf-8") as f:
+        index = json.load(f)
+    if index["formato"] == "npz":
+        with np.load(os.path.join(directory, "corpus.npz")) as corpus:
+            for entry in index["cenarios"]:
+                yield entry, corpus[f"{entry['nome']}.grid"], corpus[f"{entry['nome']}.queries"]
+        return
+    for entry in index["cenarios"]:
+        grid_path = os.path.join(directory, f"{entry['nome']}.grid.npy")
+        queries_path = os.path.join(directory, f"{entry['nome']}.queries.npy")
+        yield (dict(entry, grid_path=grid_path),
+               np.load(grid_path, mmap_mode="r"), np.load(queries_path, mmap_mode="r"))
+
 # --- Execução e Visualização (Mantidas) ---
 
-def run_test_scenario(scenario_func, size, name):
-    """Executa o A* para um dado cenário e retorna os resultados."""
+def run_test_scenario(scenario_func, size, name, solver=a_star_grid):
+    """Executa o A* (ou outro solver da grade) para um dado cenário e retorna os resultados."""
     grid, start, goal, _ = scenario_func(size, name)
-    
-    grid_list = grid.tolist()
-    grid_list[start[0]][start[1]] = 0
-    grid_list[goal[0]][goal[1]] = 0
-    
-    path, length, time_t, explored = a_star_grid(grid_list, start, goal)
+    return solve_scenario(grid, start, goal, size, name, solver)
+
+def solve_scenario(grid, start, goal, size, name, solver=a_star_grid):
+    """Resolve um cenário já gerado e monta o dicionário de resultados."""
+    # O motor "array" usa o np.ndarray direto (start/goal sempre livres)
+    return build_results(name, size, grid, start, goal, solver(grid, start, goal))
+
+def build_results(name, size, grid, start, goal, outcome):
+    """Monta o dicionário de resultados a partir da tupla devolvida pelo solver."""
+    path, length, time_t, explored = outcome
     
     results = {
         "Nome": name,
@@ -165,6 +1345,205 @@ def run_test_scenario(scenario_func, size, name):
     }
     return results
 
+# Variantes comparadas na suíte de cenários (a primeira é a referência).
+# Usam partial em vez de lambda para poderem ir para os processos do lote.
+SOLVERS_GRADE = {
+    "A* 4-conectado": a_star_grid,
+    "A* 8-conectado": partial(a_star_grid, connectivity=8),
+    "JPS": jps_grid,
+}
+
+def compare_solvers(scenario_func, size, name, solvers=SOLVERS_GRADE):
+    """Gera o cenário uma única vez e roda cada solver sobre a mesma instância."""
+    grid, start, goal, _ = scenario_func(size, name)
+    return {label: solve_scenario(grid, start, goal, size, name, solver)
+            for label, solver in solvers.items()}
+
+# --- Obstáculos móveis: replanejamento incremental x busca completa ---
+
+def run_moving_obstacles_scenario(size, n_updates, seed, name, moves_per_update=3):
+    """
+    Cenário "Obstáculos Móveis": a cada rodada alguns obstáculos saem de onde
+    estavam e passam a bloquear células do caminho atual. Mede a latência do
+    replanejamento D* Lite contra um a_star_grid completo sobre a grade nova.
+    Retorna uma lista de dicionários, um por rodada.
+    """
+    rng = np.random.default_rng(seed)
+    grid = np.zeros((size, size))
+    grid[rng.random((size, size)) < 0.2] = 1
+    start, goal = (0, 0), (size - 1, size - 1)
+    grid[start] = grid[goal] = 0
+
+    planner = DStarLitePlanner(grid, start, goal)
+    path = planner.plan()[0]
+    rounds = []
+    for update in range(1, n_updates + 1):
+        blocked = []
+        for _ in range(moves_per_update):
+            obstacles = np.flatnonzero(grid.ravel() == 1)
+            if obstacles.size:
+                planner.clear_obstacle(divmod(int(rng.choice(obstacles)), size))
+            if path and len(path) > 2:
+                target = path[int(rng.integers(1, len(path) - 1))]
+                planner.set_obstacle(target)
+                blocked.append(target)
+
+        path, length, incr_time, incr_explored = planner.plan()
+        full_path, full_length, full_time, full_explored = a_star_grid(grid, start, goal)
+
+        rounds.append({
+            "Nome": name,
+            "Rodada": update,
+            "Células Bloqueadas": blocked,
+            "Comprimento Incremental (L)": length if path else None,
+            "Comprimento Completo (L)": full_length if full_path else None,
+            "Tempo Incremental (T)": incr_time,
+            "Tempo Completo (T)": full_time,
+            "Nós Explorados Incremental (NE)": incr_explored,
+            "Nós Explorados Completo (NE)": full_explored,
+        })
+    return rounds
+
+def print_replanning_table(rounds):
+    """Imprime a latência de replanejamento por rodada e as médias."""
+    print("\n" + "="*80)
+    print(f"            REPLANEJAMENTO — {rounds[0]['Nome']} (D* Lite x A* completo)")
+    print("="*80)
+    header = f"| {'Rodada':<6} | {'L incr.':<7} | {'L compl.':<8} | {'T incr.':<10} | {'T compl.':<10} | {'NE incr.':<8} | {'NE compl.':<9} |"
+    print(header)
+    print("-" * 80)
+    for r in rounds:
+        row = (f"| {r['Rodada']:<6} | {str(r['Comprimento Incremental (L)']):<7} | "
+               f"{str(r['Comprimento Completo (L)']):<8} | "
+               f"{r['Tempo Incremental (T)']:.6f}s  | {r['Tempo Completo (T)']:.6f}s  | "
+               f"{r['Nós Explorados Incremental (NE)']:<8} | {r['Nós Explorados Completo (NE)']:<9} |")
+        print(row)
+    print("-" * 80)
+    mean_incr = np.mean([r["Tempo Incremental (T)"] for r in rounds])
+    mean_full = np.mean([r["Tempo Completo (T)"] for r in rounds])
+    print(f"Média: replanejamento {mean_incr:.6f}s x busca completa {mean_full:.6f}s")
+    print("="*80)
+
+# --- HPA* x A* plano em grades grandes ---
+
+def benchmark_hpa_star(sizes=(512, 1024, 2048), cluster_size=32, n_queries=5, seed=0):
+    """
+    Compara HPA* com o A* plano em grades grandes geradas por
+    create_scenario_random (20%) e create_scenario_dense_labyrinth (30%).
+    Só entram pares start/goal da mesma componente (ComponentIndex).
+    Retorna uma lista de dicionários, um por (tamanho, cenário).
+    """
+    rows_out = []
+    rng = np.random.default_rng(seed)
+    for size in sizes:
+        for scenario_func in (lambda s: create_scenario_random(s, 0.2, 42, "Aleatório 20%"),
+                              lambda s: create_scenario_dense_labyrinth(s, "Labirinto Densa")):
+            grid, _, _, name = scenario_func(size)
+            build_start = time.time()
+            hpa = HPAStar.build(grid, cluster_size)
+            build_time = time.time() - build_start
+
+            components = ComponentIndex(grid)
+            free_cells = np.flatnonzero(grid.ravel() == 0)
+            queries = []
+            while len(queries) < n_queries:
+                a, b = (divmod(int(x), size) for x in rng.choice(free_cells, size=2))
+                if components.connected(a, b):
+                    queries.append((a, b))
+
+            flat = [a_star_grid(grid, a, b) for a, b in queries]
+            hier = [hpa.search(a, b) for a, b in queries]
+            rows_out.append({
+                "Nome": name,
+                "Tamanho da Grade": size,
+                "Nós Abstratos": len(hpa.node_cells),
+                "Tempo de Construção": build_time,
+                "T Plano": np.mean([r[2] for r in flat]),
+                "T HPA*": np.mean([r[2] for r in hier]),
+                "NE Plano": np.mean([r[3] for r in flat]),
+                "NE HPA*": np.mean([r[3] for r in hier]),
+                "Razão L": np.mean([h[1] / f[1] if f[1] else 1.0 for f, h in zip(flat, hier)]),
+            })
+    return rows_out
+
+def print_hpa_table(rows):
+    """Imprime o comparativo HPA* x A* plano."""
+    print("\n" + "="*104)
+    print("                               HPA* x A* PLANO (médias por consulta)")
+    print("="*104)
+    header = (f"| {'Cenário':<16} | {'Tamanho':<7} | {'Nós abs.':<8} | {'Construção':<10} | "
+              f"{'T plano':<9} | {'T HPA*':<9} | {'NE plano':<9} | {'NE HPA*':<8} | {'L HPA*/L':<8} |")
+    print(header)
+    print("-" * 104)
+    for r in rows:
+        print(f"| {r['Nome']:<16} | {r['Tamanho da Grade']:<7} | {r['Nós Abstratos']:<8} | "
+              f"{r['Tempo de Construção']:>9.2f}s | {r['T Plano']:>8.4f}s | {r['T HPA*']:>8.4f}s | "
+              f"{r['NE Plano']:>9.0f} | {r['NE HPA*']:>8.0f} | {r['Razão L']:>8.3f} |")
+    print("="*104)
+
+# --- Lote de consultas em paralelo ---
+
+# Estado de cada processo do pool: a grade compartilhada e o solver
+_batch_grid = None
+_batch_shm = None
+_batch_solver = None
+
+def _batch_worker_init(solver, shm_name, shape, npy_path):
+    """Anexa a grade compartilhada (memória compartilhada ou .npy mapeado)."""
+    global _batch_grid, _batch_shm, _batch_solver
+    _batch_solver = solver
+    if npy_path is not None:
+        _batch_grid = np.load(npy_path, mmap_mode="r")
+    else:
+        _batch_shm = shared_memory.SharedMemory(name=shm_name)
+        _batch_grid = np.ndarray(shape, dtype=np.uint8, buffer=_batch_shm.buf)
+
+def _batch_worker_solve(query):
+    start, goal = query
+    return _batch_solver(_batch_grid, start, goal)
+
+def run_batch_queries(grid, queries, name="Lote", solver=a_star_grid, max_workers=None, chunksize=None):
+    """
+    Resolve N pares (start, goal) sobre uma mesma grade num ProcessPoolExecutor.
+    A grade vai uma única vez para a memória compartilhada (como máscara
+    uint8 de obstáculos) em vez de ser serializada por tarefa; se `grid` for
+    o caminho de um arquivo .npy, cada processo o abre com mmap_mode="r".
+    O solver precisa ser serializável (função de módulo ou functools.partial).
+    Retorna uma lista de dicionários de resultados, na ordem das consultas.
+    """
+    queries = [(tuple(start), tuple(goal)) for start, goal in queries]
+    npy_path = None
+    if isinstance(grid, (str, os.PathLike)):
+        npy_path = os.fspath(grid)
+        grid = np.load(npy_path, mmap_mode="r")
+    size = grid.shape[0] if grid.shape[0] == grid.shape[1] else grid.shape
+    if not queries:
+        return []
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(queries) // (max_workers * 4))
+
+    shm = None
+    try:
+        shm_name = None
+        if npy_path is None:
+            shm = shared_memory.SharedMemory(create=True, size=max(1, grid.size))
+            shared = np.ndarray(grid.shape, dtype=np.uint8, buffer=shm.buf)
+            shared[:] = grid != 0
+            shm_name = shm.name
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_batch_worker_init,
+                                 initargs=(solver, shm_name, grid.shape, npy_path)) as executor:
+            outcomes = list(executor.map(_batch_worker_solve, queries, chunksize=chunksize))
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    return [build_results(name, size, grid, start, goal, outcome)
+            for (start, goal), outcome in zip(queries, outcomes)]
+
 def visualize_results(all_results, filename):
     """Gera o gráfico e imprime a tabela de resultados."""
     num_scenarios = len(all_results)
@@ -195,8 +1574,24 @@ def visualize_results(all_results, filename):
     plt.tight_layout()
     output_file = os.path.join(os.getcwd(), filename)
     plt.savefig(output_file, dpi=150)
+    plt.close(fig)
     print(f"\nImagem salva em: {output_file}")
 
+def save_results_rasters(all_results, directory, scale=4, max_workers=None):
+    """
+    Grava cada resultado como imagem raster montada direto do array da
+    grade (sem imshow), em processos paralelos. Para grades grandes, em que
+    o visualize_results fica lento ou ilegível. Retorna os arquivos gerados.
+    """
+    os.makedirs(directory, exist_ok=True)
+    jobs = []
+    for idx, res in enumerate(all_results):
+        ascii_name = unicodedata.normalize("NFKD", res["Nome"]).encode("ascii", "ignore").decode()
+        slug = "".join(c if c.isalnum() else "_" for c in ascii_name).strip("_").lower()
+        jobs.append({"grid": res["Grid"], "caminho": res["Caminho"], "inicio": res["Início"], "fim": res["Fim"],
+                     "escala": scale, "arquivo": os.path.join(directory, f"{idx:02d}_{slug}.png")})
+    return salvar_grades_lote(jobs, max_workers=max_workers)
+
 
 def print_metrics_table(all_results):
     """Imprime uma tabela formatada com os resultados."""
@@ -219,6 +1614,32 @@ def print_metrics_table(all_results):
         print(row)
     print("="*80)
 
+def print_comparison_table(all_comparisons):
+    """
+    Imprime NE e T de cada variante e a redução percentual em relação à
+    primeira variante (A* 4-conectado simples).
+    """
+    print("\n" + "="*96)
+    print("                 COMPARAÇÃO: A* 4-CONECTADO x A* 8-CONECTADO x JPS")
+    print("="*96)
+    header = f"| {'Cenário':<20} | {'Variante':<14} | {'L':<6} | {'NE':<8} | {'Redução NE':<10} | {'T (Segundos)':<12} | {'Redução T':<9} |"
+    print(header)
+    print("-" * 96)
+
+    for comparison in all_comparisons:
+        baseline = next(iter(comparison.values()))
+        base_ne = baseline["Nós Explorados (NE)"]
+        base_t = baseline["Tempo de Execução (T)"]
+        for label, res in comparison.items():
+            ne = res["Nós Explorados (NE)"]
+            t = res["Tempo de Execução (T)"]
+            red_ne = 100.0 * (1 - ne / base_ne) if base_ne else 0.0
+            red_t = 100.0 * (1 - t / base_t) if base_t else 0.0
+            length_str = "INALC." if res["Caminho"] is None else str(res["Comprimento do Caminho (L)"])
+            row = f"| {res['Nome']:<20} | {label:<14} | {length_str:<6} | {ne:<8} | {red_ne:>9.1f}% | {t:.6f}s    | {red_t:>8.1f}% |"
+            print(row)
+        print("-" * 96)
+
 # --- Execução Principal ---
 
 if __name__ == "__main__":
@@ -226,20 +1647,102 @@ if __name__ == "__main__":
     GRID_SIZE = 50 
     
     scenarios_to_test = [
-        lambda size, name: create_scenario_random(size, 0.2, 42, "Aleatório Simples 1"),
-        lambda size, name: create_scenario_dense_labyrinth(size, "Labirinto Densa"),
-        lambda size, name: create_scenario_bottleneck(size, "Gargalo (Bottleneck)"),
-        lambda size, name: create_scenario_dead_end(size, "Poço Sem Saída"),
-        lambda size, name: create_scenario_unreachable(size, "Inalcançável"),
+        ("Aleatório Simples 1", lambda size, name: create_scenario_random(size, 0.2, 42, name)),
+        ("Labirinto Densa", create_scenario_dense_labyrinth),
+        ("Gargalo (Bottleneck)", create_scenario_bottleneck),
+        ("Poço Sem Saída", create_scenario_dead_end),
+        ("Inalcançável", create_scenario_unreachable),
     ]
 
     all_results = []
+    all_comparisons = []
 
-    for scenario_func in scenarios_to_test:
-        name = scenario_func(GRID_SIZE, "Placeholder")[3] 
+    for name, scenario_func in scenarios_to_test:
         print(f"Executando teste: {name}...")
-        results = run_test_scenario(scenario_func, GRID_SIZE, name)
-        all_results.append(results)
+        comparison = compare_solvers(scenario_func, GRID_SIZE, name)
+        all_results.append(comparison["A* 4-conectado"])
+        all_comparisons.append(comparison)
 
     print_metrics_table(all_results)
-    visualize_results(all_results, "a_star_test_scenarios.png")
\ No newline at end of file
+    print_comparison_table(all_comparisons)
+
+    # Índice de componentes: o cenário inalcançável responde sem busca
+    grid, start, goal, name = create_scenario_unreachable(GRID_SIZE, "Inalcançável + índice")
+    components = ComponentIndex(grid)
+    components.rebuild()
+    res = solve_scenario(grid, start, goal, GRID_SIZE, name,
+                         partial(a_star_grid, components=components))
+    print(f"\n{name}: {components.n_components} componentes, "
+          f"NE={res['Nós Explorados (NE)']}, T={res['Tempo de Execução (T)']:.6f}s")
+
+    # Obstáculos móveis: D* Lite repara o caminho a cada rodada
+    rounds = run_moving_obstacles_scenario(GRID_SIZE * 4, 10, 11, "Obstáculos Móveis")
+    print_replanning_table(rounds)
+
+    # Lote: várias consultas sobre a mesma grade, em paralelo
+    grid = create_scenario_random(GRID_SIZE * 4, 0.2, 7, "Lote")[0]
+    queries = queries_to_pairs(sample_queries(grid, 200, np.random.default_rng(7)))
+    batch_start = time.time()
+    batch_results = run_batch_queries(grid, queries, name="Lote Aleatório")
+    batch_time = time.time() - batch_start
+    reachable = sum(res["Caminho"] is not None for res in batch_results)
+    print(f"\nLote: {len(batch_results)} consultas ({reachable} alcançáveis) "
+          f"em {batch_time:.3f}s de parede; soma dos tempos de busca = "
+          f"{sum(res['Tempo de Execução (T)'] for res in batch_results):.3f}s")
+
+    # Campo de distância: muitos agentes indo para o mesmo objetivo na mesma grade
+    goal = (GRID_SIZE * 4 - 1, GRID_SIZE * 4 - 1)
+    grid[goal] = 0
+    agents = [(int(r), int(c)) for r, c, _, _ in sample_queries(grid, 200, np.random.default_rng(8))]
+    field_start = time.time()
+    fingerprint = grid_fingerprint(grid)
+    field_results = [distance_field_grid(grid, agent, goal, fingerprint=fingerprint) for agent in agents]
+    field_time = time.time() - field_start
+    astar_start = time.time()
+    astar_results = [a_star_grid(grid, agent, goal) for agent in agents]
+    astar_time = time.time() - astar_start
+    field = FIELD_CACHE.get(grid, goal, fingerprint=fingerprint)
+    exact = a_star_grid(grid, agents[0], goal, heuristic=field)
+    same = all(a[1] == b[1] for a, b in zip(field_results, astar_results))
+    print(f"\nCampo de distância: {len(agents)} agentes em {field_time:.3f}s (montagem {field.build_time:.3f}s) "
+          f"x A* por agente {astar_time:.3f}s; comprimentos iguais: {same}; "
+          f"A* com heurística exata: NE {astar_results[0][3]} -> {exact[3]}")
+
+    # Cache de caminhos: pares (start, goal) repetidos sobre a grade inalterada
+    pairs = queries_to_pairs(sample_queries(grid, 50, np.random.default_rng(9)))
+    repeated = [pairs[i] for i in (np.random.default_rng(10).zipf(1.3, 500) - 1) % len(pairs)]
+    path_cache = PathCache(a_star_grid)
+    cache_start = time.time()
+    cached_lengths = [path_cache(grid, start, goal)[1] for start, goal in repeated]
+    cache_time = time.time() - cache_start
+    # toda célula do caminho guardado responde pelo sufixo; depois a grade muda e o cache descarta
+    start, goal = repeated[0]
+    cached_path = path_cache(grid, start, goal)[0]
+    middle = cached_path[len(cached_path) // 2] if cached_path else start
+    suffix = path_cache(grid, middle, goal)
+    grid[middle] = 1
+    changed = path_cache(grid, start, goal)
+    stats = path_cache.stats()
+    print(f"Cache de caminhos: {len(repeated)} consultas em {cache_time:.3f}s; acertos {stats['Acertos']} "
+          f"(+{stats['Acertos por Sufixo']} por sufixo), falhas {stats['Falhas']}, "
+          f"taxa {stats['Taxa de Acerto']:.0%}; sufixo NE={suffix[3]}; após mudar a grade NE={changed[3]}")
+    visualize_results(all_results, "a_star_test_scenarios.png")
+    rasters = save_results_rasters(all_results, "a_star_rasters")
+    print(f"Rasters salvos: {', '.join(rasters)}")
+
+    # Corpus em disco: python 03_algoritmo_a_star.py --corpus
+    if "--corpus" in sys.argv:
+        # o corpus é só demonstração: vai para uma pasta temporária
+        with tempfile.TemporaryDirectory() as corpus_dir:
+            write_scenario_corpus(corpus_dir, sizes=(256, 512), densities=(0.2, 0.3), n_queries=1000, seed=0)
+            for entry, grid, queries in load_scenario_corpus(corpus_dir):
+                batch_start = time.time()
+                batch_results = run_batch_queries(entry["grid_path"], queries_to_pairs(queries[:100]),
+                                                  name=entry["nome"])
+                reachable = sum(res["Caminho"] is not None for res in batch_results)
+                print(f"Corpus {entry['nome']}: {len(batch_results)} consultas ({reachable} alcançáveis) "
+                      f"em {time.time() - batch_start:.3f}s")
+
+    # HPA* em grades grandes (demorado): python 03_algoritmo_a_star.py --hpa
+    if "--hpa" in sys.argv:
+        print_hpa_table(benchmark_hpa_star())
\ No newline at end of file
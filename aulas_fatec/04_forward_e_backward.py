@@ -1,6 +1,16 @@
 #Sistemas Especialista
 
-import experta
+import heapq
+import json
+from collections import deque
+import mmap
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 base_conhecimento = {
     "sol": {
@@ -27,21 +37,145 @@ def motor_inferencia_clima(fatos):
         return base_conhecimento[clima][temperatura]
     else:
         return "Não tenho recomendação para esta combinação de clima e temperatura."
-    
-# Simulação
 
-fatos = {
-    "clima": "chuva",
-    "temperatura": "ameno"
-}
+# Tabela de decisão compilada (consultas em lote)
+#
+# A base aninhada vira um array denso com um eixo por atributo. Cada valor
+# de atributo recebe um código inteiro e o último índice de cada eixo
+# representa "valor desconhecido". As células guardam o código da
+# recomendação; o código SEM_RECOMENDACAO (0) é o "Não tenho recomendação".
+# Uma consulta é uma soma de códigos x passos seguida de um único acesso
+# ao array, então o custo por registro não depende da profundidade da base.
+
+SEM_RECOMENDACAO = 0
+
+class TabelaDecisao:
+    def __init__(self, base, atributos=("clima", "temperatura"),
+                 fallback="Não tenho recomendação para esta combinação de clima e temperatura."):
+        self.atributos = tuple(atributos)
+        self.codigos = [{} for _ in self.atributos]
+        self.recomendacoes = [fallback]
+        self._coletar(base, 0)
+        # +1 em cada eixo para o valor desconhecido
+        forma = tuple(len(c) + 1 for c in self.codigos)
+        self.tabela = np.full(forma, SEM_RECOMENDACAO, dtype=np.int32)
+        self._preencher(base, ())
+        self.tabela_plana = self.tabela.ravel()
+        self.passos = np.array([p // self.tabela.itemsize for p in self.tabela.strides], dtype=np.int64)
+        self._codigo_recomendacao = {texto: i for i, texto in enumerate(self.recomendacoes)}
+
+    def _coletar(self, no, nivel):
+        for valor, filho in no.items():
+            self.codigos[nivel].setdefault(valor, len(self.codigos[nivel]))
+            if isinstance(filho, dict):
+                self._coletar(filho, nivel + 1)
+            elif filho not in self.recomendacoes:
+                self.recomendacoes.append(filho)
+
+    def _preencher(self, no, prefixo):
+        nivel = len(prefixo)
+        for valor, filho in no.items():
+            indice = prefixo + (self.codigos[nivel][valor],)
+            if isinstance(filho, dict):
+                self._preencher(filho, indice)
+            else:
+                # folha antes do último atributo: vale para qualquer valor dos seguintes
+                self.tabela[indice] = self.recomendacoes.index(filho)
+
+    def codificar(self, atributo, valores):
+        """Array de valores (texto) de um atributo -> códigos; valores fora da base viram 'desconhecido'."""
+        nivel = self.atributos.index(atributo)
+        codigos = self.codigos[nivel]
+        valores = np.asarray(valores)
+        if len(codigos) <= 32:
+            # poucas categorias: uma comparação vetorizada por categoria evita ordenar textos
+            resultado = np.full(len(valores), len(codigos), dtype=np.int64)
+            for valor, codigo in codigos.items():
+                resultado[valores == valor] = codigo
+            return resultado
+        unicos, inverso = np.unique(valores, return_inverse=True)
+        mapa = np.array([codigos.get(v, len(codigos)) for v in unicos.tolist()], dtype=np.int64)
+        return mapa[inverso.reshape(-1)]
+
+    def consultar_codigos(self, colunas_codificadas):
+        """Lista de arrays de códigos (um por atributo, na ordem de self.atributos) -> códigos de recomendação."""
+        plano = np.zeros(len(colunas_codificadas[0]), dtype=np.int64)
+        for codigos, passo in zip(colunas_codificadas, self.passos):
+            plano += codigos * passo
+        return self.tabela_plana[plano]
 
-conclusao = motor_inferencia_clima(fatos)
-print(f"Fatos: {fatos}")
-print(f"Recomendação do sistema: {conclusao}")
+    def consultar(self, colunas, n=None):
+        """
+        colunas: dict atributo -> array de valores (texto). Atributos ausentes
+        contam como desconhecidos. n: número de consultas; obrigatório só
+        quando colunas está vazio. Retorna o array de códigos de recomendação.
+        """
+        if n is None:
+            if not colunas:
+                raise ValueError("colunas vazio: informe n (número de consultas)")
+            n = len(next(iter(colunas.values())))
+        codificadas = [self.codificar(a, colunas[a]) if a in colunas
+                       else np.full(n, len(self.codigos[k]), dtype=np.int64)
+                       for k, a in enumerate(self.atributos)]
+        return self.consultar_codigos(codificadas)
+
+    def textos(self, codigos):
+        """Códigos de recomendação -> array de textos."""
+        return np.array(self.recomendacoes, dtype=object)[codigos]
+
+    def consultar_csv(self, caminho, tamanho_bloco=100_000):
+        """
+        Lê um CSV (com cabeçalho contendo os atributos) em blocos e devolve,
+        bloco a bloco, os códigos de recomendação. Memória limitada pelo bloco.
+        """
+        import csv
+        from itertools import islice
+
+        with open(caminho, newline="", encoding="utf-8") as arquivo:
+            leitor = csv.reader(arquivo)
+            cabecalho = next(leitor)
+            colunas_csv = [cabecalho.index(a) if a in cabecalho else None for a in self.atributos]
+            while True:
+                linhas = list(islice(leitor, tamanho_bloco))
+                if not linhas:
+                    return
+                colunas = {a: [linha[c] for linha in linhas]
+                           for a, c in zip(self.atributos, colunas_csv) if c is not None}
+                if not colunas:
+                    yield np.full(len(linhas), SEM_RECOMENDACAO, dtype=np.int32)
+                else:
+                    yield self.consultar(colunas)
+
+def benchmark_tabela(n_registros=10**6, seed=0):
+    """Compara motor_inferencia_clima registro a registro com a TabelaDecisao em lote."""
+    rng = np.random.default_rng(seed)
+    climas = np.array(["sol", "nublado", "chuva", "neve"])
+    temperaturas = np.array(["quente", "ameno", "frio"])
+    clima = climas[rng.integers(0, len(climas), n_registros)]
+    temperatura = temperaturas[rng.integers(0, len(temperaturas), n_registros)]
+    tabela = TabelaDecisao(base_conhecimento)
+
+    inicio = time.time()
+    esperado = [motor_inferencia_clima({"clima": c, "temperatura": t})
+                for c, t in zip(clima.tolist(), temperatura.tolist())]
+    t_dict = time.time() - inicio
+    inicio = time.time()
+    codigos = tabela.consultar({"clima": clima, "temperatura": temperatura})
+    t_tabela = time.time() - inicio
+    iguais = tabela.textos(codigos).tolist() == esperado
+
+    print("\n" + "=" * 66)
+    print(f"   RECOMENDAÇÕES PARA {n_registros} REGISTROS (resultados iguais: {iguais})")
+    print("=" * 66)
+    print(f"| {'Motor':<30} | {'Tempo (T)':<12} | {'Sem recom.':<12} |")
+    print("-" * 66)
+    sem = int(np.count_nonzero(codigos == SEM_RECOMENDACAO))
+    print(f"| {'motor_inferencia_clima':<30} | {t_dict:>11.4f}s | {sem:<12} |")
+    print(f"| {'TabelaDecisao (lote)':<30} | {t_tabela:>11.4f}s | {sem:<12} |")
+    print("=" * 66)
 
 # Forward e Backward
 
-fatos = ["tem_pelos", "voa", "produz_leite"]
 regras = [
     {
         "se": ["tem_penas", "voa"],
@@ -69,62 +203,831 @@ regras = [
     }
 ]
 
+# Instrumentação dos motores
+#
+# Os motores não imprimem direto: mandam eventos para um "sink" e contam
+# regras testadas, regras disparadas e fatos derivados. O sink padrão
+# (SinkConsole) imprime as mesmas mensagens de antes. Com SinkNulo o motor
+# nem monta o evento (nenhuma formatação no laço), e com cronometrar=True
+# cada regra ganha um histograma de tempos em faixas de potência de 2 (ns).
+
+class SinkNulo:
+    ativo = False
+
+    def registrar(self, evento):
+        pass
+
+class SinkConsole:
+    ativo = True
+
+    def registrar(self, evento):
+        if evento["tipo"] == "disparo":
+            print(f"Regra disparada: SE {evento['se']} ENTAO {evento['entao']}")
+            print(f"Fatos adicionado: {evento['entao']}")
+        else:
+            print(evento["texto"])
+
+class SinkMemoria:
+    """Guarda os últimos `capacidade` eventos (buffer circular)."""
+    ativo = True
+
+    def __init__(self, capacidade=10000):
+        self.eventos = deque(maxlen=capacidade)
+
+    def registrar(self, evento):
+        self.eventos.append(evento)
+
+class SinkJSONL:
+    """Grava um evento por linha (JSON) no arquivo; use fechar() ou `with`."""
+    ativo = True
+
+    def __init__(self, caminho):
+        self.arquivo = open(caminho, "a", encoding="utf-8")
+
+    def registrar(self, evento):
+        self.arquivo.write(json.dumps(evento, ensure_ascii=False) + "\n")
+
+    def fechar(self):
+        self.arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+class Instrumentacao:
+    def __init__(self, sink=None, cronometrar=False):
+        self.sink = sink if sink is not None else SinkConsole()
+        self.ativo = self.sink.ativo
+        self.cronometrar = cronometrar
+        self.regras_testadas = 0
+        self.regras_disparadas = 0
+        self.fatos_derivados = 0
+        self.histogramas = {}   # regra -> [contagem por faixa de 2**k ns]
+        self.tempo_total_ns = {}
+
+    def emitir(self, **evento):
+        self.sink.registrar(evento)
+
+    def contar(self, testadas=0, disparadas=0, derivados=0):
+        self.regras_testadas += testadas
+        self.regras_disparadas += disparadas
+        self.fatos_derivados += derivados
+
+    def registrar_tempo(self, regra, ns):
+        histograma = self.histogramas.get(regra)
+        if histograma is None:
+            histograma = self.histogramas[regra] = [0] * 64
+            self.tempo_total_ns[regra] = 0
+        histograma[min(63, ns.bit_length())] += 1
+        self.tempo_total_ns[regra] += ns
+
+    def resumo(self):
+        """Contadores e, por regra, chamadas/tempo total/histograma {limite superior em ns: contagem}."""
+        return {
+            "regras_testadas": self.regras_testadas,
+            "regras_disparadas": self.regras_disparadas,
+            "fatos_derivados": self.fatos_derivados,
+            "tempos_por_regra": {
+                regra: {"chamadas": sum(h), "total_ns": self.tempo_total_ns[regra],
+                        "histograma": {2 ** k: n for k, n in enumerate(h) if n}}
+                for regra, h in self.histogramas.items()
+            },
+        }
+
 # Motor de Inferência (Forward)
 
-def motor_inferencia_forward(fatos_init, regras):
+def motor_inferencia_forward(fatos_init, regras, instrumentacao=None):
+    inst = instrumentacao or Instrumentacao()
+    ativo, cronometrar = inst.ativo, inst.cronometrar
     fatos_derivados = list(fatos_init)
     novo_fato = True
+    testadas = disparadas = 0
 
     while novo_fato:
         novo_fato = False
-        for regra in regras:
+        for i, regra in enumerate(regras):
+            if cronometrar:
+                t0 = time.perf_counter_ns()
+            testadas += 1
             condicao_satisfeita = all(condicao in fatos_derivados for condicao in regra["se"])
 
             if condicao_satisfeita and regra["entao"] not in fatos_derivados:
                 fatos_derivados.append(regra["entao"])
-                print(f"Regra disparada: SE {regra['se']} ENTAO {regra['entao']}")
-                print(f"Fatos adicionado: {regra['entao']}")
+                disparadas += 1
+                if ativo:
+                    inst.emitir(tipo="disparo", regra=i, se=regra["se"], entao=regra["entao"])
                 novo_fato = True
+            if cronometrar:
+                inst.registrar_tempo(i, time.perf_counter_ns() - t0)
+
+    inst.contar(testadas, disparadas, disparadas)
+    return fatos_derivados
+
+# Motor de Inferência (Forward indexado, estilo Rete)
+#
+# Em vez de reler todas as regras a cada passada, cada regra guarda quantas
+# condições ainda faltam e um índice condição -> regras faz um fato novo
+# tocar só as regras que o mencionam. Regras que ficam satisfeitas entram
+# numa agenda ordenada pelo índice da regra, simulando as passadas do motor
+# acima: se a regra está depois da que acabou de disparar, dispara ainda
+# nesta passada; senão fica para a próxima. Assim os fatos saem na mesma
+# ordem e as mensagens de disparo são as mesmas.
+
+def indexar_regras(regras):
+    """Retorna (índice condição -> ids das regras, lista de condições distintas de cada regra)."""
+    indice = {}
+    condicoes = []
+    for i, regra in enumerate(regras):
+        distintas = list(dict.fromkeys(regra["se"]))
+        condicoes.append(distintas)
+        for condicao in distintas:
+            indice.setdefault(condicao, []).append(i)
+    return indice, condicoes
+
+def motor_inferencia_forward_indexado(fatos_init, regras, indice=None, instrumentacao=None):
+    if indice is None:
+        indice = indexar_regras(regras)
+    por_condicao, condicoes = indice
+    inst = instrumentacao or Instrumentacao()
+    ativo, cronometrar = inst.ativo, inst.cronometrar
+    testadas = disparadas = 0
 
+    fatos_derivados = list(fatos_init)
+    conhecidos = set(fatos_derivados)
+    faltando = [sum(1 for c in distintas if c not in conhecidos) for distintas in condicoes]
+
+    agenda = [i for i, n in enumerate(faltando) if n == 0]   # já ordenada
+    proxima_passada = []
+    while agenda or proxima_passada:
+        if not agenda:
+            agenda, proxima_passada = proxima_passada, []
+        i = heapq.heappop(agenda)
+        testadas += 1
+        regra = regras[i]
+        conclusao = regra["entao"]
+        if conclusao in conhecidos:
+            continue
+        if cronometrar:
+            t0 = time.perf_counter_ns()
+        fatos_derivados.append(conclusao)
+        conhecidos.add(conclusao)
+        disparadas += 1
+        if ativo:
+            inst.emitir(tipo="disparo", regra=i, se=regra["se"], entao=regra["entao"])
+
+        for j in por_condicao.get(conclusao, ()):
+            faltando[j] -= 1
+            if faltando[j] == 0:
+                heapq.heappush(agenda if j > i else proxima_passada, j)
+        if cronometrar:
+            inst.registrar_tempo(i, time.perf_counter_ns() - t0)
+
+    inst.contar(testadas, disparadas, disparadas)
     return fatos_derivados
 
-# Simulação
+# Motor de Inferência (Backward)
+#
+# Parte do objetivo e procura regras cujo "entao" seja ele, tentando provar
+# cada condição do "se". O resultado de cada subobjetivo fica numa tabela
+# (memo) que vale para todas as consultas seguintes com as mesmas regras.
+# Um subobjetivo que já está na pilha (ciclo) é tratado como falso naquele
+# ramo; falhas que dependem desse corte só vão para o memo quando o objetivo
+# mais alto do ciclo também falha (como as componentes do Tarjan).
+
+class ProvadorBackward:
+    def __init__(self, fatos, regras):
+        self.fatos = set(fatos)
+        self.regras_por_conclusao = {}
+        for regra in regras:
+            self.regras_por_conclusao.setdefault(regra["entao"], []).append(regra["se"])
+        self.memo = {}
+        self.acertos_memo = 0
+        self.objetivos_expandidos = 0
+
+    def limpar_memo(self):
+        self.memo.clear()
+
+    def provar(self, objetivo):
+        """Retorna True se o objetivo pode ser provado a partir dos fatos e regras."""
+        fatos, memo = self.fatos, self.memo
+        if objetivo in fatos:
+            return True
+        if objetivo in memo:
+            self.acertos_memo += 1
+            return memo[objetivo]
+
+        regras_por_conclusao = self.regras_por_conclusao
+        em_andamento = {}   # objetivo -> profundidade na pilha
+        pendentes = []      # falhas que dependem de um ciclo ainda aberto
+        # quadro: [objetivo, regras, regra atual, condição atual, menor profundidade cortada, marca em pendentes]
+        pilha = []
+
+        def empilhar(g):
+            em_andamento[g] = len(pilha)
+            pilha.append([g, regras_por_conclusao.get(g, ()), 0, 0, len(pilha), len(pendentes)])
+            self.objetivos_expandidos += 1
+
+        empilhar(objetivo)
+        while True:
+            quadro = pilha[-1]
+            g, regras_g, ri, ci, menor, marca = quadro
+            if ri < len(regras_g):
+                condicoes = regras_g[ri]
+                if ci == len(condicoes):
+                    resultado = True
+                else:
+                    c = condicoes[ci]
+                    if c in fatos or memo.get(c) is True:
+                        quadro[3] += 1
+                    elif c in memo:
+                        self.acertos_memo += 1
+                        quadro[2] += 1
+                        quadro[3] = 0
+                    elif c in em_andamento:
+                        quadro[4] = min(menor, em_andamento[c])
+                        quadro[2] += 1
+                        quadro[3] = 0
+                    else:
+                        empilhar(c)
+                    continue
+            else:
+                resultado = False
+
+            # g terminou: registra no memo (ou em pendentes) e devolve ao pai
+            pilha.pop()
+            profundidade = len(pilha)
+            del em_andamento[g]
+            if resultado:
+                memo[g] = True
+                del pendentes[marca:]
+            elif menor >= profundidade:
+                memo[g] = False
+                for p in pendentes[marca:]:
+                    memo[p] = False
+                del pendentes[marca:]
+            else:
+                pendentes.append(g)
+
+            if not pilha:
+                return resultado
+            pai = pilha[-1]
+            if resultado:
+                pai[3] += 1
+            else:
+                pai[4] = min(pai[4], menor)
+                pai[2] += 1
+                pai[3] = 0
+
+    def provar_lote(self, objetivos):
+        """Responde vários objetivos compartilhando o mesmo memo. Retorna {objetivo: bool}."""
+        return {objetivo: self.provar(objetivo) for objetivo in objetivos}
+
+# Sessão incremental (manutenção da verdade)
+#
+# Fatos chegam e expiram: em vez de rodar o forward de novo, a sessão guarda
+# para cada regra quantas condições faltam. A justificativa de um fato
+# derivado são as regras que o concluem com todas as condições presentes.
+# assert_fact só dispara as regras que o fato novo completa. retract_fact
+# usa apagar-e-rederivar: remove o fato e tudo o que dependia dele (mesmo
+# que por um ciclo) e depois recoloca o que ainda tem outra justificativa.
+# O custo fica proporcional à parte afetada do grafo de derivações.
+
+class SessaoInferencia:
+    def __init__(self, regras, fatos_init=()):
+        self.regras = regras
+        self.por_condicao, condicoes = indexar_regras(regras)
+        self.por_conclusao = {}
+        for i, regra in enumerate(regras):
+            self.por_conclusao.setdefault(regra["entao"], []).append(i)
+        self.faltando = [len(distintas) for distintas in condicoes]
+        self.base = set()    # fatos afirmados
+        self.ativos = {}     # fatos válidos agora (dict = conjunto com ordem de chegada)
+        self._propagar([regras[i]["entao"] for i, n in enumerate(self.faltando) if n == 0])
+        for fato in fatos_init:
+            self.assert_fact(fato)
+
+    def _propagar(self, fila):
+        """Coloca os fatos da fila e tudo o que eles passam a justificar. Retorna os fatos novos."""
+        regras, faltando, por_condicao, ativos = self.regras, self.faltando, self.por_condicao, self.ativos
+        novos = []
+        fila = deque(fila)
+        while fila:
+            fato = fila.popleft()
+            if fato in ativos:
+                continue
+            ativos[fato] = None
+            novos.append(fato)
+            for j in por_condicao.get(fato, ()):
+                faltando[j] -= 1
+                if faltando[j] == 0 and regras[j]["entao"] not in ativos:
+                    fila.append(regras[j]["entao"])
+        return novos
+
+    def assert_fact(self, fato):
+        """Afirma um fato. Retorna os fatos que passaram a valer (ele e os derivados)."""
+        self.base.add(fato)
+        return self._propagar([fato])
+
+    def retract_fact(self, fato):
+        """Retira um fato afirmado. Retorna os fatos que deixaram de valer."""
+        if fato not in self.base:
+            return []
+        self.base.discard(fato)
+        regras, faltando, por_condicao, ativos, base = (self.regras, self.faltando, self.por_condicao,
+                                                       self.ativos, self.base)
+
+        # 1) apaga o fato e tudo o que dependia dele (superestimando nos ciclos)
+        apagados = {fato: None}
+        fila = deque([fato])
+        while fila:
+            x = fila.popleft()
+            for j in por_condicao.get(x, ()):
+                if faltando[j] == 0:
+                    y = regras[j]["entao"]
+                    if y in ativos and y not in base and y not in apagados:
+                        apagados[y] = None
+                        fila.append(y)
+                faltando[j] += 1
+        for x in apagados:
+            del ativos[x]
+
+        # 2) rederiva o que ainda tem alguma justificativa
+        justificados = [x for x in apagados if self.justificativas(x)]
+        self._propagar(justificados)
+        return [x for x in apagados if x not in ativos]
+
+    def justificativas(self, fato):
+        """Regras que concluem o fato e estão com todas as condições presentes."""
+        return [self.regras[i] for i in self.por_conclusao.get(fato, ()) if self.faltando[i] == 0]
+
+    def fatos(self):
+        return list(self.ativos)
+
+# Base compilada (artefato binário com mmap)
+#
+# Para bases grandes, reconstruir `regras` a partir de literais/JSON a cada
+# processo é lento. compilar_base grava um arquivo com os fatos internados
+# como ids inteiros, os antecedentes em arrays planos (CSR) e o índice
+# condição -> regras já pronto. BaseCompilada.carregar só mapeia o arquivo
+# (mmap): a carga é praticamente instantânea e as páginas são compartilhadas
+# entre processos que abrem o mesmo arquivo.
+#
+# Layout: b"KBC1" | tamanho do cabeçalho (uint64) | cabeçalho JSON | arrays
+# alinhados em 8 bytes. O cabeçalho guarda (dtype, offset, quantidade) de cada array.
+
+MAGICO_KB = b"KBC1"
+
+def compilar_base(regras, caminho):
+    """Compila a lista de regras {"se": [...], "entao": ...} no arquivo `caminho`."""
+    ids = {}
+
+    def internar(fato):
+        if fato not in ids:
+            ids[fato] = len(ids)
+        return ids[fato]
+
+    se_indptr = [0]
+    se_ids = []
+    entao = []
+    n_condicoes = []
+    por_condicao = {}
+    for i, regra in enumerate(regras):
+        se_ids.extend(internar(c) for c in regra["se"])
+        se_indptr.append(len(se_ids))
+        entao.append(internar(regra["entao"]))
+        distintas = dict.fromkeys(se_ids[se_indptr[-2]:])
+        n_condicoes.append(len(distintas))
+        for c in distintas:
+            por_condicao.setdefault(c, []).append(i)
+
+    nomes = [nome.encode("utf-8") for nome in ids]
+    indice_indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+    indice_indptr[1:] = np.cumsum([len(por_condicao.get(c, ())) for c in range(len(ids))])
+    indice_regras = [i for c in range(len(ids)) for i in por_condicao.get(c, ())]
+
+    arrays = {
+        "simbolos_offsets": np.concatenate([[0], np.cumsum([len(n) for n in nomes])]).astype(np.int64),
+        "simbolos_bytes": np.frombuffer(b"".join(nomes), dtype=np.uint8),
+        "se_indptr": np.array(se_indptr, dtype=np.int64),
+        "se_ids": np.array(se_ids, dtype=np.int32),
+        "entao": np.array(entao, dtype=np.int32),
+        "n_condicoes": np.array(n_condicoes, dtype=np.int32),
+        "indice_indptr": indice_indptr,
+        "indice_regras": np.array(indice_regras, dtype=np.int32),
+    }
+
+    # offsets relativos ao início da área de dados; o cabeçalho vem antes
+    cabecalho = {}
+    offset = 0
+    for nome, arr in arrays.items():
+        cabecalho[nome] = [arr.dtype.str, offset, int(arr.size)]
+        offset += -(-arr.nbytes // 8) * 8
+    texto = json.dumps(cabecalho).encode("utf-8")
+    inicio_dados = -(-(len(MAGICO_KB) + 8 + len(texto)) // 8) * 8
+
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(MAGICO_KB)
+        arquivo.write(np.uint64(len(texto)).tobytes())
+        arquivo.write(texto)
+        arquivo.write(b"\0" * (inicio_dados - arquivo.tell()))
+        for nome, arr in arrays.items():
+            arquivo.write(arr.tobytes())
+            arquivo.write(b"\0" * (-arr.nbytes % 8))
+
+class BaseCompilada:
+    def __init__(self, arrays, buffer=None):
+        self.buffer = buffer   # mmap mantido vivo enquanto os arrays existirem
+        self.arrays = arrays
+        for nome, arr in arrays.items():
+            setattr(self, nome, arr)
+        # memoryviews para o laço do motor (sem escalares numpy)
+        self._se_indptr = memoryview(self.se_indptr)
+        self._se_ids = memoryview(self.se_ids)
+        self._entao = memoryview(self.entao)
+        self._indice_indptr = memoryview(self.indice_indptr)
+        self._indice_regras = memoryview(self.indice_regras)
+        self._nomes = None
+        self._ids = None
+
+    @classmethod
+    def carregar(cls, caminho):
+        with open(caminho, "rb") as arquivo:
+            buffer = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        if buffer[:4] != MAGICO_KB:
+            raise ValueError(f"{caminho} não é uma base compilada")
+        tamanho = int(np.frombuffer(buffer, dtype=np.uint64, count=1, offset=4)[0])
+        cabecalho = json.loads(buffer[12:12 + tamanho].decode("utf-8"))
+        inicio_dados = -(-(12 + tamanho) // 8) * 8
+        arrays = {nome: np.frombuffer(buffer, dtype=np.dtype(dtype), count=quantidade, offset=inicio_dados + offset)
+                  for nome, (dtype, offset, quantidade) in cabecalho.items()}
+        return cls(arrays, buffer)
+
+    @property
+    def n_regras(self):
+        return len(self.entao)
+
+    @property
+    def nomes(self):
+        # decodificados só quando alguém precisa dos nomes
+        if self._nomes is None:
+            texto = self.simbolos_bytes.tobytes()
+            offsets = self.simbolos_offsets.tolist()
+            self._nomes = [texto[a:b].decode("utf-8") for a, b in zip(offsets, offsets[1:])]
+        return self._nomes
+
+    def id_de(self, fato):
+        """Id do fato, ou None se ele não aparece em nenhuma regra."""
+        if self._ids is None:
+            self._ids = {nome: i for i, nome in enumerate(self.nomes)}
+        return self._ids.get(fato)
+
+    def regra(self, i):
+        """Reconstrói a regra i no formato {"se": [...], "entao": ...}."""
+        nomes = self.nomes
+        se = [nomes[c] for c in self._se_ids[self._se_indptr[i]:self._se_indptr[i + 1]]]
+        return {"se": se, "entao": nomes[self._entao[i]]}
+
+def motor_inferencia_forward_compilado(fatos_init, base, instrumentacao=None):
+    """
+    Mesmo motor de motor_inferencia_forward_indexado, trabalhando com os ids
+    da BaseCompilada (mesma ordem de fatos e de disparos).
+    """
+    entao, indice_indptr, indice_regras = base._entao, base._indice_indptr, base._indice_regras
+    nomes = base.nomes
+    inst = instrumentacao or Instrumentacao()
+    ativo, cronometrar = inst.ativo, inst.cronometrar
+    testadas = disparadas = 0
+
+    fatos_derivados = list(fatos_init)
+    conhecidos = set()
+    faltando = base.n_condicoes.copy()
+    for fato in fatos_derivados:
+        c = base.id_de(fato)
+        if c is not None and c not in conhecidos:
+            conhecidos.add(c)
+            np.subtract.at(faltando, base.indice_regras[indice_indptr[c]:indice_indptr[c + 1]], 1)
+    agenda = np.flatnonzero(faltando == 0).tolist()
+    faltando = faltando.tolist()
+
+    proxima_passada = []
+    while agenda or proxima_passada:
+        if not agenda:
+            agenda, proxima_passada = proxima_passada, []
+        i = heapq.heappop(agenda)
+        testadas += 1
+        conclusao = entao[i]
+        if conclusao in conhecidos:
+            continue
+        if cronometrar:
+            t0 = time.perf_counter_ns()
+        fatos_derivados.append(nomes[conclusao])
+        conhecidos.add(conclusao)
+        disparadas += 1
+        if ativo:
+            regra = base.regra(i)
+            inst.emitir(tipo="disparo", regra=i, se=regra["se"], entao=regra["entao"])
+
+        for k in range(indice_indptr[conclusao], indice_indptr[conclusao + 1]):
+            j = indice_regras[k]
+            faltando[j] -= 1
+            if faltando[j] == 0:
+                heapq.heappush(agenda if j > i else proxima_passada, j)
+        if cronometrar:
+            inst.registrar_tempo(i, time.perf_counter_ns() - t0)
+
+    inst.contar(testadas, disparadas, disparadas)
+    return fatos_derivados
+
+# Workers do lote: cada processo mapeia o mesmo arquivo uma vez
+_base_worker = None
+
+def _base_worker_init(caminho):
+    global _base_worker
+    _base_worker = BaseCompilada.carregar(caminho)
+
+def _base_worker_inferir(fatos_init):
+    return motor_inferencia_forward_compilado(fatos_init, _base_worker, Instrumentacao(SinkNulo()))
+
+def inferir_lote(caminho, conjuntos_fatos, max_workers=None, chunksize=16):
+    """Roda o forward compilado para vários conjuntos de fatos em processos que compartilham a base via mmap."""
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_base_worker_init,
+                             initargs=(caminho,)) as executor:
+        return list(executor.map(_base_worker_inferir, conjuntos_fatos, chunksize=chunksize))
+
+def gerar_regras(n_regras, n_fatos=None, max_condicoes=3, seed=0):
+    """Base sintética de regras f<i> para testes de carga."""
+    rng = np.random.default_rng(seed)
+    n_fatos = n_fatos or max(10, n_regras // 3)
+    tamanhos = rng.integers(1, max_condicoes + 1, n_regras)
+    condicoes = rng.integers(0, n_fatos, tamanhos.sum()).tolist()
+    conclusoes = rng.integers(0, n_fatos, n_regras).tolist()
+    regras_geradas = []
+    pos = 0
+    for tamanho, conclusao in zip(tamanhos.tolist(), conclusoes):
+        regras_geradas.append({"se": [f"f{c}" for c in condicoes[pos:pos + tamanho]], "entao": f"f{conclusao}"})
+        pos += tamanho
+    return regras_geradas
+
+def benchmark_carga(n_regras=10**5, diretorio=None):
+    """
+    Compara a carga da base por JSON (+ indexação) com a base compilada via mmap.
+    Os arquivos vão para `diretorio` ou, sem ele, para uma pasta temporária.
+    Retorna (tempo JSON, tempo base compilada).
+    """
+    regras_geradas = gerar_regras(n_regras)
+    with tempfile.TemporaryDirectory() as temporario:
+        caminho_json = os.path.join(diretorio or temporario, "regras.json")
+        caminho_kb = os.path.join(diretorio or temporario, "regras.kbc")
+        with open(caminho_json, "w") as arquivo:
+            json.dump(regras_geradas, arquivo)
+        compilar_base(regras_geradas, caminho_kb)
+
+        inicio = time.time()
+        with open(caminho_json) as arquivo:
+            regras_json = json.load(arquivo)
+        indice = indexar_regras(regras_json)
+        t_json = time.time() - inicio
+        inicio = time.time()
+        base = BaseCompilada.carregar(caminho_kb)
+        t_kb = time.time() - inicio
+        del base, indice   # solta o mmap antes de apagar a pasta
+
+    print("\n" + "=" * 60)
+    print(f"       CARGA DA BASE DE REGRAS ({n_regras} regras)")
+    print("=" * 60)
+    print(f"| {'Formato':<28} | {'Tempo de carga':<25} |")
+    print("-" * 60)
+    print(f"| {'JSON + indexar_regras':<28} | {t_json:>24.4f}s |")
+    print(f"| {'Base compilada (mmap)':<28} | {t_kb:>24.4f}s |")
+    print("=" * 60)
+    return t_json, t_kb
+
+# Motor com bitset (bases proposicionais)
+#
+# Cada fato vira uma coluna e cada regra uma linha de uma matriz booleana
+# (regras x fatos) com as condições do "se". Um conjunto de fatos é uma
+# linha booleana; uma rodada inteira de avaliação é um produto de matrizes:
+# a regra dispara quando o número de condições presentes é igual ao número
+# de condições dela. Com várias linhas (vários conjuntos de fatos) a mesma
+# operação classifica milhares de casos de uma vez. O resultado é o mesmo
+# conjunto de fatos do motor_inferencia_forward (a ordem pode mudar).
+
+class BaseBitset:
+    def __init__(self, regras):
+        ids = {}
+        for regra in regras:
+            for fato in (*regra["se"], regra["entao"]):
+                ids.setdefault(fato, len(ids))
+        self.ids = ids
+        self.nomes = list(ids)
+        n_regras, n_fatos = len(regras), len(ids)
+        # float32: o produto usa BLAS e as contagens pequenas são exatas
+        self.condicoes = np.zeros((n_fatos, n_regras), dtype=np.float32)
+        self.conclusoes = np.zeros((n_regras, n_fatos), dtype=np.float32)
+        for i, regra in enumerate(regras):
+            for fato in regra["se"]:
+                self.condicoes[ids[fato], i] = 1.0
+            self.conclusoes[i, ids[regra["entao"]]] = 1.0
+        self.n_condicoes = self.condicoes.sum(axis=0)
+
+    def codificar(self, conjuntos_fatos):
+        """Lista de listas de fatos -> matriz booleana (conjuntos x fatos); fatos fora da base são ignorados."""
+        matriz = np.zeros((len(conjuntos_fatos), len(self.nomes)), dtype=bool)
+        for linha, fatos_init in enumerate(conjuntos_fatos):
+            colunas = [self.ids[f] for f in fatos_init if f in self.ids]
+            matriz[linha, colunas] = True
+        return matriz
+
+    def saturar(self, matriz):
+        """Aplica as regras até não surgir fato novo; recebe e devolve a matriz booleana (conjuntos x fatos)."""
+        fatos_m = matriz.copy()
+        while True:
+            disparadas = (fatos_m.astype(np.float32) @ self.condicoes) >= self.n_condicoes
+            novos = (disparadas.astype(np.float32) @ self.conclusoes) > 0
+            novos &= ~fatos_m
+            if not novos.any():
+                return fatos_m
+            fatos_m |= novos
+
+def motor_inferencia_bitset(fatos_init, base):
+    """Forward com a BaseBitset para um único conjunto: fatos iniciais seguidos dos derivados."""
+    final = base.saturar(base.codificar([fatos_init]))[0]
+    iniciais = set(fatos_init)
+    return list(fatos_init) + [base.nomes[c] for c in np.flatnonzero(final) if base.nomes[c] not in iniciais]
+
+def classificar_lote(base, conjuntos_fatos, tamanho_bloco=4096):
+    """
+    Satura milhares de conjuntos de fatos independentes, em blocos de
+    `tamanho_bloco` linhas. Retorna, para cada conjunto, os fatos derivados
+    (só os novos, na ordem das colunas).
+    """
+    resultados = []
+    for inicio in range(0, len(conjuntos_fatos), tamanho_bloco):
+        bloco = base.codificar(conjuntos_fatos[inicio:inicio + tamanho_bloco])
+        novos = base.saturar(bloco) & ~bloco
+        linhas, colunas = np.nonzero(novos)
+        por_linha = np.split(colunas, np.searchsorted(linhas, np.arange(1, len(bloco))))
+        resultados.extend([base.nomes[c] for c in cols] for cols in por_linha)
+    return resultados
+
+def benchmark_bitset(n_conjuntos=10000, seed=0):
+    """
+    Classifica n_conjuntos conjuntos aleatórios de características com o
+    motor original, o indexado e o bitset em lote, todos sobre `regras`.
+    O Animal do Experta fica de fora: tem regras próprias e fatos fixos
+    (DefFacts), então não faria o mesmo trabalho.
+    """
+    rng = np.random.default_rng(seed)
+    atomos = sorted({c for regra in regras for c in regra["se"]})
+    sorteio = rng.random((n_conjuntos, len(atomos))) < 0.4
+    conjuntos = [[a for a, presente in zip(atomos, linha) if presente] for linha in sorteio.tolist()]
+    base = BaseBitset(regras)
+
+    tempos = {}
+    silencioso = Instrumentacao(SinkNulo())
+    inicio = time.time()
+    esperado = [set(motor_inferencia_forward(c, regras, silencioso)) for c in conjuntos]
+    tempos["Forward original"] = time.time() - inicio
+
+    indice = indexar_regras(regras)
+    inicio = time.time()
+    for c in conjuntos:
+        motor_inferencia_forward_indexado(c, regras, indice, silencioso)
+    tempos["Forward indexado"] = time.time() - inicio
+
+    inicio = time.time()
+    derivados = classificar_lote(base, conjuntos)
+    tempos["Bitset (lote)"] = time.time() - inicio
+    iguais = all(set(c) | set(d) == e for c, d, e in zip(conjuntos, derivados, esperado))
+
+    print("\n" + "=" * 70)
+    print(f"     CLASSIFICAÇÃO DE {n_conjuntos} CONJUNTOS DE FATOS (resultados iguais: {iguais})")
+    print("=" * 70)
+    print(f"| {'Motor':<22} | {'Tempo (T)':<12} | {'Conjuntos/s':<25} |")
+    print("-" * 70)
+    for nome, tempo in tempos.items():
+        print(f"| {nome:<22} | {tempo:>11.4f}s | {n_conjuntos / tempo:>25.0f} |")
+    print("=" * 70)
+    print("Experta (Animal) não entra na comparação: usa outras regras e fatos fixos.")
+
+# Biblioteca Experta (importada só quando esse motor é usado)
+
+_classes_experta = None
+
+def carregar_experta():
+    """Importa o Experta e define as classes do exemplo. Retorna (Caracteristica, Animal)."""
+    global _classes_experta
+    if _classes_experta is not None:
+        return _classes_experta
+    from experta import DefFacts, Fact, KnowledgeEngine, MATCH, Rule
+
+    class Caracteristica(Fact):
+        "Representa uma característica observada"
+        pass
+
+    class Animal(KnowledgeEngine):
+        def __init__(self, instrumentacao=None):
+            super().__init__()
+            self.instrumentacao = instrumentacao or Instrumentacao()
+
+        def _disparo(self, texto):
+            inst = self.instrumentacao
+            inst.contar(disparadas=1, derivados=1)
+            if inst.ativo:
+                inst.emitir(tipo="mensagem", texto=texto)
+
+        @DefFacts()
+        def fatos_iniciais(self):
+            yield Caracteristica("tem_penas")
+            yield Caracteristica("voa")
+            yield Caracteristica("pode_cantar")
+            if self.instrumentacao.ativo:
+                self.instrumentacao.emitir(tipo="mensagem", texto="Fatos iniciais carregados.")
+
+        @Rule(Caracteristica("tem_penas"), Caracteristica("voa"))
+        def regra_e_passaro(self):
+            self._disparo("Regra disparada: SE tem_penas e voa ENTAO e_passaro")
+            self.declare(Fact(animal="e_passaro"))
+
+        @Rule(Fact(animal="e_passaro"), Caracteristica("pode_cantar"))
+        def regra_e_canario(self):
+            self._disparo("Regra disparada: SE e_passaro e pode_cantar ENTAO e_canario")
+            self.declare(Fact(animal="canário"))
+
+        @Rule(Fact(animal=MATCH.tipo))
+        def print_resultado(self, tipo):
+            if tipo == "canário" and self.instrumentacao.ativo:
+                self.instrumentacao.emitir(tipo="mensagem",
+                                           texto=f"Conclusão final do sistema, o tipo de anial é: {tipo}")
+
+    _classes_experta = (Caracteristica, Animal)
+    return _classes_experta
+
+
+if __name__ == "__main__":
+    # Simulação
+
+    fatos = {
+        "clima": "chuva",
+        "temperatura": "ameno"
+    }
+
+    conclusao = motor_inferencia_clima(fatos)
+    print(f"Fatos: {fatos}")
+    print(f"Recomendação do sistema: {conclusao}")
+
+    tabela_clima = TabelaDecisao(base_conhecimento)
+    codigos = tabela_clima.consultar({"clima": np.array(["chuva", "sol", "neve"]),
+                                      "temperatura": np.array(["ameno", "quente", "ameno"])})
+    print(f"Recomendações em lote: {tabela_clima.textos(codigos).tolist()}")
+
+    # Simulação (Forward e Backward)
 
-print(f"Fatos iniciais: {fatos}")
-fatos_finais = motor_inferencia_forward(fatos, regras)
-print(f"Fatos finais: {fatos_finais}")
+    fatos = ["tem_pelos", "voa", "produz_leite"]
+    print(f"Fatos iniciais: {fatos}")
+    fatos_finais = motor_inferencia_forward(fatos, regras)
+    print(f"Fatos finais: {fatos_finais}")
 
-# Biblioteca Experta
-from experta import *
+    fatos_indexado = motor_inferencia_forward_indexado(fatos, regras)
+    print(f"Fatos finais (indexado): {fatos_indexado}")
 
-class Caracteristica(Fact):
-    "Representa uma característica observada"
-    pass
+    provador = ProvadorBackward(fatos, regras)
+    for objetivo, provado in provador.provar_lote(["e_mamifero", "e_morcego", "e_canario", "e_cachorro"]).items():
+        print(f"Backward: {objetivo}? {'provado' if provado else 'não provado'}")
 
-class Animal(KnowledgeEngine):
-    @DefFacts()
-    def fatos_iniciais(self):
-        yield Caracteristica("tem_penas")
-        yield Caracteristica("voa")
-        yield Caracteristica("pode_cantar")
-        print("Fatos iniciais carregados.")
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho_kb = os.path.join(pasta, "regras_animais.kbc")
+        compilar_base(regras, caminho_kb)
+        base = BaseCompilada.carregar(caminho_kb)
+        print(f"Fatos finais (base compilada): "
+              f"{motor_inferencia_forward_compilado(fatos, base, Instrumentacao(SinkNulo()))}")
+        del base   # solta o mmap antes de apagar a pasta
 
-    @Rule(Caracteristica("tem_penas"), Caracteristica("voa"))
-    def regra_e_passaro(self):
-        print("Regra disparada: SE tem_penas e voa ENTAO e_passaro")
-        self.declare(Fact(animal="e_passaro"))
+    sessao = SessaoInferencia(regras, fatos)
+    print(f"Sessão: retirando 'voa' remove {sessao.retract_fact('voa')}")
+    print(f"Sessão: afirmando 'late' adiciona {sessao.assert_fact('late')}")
+    print(f"Sessão: fatos atuais {sessao.fatos()}")
 
-    @Rule(Fact(animal="e_passaro"), Caracteristica("pode_cantar"))
-    def regra_e_canario(self):
-        print("Regra disparada: SE e_passaro e pode_cantar ENTAO e_canario")
-        self.declare(Fact(animal="canário"))
+    instrumentacao = Instrumentacao(SinkMemoria(), cronometrar=True)
+    motor_inferencia_forward_indexado(fatos, regras, instrumentacao=instrumentacao)
+    resumo = instrumentacao.resumo()
+    print(f"Instrumentação: {resumo['regras_testadas']} regras testadas, "
+          f"{resumo['regras_disparadas']} disparadas, {resumo['fatos_derivados']} fatos derivados")
 
-    @Rule(Fact(animal=MATCH.tipo))
-    def print_resultado(self, tipo):
-        if tipo == "canário":
-            print(f"Conclusão final do sistema, o tipo de anial é: {tipo}")
+    base_bitset = BaseBitset(regras)
+    print(f"Fatos finais (bitset): {motor_inferencia_bitset(fatos, base_bitset)}")
 
+    if "--carga" in sys.argv:
+        benchmark_carga()
+    if "--bitset" in sys.argv:
+        benchmark_bitset()
+    if "--tabela" in sys.argv:
+        benchmark_tabela()
 
-animal = Animal()
-animal.reset()
-animal.run()
\ No newline at end of file
+    # Experta (só importado aqui)
+    _, Animal = carregar_experta()
+    animal = Animal()
+    animal.reset()
+    animal.run()
@@ -0,0 +1,236 @@
+# Benchmark das buscas do projeto (grade e grafo) com estatística por repetição
+#
+# Cada caso roda algumas vezes de aquecimento e depois `repeticoes` vezes
+# medindo com perf_counter_ns; o pico de memória sai de uma execução extra
+# com tracemalloc (fora das medições de tempo, que ele deixaria mais lentas).
+# O resultado vai para um JSON que pode ser comparado com outro:
+#
+#   python 05_benchmark_buscas.py --saida base.json
+#   python 05_benchmark_buscas.py --saida novo.json
+#   python 05_benchmark_buscas.py --comparar base.json novo.json
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from busca_grafo import compilar_grafo, grafo_reino
+
+astar = importlib.import_module("03_algoritmo_a_star")
+largura = importlib.import_module("01_busca_em_largura")
+gulosa = importlib.import_module("02_busca_gulosa")
+
+# --- Medição ---
+
+def medir(funcao, args, repeticoes=20, aquecimento=3):
+    """
+    Roda funcao(*args) `aquecimento` vezes sem medir e `repeticoes` vezes
+    medindo. Retorna (tempos em ns, resultado da última execução, pico de memória em bytes).
+    """
+    for _ in range(aquecimento):
+        funcao(*args)
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter_ns()
+        resultado = funcao(*args)
+        tempos.append(time.perf_counter_ns() - inicio)
+
+    tracemalloc.start()
+    funcao(*args)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return tempos, resultado, pico
+
+def estatisticas(tempos_ns):
+    """Mediana, p95, p99, média e mínimo (ns) das amostras."""
+    amostras = np.asarray(tempos_ns, dtype=np.float64)
+    mediana, p95, p99 = np.percentile(amostras, [50, 95, 99])
+    return {
+        "mediana_ns": int(mediana),
+        "p95_ns": int(p95),
+        "p99_ns": int(p99),
+        "media_ns": int(amostras.mean()),
+        "min_ns": int(amostras.min()),
+    }
+
+def registrar_caso(casos, busca, cenario, parametros, funcao, args, repeticoes, aquecimento, nos_explorados=None):
+    """
+    Mede um caso e o acrescenta em `casos`. `nos_explorados(resultado)` extrai
+    o NE do resultado quando a busca o informa (as buscas em grafo sem NE ficam com None).
+    """
+    tempos, resultado, pico = medir(funcao, args, repeticoes, aquecimento)
+    caso = {"busca": busca, "cenario": cenario, "parametros": parametros, "repeticoes": repeticoes}
+    caso.update(estatisticas(tempos))
+    ne = nos_explorados(resultado) if nos_explorados else None
+    caso["nos_explorados"] = ne
+    caso["nos_por_s"] = ne / (caso["mediana_ns"] / 1e9) if ne and caso["mediana_ns"] else None
+    caso["pico_memoria_bytes"] = pico
+    casos.append(caso)
+    return caso
+
+# --- Casos ---
+
+def casos_grade(casos, tamanhos, densidades, repeticoes, aquecimento, seed=42):
+    """Solvers de grade do 03 (A* 4/8-conectado e JPS) nos geradores create_scenario_*."""
+    for tamanho in tamanhos:
+        cenarios = []
+        for densidade in densidades:
+            grid, start, goal, _ = astar.create_scenario_random(tamanho, densidade, seed, "Aleatório")
+            cenarios.append((f"Aleatório {densidade:.0%}", {"tamanho": tamanho, "densidade": densidade},
+                             grid, start, goal))
+        for gerador, nome in ((astar.create_scenario_dense_labyrinth, "Labirinto Densa"),
+                              (astar.create_scenario_bottleneck, "Gargalo"),
+                              (astar.create_scenario_dead_end, "Poço Sem Saída"),
+                              (astar.create_scenario_unreachable, "Inalcançável")):
+            grid, start, goal, _ = gerador(tamanho, nome)
+            cenarios.append((nome, {"tamanho": tamanho}, grid, start, goal))
+
+        for nome, parametros, grid, start, goal in cenarios:
+            for busca, solver in astar.SOLVERS_GRADE.items():
+                registrar_caso(casos, busca, nome, parametros, solver, (grid, start, goal),
+                               repeticoes, aquecimento, nos_explorados=lambda r: r[3])
+
+def casos_grafo(casos, tamanhos_mapa, repeticoes, aquecimento, seed=0, repeticoes_mapas=None):
+    """
+    bfs_game e busca_gulosa no G_game (todos os pares) e em mapas gerados (nx.Graph e CSR).
+    repeticoes_mapas: repetições só dos mapas gerados (None = as mesmas `repeticoes`).
+    """
+    grafo = gulosa.G_game
+    pares = [(a, b) for a in grafo for b in grafo if a != b]
+
+    def todos_os_pares(busca, g):
+        for a, b in pares:
+            busca(g, a, b)
+
+    csr = compilar_grafo(grafo)
+    for busca, funcao in (("bfs_game", largura.bfs_game), ("busca_gulosa", gulosa.busca_gulosa)):
+        for representacao, g in (("nx.Graph", grafo), ("GrafoCSR", csr)):
+            registrar_caso(casos, busca, "G_game (todos os pares)",
+                           {"representacao": representacao, "consultas": len(pares)},
+                           todos_os_pares, (funcao, g), repeticoes, aquecimento)
+
+    for n in tamanhos_mapa:
+        mapa, inicio, objetivo = grafo_reino(n, seed)
+        mapa_csr = compilar_grafo(mapa)
+        for busca, funcao in (("bfs_game", largura.bfs_game), ("busca_gulosa", gulosa.busca_gulosa)):
+            for representacao, g in (("nx.Graph", mapa), ("GrafoCSR", mapa_csr)):
+                registrar_caso(casos, busca, "Mapa de reino", {"nos": n, "representacao": representacao},
+                               funcao, (g, inicio, objetivo), repeticoes_mapas or repeticoes, aquecimento)
+
+def casos_grafo_completo(casos, tamanhos_completo, repeticoes, aquecimento, seed=0):
+    """A* no grafo completo implícito (matriz de distâncias) com pontos aleatórios e com o G_game."""
+    pos = [gulosa.G_game.nodes[n]['pos'] for n in gulosa.G_game]
+    coords = [("G_game", np.array(pos, dtype=np.float64))]
+    rng = np.random.default_rng(seed)
+    coords += [(f"{n} pontos", rng.uniform(0, 1000, (n, 2))) for n in tamanhos_completo]
+    for nome, pontos in coords:
+        dist = gulosa.matriz_distancias(pontos)
+        registrar_caso(casos, "A* grafo completo", nome, {"nos": len(pontos)},
+                       gulosa.astar_grafo_completo, (dist, 0, len(pontos) - 1), repeticoes, aquecimento)
+        registrar_caso(casos, "matriz_distancias", nome, {"nos": len(pontos)},
+                       gulosa.matriz_distancias, (pontos,), repeticoes, aquecimento)
+
+# --- Relatórios ---
+
+def _ms(ns):
+    return f"{ns / 1e6:>10.3f}"
+
+def print_benchmark_table(casos):
+    print("\n" + "=" * 136)
+    print("                                             BENCHMARK DAS BUSCAS")
+    print("=" * 136)
+    print(f"| {'Busca':<20} | {'Cenário':<24} | {'Parâmetros':<38} | {'Mediana ms':<10} | "
+          f"{'p95 ms':<10} | {'p99 ms':<10} | {'Nós/s':<10} | {'Pico KiB':<8} |")
+    print("-" * 136)
+    for caso in casos:
+        parametros = ", ".join(f"{k}={v}" for k, v in caso["parametros"].items())
+        nos_s = f"{caso['nos_por_s']:>10.0f}" if caso["nos_por_s"] else f"{'-':>10}"
+        print(f"| {caso['busca']:<20} | {caso['cenario']:<24} | {parametros:<38} | {_ms(caso['mediana_ns'])} | "
+              f"{_ms(caso['p95_ns'])} | {_ms(caso['p99_ns'])} | {nos_s} | "
+              f"{caso['pico_memoria_bytes'] / 1024:>8.0f} |")
+    print("=" * 136)
+
+def _chave(caso):
+    return (caso["busca"], caso["cenario"], json.dumps(caso["parametros"], sort_keys=True))
+
+def comparar(arquivo_base, arquivo_novo, limiar=0.05):
+    """
+    Compara as medianas de dois JSON do benchmark. Variações acima de
+    `limiar` (fração) que também passam do p95 da base são marcadas.
+    """
+    with open(arquivo_base, encoding="utf-8") as f:
+        base = {_chave(c): c for c in json.load(f)["casos"]}
+    with open(arquivo_novo, encoding="utf-8") as f:
+        novo = {_chave(c): c for c in json.load(f)["casos"]}
+
+    print("\n" + "=" * 120)
+    print(f"            COMPARAÇÃO: {arquivo_base} -> {arquivo_novo}")
+    print("=" * 120)
+    print(f"| {'Busca':<20} | {'Cenário':<24} | {'Parâmetros':<32} | {'Base ms':<10} | "
+          f"{'Novo ms':<10} | {'Variação':<8} | {'':<6} |")
+    print("-" * 120)
+    for chave, caso_base in base.items():
+        caso_novo = novo.get(chave)
+        if caso_novo is None:
+            continue
+        variacao = caso_novo["mediana_ns"] / caso_base["mediana_ns"] - 1 if caso_base["mediana_ns"] else 0.0
+        if variacao > limiar and caso_novo["mediana_ns"] > caso_base["p95_ns"]:
+            marca = "pior"
+        elif variacao < -limiar and caso_novo["p95_ns"] < caso_base["mediana_ns"]:
+            marca = "melhor"
+        else:
+            marca = ""
+        parametros = ", ".join(f"{k}={v}" for k, v in caso_base["parametros"].items())
+        print(f"| {chave[0]:<20} | {chave[1]:<24} | {parametros:<32} | {_ms(caso_base['mediana_ns'])} | "
+              f"{_ms(caso_novo['mediana_ns'])} | {variacao:>+7.1%} | {marca:<6} |")
+    print("=" * 120)
+
+def executar(tamanhos=(50, 200), densidades=(0.1, 0.3), tamanhos_mapa=(10**4,), tamanhos_completo=(200, 1000),
+             repeticoes=20, aquecimento=3, repeticoes_mapas=None):
+    casos = []
+    casos_grade(casos, tamanhos, densidades, repeticoes, aquecimento)
+    casos_grafo(casos, tamanhos_mapa, repeticoes, aquecimento, repeticoes_mapas=repeticoes_mapas)
+    casos_grafo_completo(casos, tamanhos_completo, repeticoes, aquecimento)
+    return {
+        "meta": {
+            "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "repeticoes": repeticoes,
+            "aquecimento": aquecimento,
+            "repeticoes_mapas": repeticoes_mapas or repeticoes,
+        },
+        "casos": casos,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark das buscas em grade e em grafo.")
+    parser.add_argument("--saida", default="benchmark_buscas.json", help="arquivo JSON de saída")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[50, 200], help="lados das grades")
+    parser.add_argument("--densidades", type=float, nargs="+", default=[0.1, 0.3], help="densidades de obstáculos")
+    parser.add_argument("--mapas", type=int, nargs="+", default=[10**4], help="nós dos mapas de reino gerados")
+    parser.add_argument("--completo", type=int, nargs="+", default=[200, 1000],
+                        help="nós dos grafos completos aleatórios")
+    parser.add_argument("--repeticoes", type=int, default=20)
+    parser.add_argument("--aquecimento", type=int, default=3)
+    parser.add_argument("--repeticoes-mapas", type=int, default=None,
+                        help="repetições dos mapas de reino gerados (mais lentos); padrão: --repeticoes")
+    parser.add_argument("--comparar", nargs=2, metavar=("BASE", "NOVO"), help="compara dois JSON e sai")
+    args = parser.parse_args()
+
+    if args.comparar:
+        comparar(*args.comparar)
+        sys.exit()
+
+    relatorio = executar(args.tamanhos, args.densidades, args.mapas, args.completo,
+                         args.repeticoes, args.aquecimento, args.repeticoes_mapas)
+    print_benchmark_table(relatorio["casos"])
+    with open(args.saida, "w", encoding="utf-8") as f:
+        json.dump(relatorio, f, ensure_ascii=False, indent=2)
+    print(f"Resultados salvos em {args.saida}")
@@ -0,0 +1,566 @@
+# Estruturas compartilhadas pelas buscas em grafo (01_busca_em_largura.py e 02_busca_gulosa.py)
+
+import math
+import sys
+import time
+import tracemalloc
+import importlib
+import weakref
+from collections import OrderedDict, deque
+import heapq
+
+import networkx as nx
+import numpy as np
+
+
+# --- Fronteira com ponteiros de pai ---
+
+class ArvoreBusca:
+    """
+    Árvore de busca guardada em listas paralelas: cada entrada tem o nó, o
+    índice da entrada pai e o custo acumulado. Enfileirar custa O(1) (nada
+    de copiar o caminho) e o caminho só é montado uma vez, no objetivo.
+    """
+
+    def __init__(self):
+        self.nos = []
+        self.pais = []
+        self.custos = []
+
+    def adicionar(self, no, pai, custo):
+        """Cria uma entrada e devolve o seu índice (pai = -1 para a raiz)."""
+        self.nos.append(no)
+        self.pais.append(pai)
+        self.custos.append(custo)
+        return len(self.nos) - 1
+
+    def caminho(self, entrada):
+        """Reconstrói o caminho da raiz até a entrada seguindo os pais."""
+        caminho = []
+        while entrada >= 0:
+            caminho.append(self.nos[entrada])
+            entrada = self.pais[entrada]
+        caminho.reverse()
+        return caminho
+
+    def chave(self, entrada):
+        """Chave de desempate que ordena entradas pelo caminho (ver ChaveCaminho)."""
+        return ChaveCaminho(self, entrada)
+
+
+class ChaveCaminho:
+    """
+    Desempate no heap equivalente a comparar as listas de caminho, como na
+    versão que guardava (prioridade, nó, caminho). O caminho só é montado
+    quando prioridade e nó empatam, o que é raro.
+    """
+
+    __slots__ = ("arvore", "entrada")
+
+    def __init__(self, arvore, entrada):
+        self.arvore = arvore
+        self.entrada = entrada
+
+    def __lt__(self, outra):
+        return self.arvore.caminho(self.entrada) < outra.arvore.caminho(outra.entrada)
+
+
+# --- Grafo compilado em CSR ---
+
+class GrafoCSR:
+    """
+    Grafo compilado: nós viram ids inteiros e as arestas ficam em arrays CSR
+    (vizinhos de u em indices[indptr[u]:indptr[u+1]], pesos alinhados em
+    weights) com as coordenadas em x/y. O mapeamento nome <-> id fica
+    disponível para devolver caminhos com os nomes dos locais.
+    """
+
+    def __init__(self, nomes, indptr, indices, weights, x, y, direcionado=False):
+        self.nomes = nomes
+        self.direcionado = direcionado
+        self._reverso = None
+        self.ids = {nome: i for i, nome in enumerate(nomes)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.x = x
+        self.y = y
+        # memoryviews: acesso elemento a elemento sem criar escalares numpy
+        self._indptr = memoryview(indptr)
+        self._indices = memoryview(indices)
+        self._weights = memoryview(weights)
+        self._x = memoryview(x)
+        self._y = memoryview(y)
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def id_de(self, nome):
+        return self.ids[nome]
+
+    def nomes_do_caminho(self, caminho_ids):
+        return [self.nomes[i] for i in caminho_ids]
+
+    def reverso(self):
+        """Grafo com as arestas invertidas (o próprio grafo se não for direcionado)."""
+        if not self.direcionado:
+            return self
+        if self._reverso is None:
+            n = len(self.nomes)
+            origens = np.repeat(np.arange(n, dtype=np.int64), np.diff(self.indptr))
+            ordem = np.argsort(self.indices, kind='stable')
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.indices, minlength=n), out=indptr[1:])
+            self._reverso = GrafoCSR(self.nomes, indptr, origens[ordem], self.weights[ordem],
+                                     self.x, self.y, direcionado=True)
+            self._reverso._reverso = self
+        return self._reverso
+
+def compilar_grafo(grafo):
+    """
+    Converte um nx.Graph com atributos 'pos' e 'weight' em GrafoCSR.
+    Os ids seguem a ordem dos nomes (quando comparáveis), para que os
+    desempates por nome das buscas continuem idênticos; a ordem dos
+    vizinhos de cada nó é a mesma da adjacência do networkx.
+    """
+    try:
+        nomes = sorted(grafo.nodes())
+    except TypeError:
+        nomes = list(grafo.nodes())
+    ids = {nome: i for i, nome in enumerate(nomes)}
+
+    indptr = np.zeros(len(nomes) + 1, dtype=np.int64)
+    indices = []
+    weights = []
+    for i, nome in enumerate(nomes):
+        for vizinho, atributos in grafo.adj[nome].items():
+            indices.append(ids[vizinho])
+            weights.append(atributos.get('weight', 0.0))
+        indptr[i + 1] = len(indices)
+
+    pos = np.array([grafo.nodes[nome].get('pos', (0.0, 0.0)) for nome in nomes], dtype=np.float64).reshape(-1, 2)
+    return GrafoCSR(nomes, indptr, np.array(indices, dtype=np.int64),
+                    np.array(weights, dtype=np.float64),
+                    np.ascontiguousarray(pos[:, 0]), np.ascontiguousarray(pos[:, 1]),
+                    direcionado=grafo.is_directed())
+
+def bfs_csr(csr, inicio, objetivo):
+    """BFS de bfs_game sobre o GrafoCSR. Retorna (caminho com nomes, custo)."""
+    indptr, indices, weights = csr._indptr, csr._indices, csr._weights
+    alvo = csr.ids[objetivo]
+    visitados = bytearray(len(csr))
+    arvore = ArvoreBusca()
+    fila = deque([arvore.adicionar(csr.ids[inicio], -1, 0)])
+
+    while fila:
+        entrada = fila.popleft()
+        u = arvore.nos[entrada]
+        if u == alvo:
+            return csr.nomes_do_caminho(arvore.caminho(entrada)), arvore.custos[entrada]
+        if not visitados[u]:
+            visitados[u] = 1
+            custo = arvore.custos[entrada]
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if not visitados[v]:
+                    fila.append(arvore.adicionar(v, entrada, custo + weights[k]))
+    return None, float('inf')
+
+def gulosa_csr(csr, inicio, objetivo):
+    """Busca gulosa de busca_gulosa sobre o GrafoCSR. Retorna o caminho com nomes (ou None)."""
+    indptr, indices, weights = csr._indptr, csr._indices, csr._weights
+    h = cache_heuristica(csr).lista(objetivo)
+    alvo = csr.ids[objetivo]
+    visitados = bytearray(len(csr))
+    arvore = ArvoreBusca()
+    u = csr.ids[inicio]
+    pq = [(h[u], u, arvore.chave(arvore.adicionar(u, -1, 0)))]
+
+    while pq:
+        _, u, chave = heapq.heappop(pq)
+        if u == alvo:
+            return csr.nomes_do_caminho(arvore.caminho(chave.entrada))
+        if visitados[u]:
+            continue
+        visitados[u] = 1
+        custo = arvore.custos[chave.entrada]
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if not visitados[v]:
+                nova = arvore.adicionar(v, chave.entrada, custo + weights[k])
+                heapq.heappush(pq, (h[v], v, arvore.chave(nova)))
+    return None
+
+def _dijkstra_ids(csr, origem, alvo, heuristica=None):
+    """Núcleo do dijkstra_csr em ids: (caminho em ids ou None, custo, nós expandidos)."""
+    indptr, indices, weights = csr._indptr, csr._indices, csr._weights
+    n = len(csr)
+    dist = [math.inf] * n
+    pais = [-1] * n
+    fechados = bytearray(n)
+    dist[origem] = 0.0
+    pq = [(heuristica(origem, alvo) if heuristica else 0.0, origem)]
+    expandidos = 0
+
+    while pq:
+        _, u = heapq.heappop(pq)
+        if fechados[u]:
+            continue
+        fechados[u] = 1
+        expandidos += 1
+        if u == alvo:
+            caminho = []
+            while u >= 0:
+                caminho.append(u)
+                u = pais[u]
+            caminho.reverse()
+            return caminho, dist[alvo], expandidos
+        du = dist[u]
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = du + weights[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                pais[v] = u
+                heapq.heappush(pq, (nd + heuristica(v, alvo) if heuristica else nd, v))
+    return None, math.inf, expandidos
+
+def dijkstra_csr(csr, inicio, objetivo, heuristica=None):
+    """
+    Dijkstra ponderado sobre o GrafoCSR; com `heuristica(id, id_objetivo)`
+    vira A* (ótimo só se a heurística não superestimar o custo restante).
+    Retorna (caminho com nomes, custo) ou (None, inf).
+    """
+    caminho, custo, _ = _dijkstra_ids(csr, csr.ids[inicio], csr.ids[objetivo], heuristica)
+    if caminho is None:
+        return None, math.inf
+    return csr.nomes_do_caminho(caminho), custo
+
+def busca_unidirecional(csr, inicio, objetivo, heuristica=None):
+    """
+    Mesmo Dijkstra/A* do dijkstra_csr, medido como a_star_grid do 03.
+    Retorna: (caminho, custo, tempo, nós expandidos)
+    """
+    t0 = time.time()
+    caminho, custo, expandidos = _dijkstra_ids(csr, csr.ids[inicio], csr.ids[objetivo], heuristica)
+    if caminho is not None:
+        caminho = csr.nomes_do_caminho(caminho)
+    return caminho, custo, time.time() - t0, expandidos
+
+def busca_bidirecional(csr, inicio, objetivo, heuristica=None):
+    """
+    Dijkstra bidirecional: uma fronteira sai do início e outra do objetivo
+    (no grafo reverso, se for direcionado). mu guarda o melhor caminho visto
+    no encontro das duas; a busca só para quando topo_ida + topo_volta >= mu,
+    porque com pesos o primeiro nó fechado pelos dois lados não garante o
+    caminho ótimo.
+
+    Com `heuristica(id, id_alvo)` vira A* bidirecional usando o potencial
+    médio p(v) = (h(v, objetivo) - h(v, início)) / 2 (ida usa +p, volta -p),
+    que mantém o mesmo critério de parada. A heurística precisa ser
+    consistente (ex.: euclidiana quando os pesos são >= a distância).
+
+    Retorna: (caminho, custo, tempo, nós expandidos)
+    """
+    t0 = time.time()
+    origem, alvo = csr.ids[inicio], csr.ids[objetivo]
+    if origem == alvo:
+        return [inicio], 0.0, time.time() - t0, 1
+
+    n = len(csr)
+    reverso = csr.reverso()
+    if heuristica:
+        def potencial(v):
+            return (heuristica(v, alvo) - heuristica(v, origem)) * 0.5
+    else:
+        def potencial(v):
+            return 0.0
+
+    # [0] = ida (a partir do início), [1] = volta (a partir do objetivo)
+    grafos = (csr, reverso)
+    dist = ([math.inf] * n, [math.inf] * n)
+    pais = ([-1] * n, [-1] * n)
+    fechados = (bytearray(n), bytearray(n))
+    sinais = (1.0, -1.0)
+    dist[0][origem] = 0.0
+    dist[1][alvo] = 0.0
+    filas = ([(potencial(origem), origem)], [(-potencial(alvo), alvo)])
+    mu, encontro = math.inf, -1
+    expandidos = 0
+
+    while True:
+        # descarta entradas velhas do topo das duas filas
+        for lado in (0, 1):
+            fila, fechado = filas[lado], fechados[lado]
+            while fila and fechado[fila[0][1]]:
+                heapq.heappop(fila)
+        if not filas[0] or not filas[1] or filas[0][0][0] + filas[1][0][0] >= mu:
+            break
+
+        # expande o lado com a fila menor
+        lado = 0 if len(filas[0]) <= len(filas[1]) else 1
+        grafo, d, p, sinal = grafos[lado], dist[lado], pais[lado], sinais[lado]
+        d_outro = dist[1 - lado]
+        _, u = heapq.heappop(filas[lado])
+        fechados[lado][u] = 1
+        expandidos += 1
+        indptr, indices, weights = grafo._indptr, grafo._indices, grafo._weights
+        du = d[u]
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = du + weights[k]
+            if nd < d[v]:
+                d[v] = nd
+                p[v] = u
+                heapq.heappush(filas[lado], (nd + sinal * potencial(v), v))
+                if nd + d_outro[v] < mu:
+                    mu, encontro = nd + d_outro[v], v
+
+    if encontro < 0:
+        return None, math.inf, time.time() - t0, expandidos
+    caminho = []
+    u = encontro
+    while u >= 0:
+        caminho.append(u)
+        u = pais[0][u]
+    caminho.reverse()
+    u = pais[1][encontro]
+    while u >= 0:
+        caminho.append(u)
+        u = pais[1][u]
+    return csr.nomes_do_caminho(caminho), mu, time.time() - t0, expandidos
+
+def heuristica_euclidiana(csr):
+    """h(id, id_alvo) pela tabela em cache do grafo (ver CacheHeuristica)."""
+    cache = cache_heuristica(csr)
+    return lambda v, alvo: cache.lista(csr.nomes[alvo])[v]
+
+# --- Tabelas de heurística com cache ---
+
+class CacheHeuristica:
+    """
+    Distância euclidiana de todos os nós até um objetivo, calculada de uma
+    vez com NumPy e guardada por objetivo. Os objetivos menos usados são
+    descartados (LRU) quando passam de `max_objetivos`.
+    """
+
+    def __init__(self, nomes, x, y, max_objetivos=64):
+        self.ids = {nome: i for i, nome in enumerate(nomes)}
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.max_objetivos = max_objetivos
+        self._tabelas = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    @classmethod
+    def de_grafo(cls, grafo, max_objetivos=64):
+        """Monta o cache a partir de um GrafoCSR ou de um nx.Graph com 'pos'."""
+        if isinstance(grafo, GrafoCSR):
+            return cls(grafo.nomes, grafo.x, grafo.y, max_objetivos)
+        nomes = list(grafo.nodes())
+        pos = np.array([grafo.nodes[n]['pos'] for n in nomes], dtype=np.float64).reshape(-1, 2)
+        return cls(nomes, pos[:, 0], pos[:, 1], max_objetivos)
+
+    def _tabela(self, objetivo):
+        tabela = self._tabelas.get(objetivo)
+        if tabela is not None:
+            self._tabelas.move_to_end(objetivo)
+            self.acertos += 1
+            return tabela
+        self.falhas += 1
+        i = self.ids[objetivo]
+        vetor = np.hypot(self.x - self.x[i], self.y - self.y[i])
+        tabela = (vetor, vetor.tolist())
+        self._tabelas[objetivo] = tabela
+        if len(self._tabelas) > self.max_objetivos:
+            self._tabelas.popitem(last=False)
+        return tabela
+
+    def vetor(self, objetivo):
+        """np.ndarray com a distância de cada nó (por id) até o objetivo."""
+        return self._tabela(objetivo)[0]
+
+    def lista(self, objetivo):
+        """Mesmo vetor como lista de floats, mais rápida de indexar nos laços."""
+        return self._tabela(objetivo)[1]
+
+    def distancia(self, a, b):
+        return self._tabela(b)[1][self.ids[a]]
+
+# Um cache por grafo; some junto com o grafo (as posições não devem mudar depois)
+_caches_heuristica = weakref.WeakKeyDictionary()
+
+def cache_heuristica(grafo):
+    """Devolve (criando na primeira vez) o CacheHeuristica do grafo."""
+    cache = _caches_heuristica.get(grafo)
+    if cache is None:
+        cache = CacheHeuristica.de_grafo(grafo)
+        _caches_heuristica[grafo] = cache
+    return cache
+
+
+# --- Versões antigas (cópia do caminho a cada nó), só para o benchmark ---
+
+def _bfs_copiando_caminho(grafo, inicio, objetivo):
+    visitados = set()
+    fila = deque([(inicio, [inicio], 0)])
+    while fila:
+        no_atual, caminho, custo_total = fila.popleft()
+        if no_atual == objetivo:
+            return caminho, custo_total
+        if no_atual not in visitados:
+            visitados.add(no_atual)
+            for vizinho in grafo[no_atual]:
+                if vizinho not in visitados:
+                    novo_custo = custo_total + grafo[no_atual][vizinho]['weight']
+                    novo_caminho = list(caminho)
+                    novo_caminho.append(vizinho)
+                    fila.append((vizinho, novo_caminho, novo_custo))
+    return None, float('inf')
+
+def _gulosa_copiando_caminho(grafo, inicio, objetivo):
+    def h(a):
+        pa, pb = grafo.nodes[a]['pos'], grafo.nodes[objetivo]['pos']
+        return math.hypot(pa[0] - pb[0], pa[1] - pb[1])
+
+    visited = set()
+    pq = [(h(inicio), inicio, [inicio])]
+    while pq:
+        _, nodo, caminho = heapq.heappop(pq)
+        if nodo == objetivo:
+            return caminho
+        if nodo in visited:
+            continue
+        visited.add(nodo)
+        for viz in grafo[nodo]:
+            if viz not in visited:
+                heapq.heappush(pq, (h(viz), viz, caminho + [viz]))
+    return None
+
+
+# --- Benchmark em grafos sintéticos ---
+
+def grafo_corredor(n, largura=2):
+    """
+    Corredor longo: `largura` faixas paralelas de n // largura nós ligadas
+    entre si, com posição e peso. A profundidade da busca cresce com n,
+    que é o pior caso para quem copia o caminho a cada nó.
+    """
+    comprimento = n // largura
+    grafo = nx.Graph()
+    for faixa in range(largura):
+        for i in range(comprimento):
+            grafo.add_node((faixa, i), pos=(i, faixa))
+            if i:
+                grafo.add_edge((faixa, i - 1), (faixa, i), weight=1)
+            if faixa:
+                grafo.add_edge((faixa - 1, i), (faixa, i), weight=1)
+    return grafo, (0, 0), (largura - 1, comprimento - 1)
+
+def grafo_grade(n):
+    """Grade quadrada com ~n nós (fronteira larga), do canto ao canto oposto."""
+    lado = max(2, math.isqrt(n))
+    grafo = nx.grid_2d_graph(lado, lado)
+    nx.set_edge_attributes(grafo, 1, 'weight')
+    nx.set_node_attributes(grafo, {no: no for no in grafo}, 'pos')
+    return grafo, (0, 0), (lado - 1, lado - 1)
+
+def grafo_reino(n, seed=0):
+    """
+    Mapa no estilo do G_game com ~n locais: posições numa grade com ruído,
+    estradas para os vizinhos (incluindo algumas diagonais) e peso igual à
+    distância euclidiana vezes um fator >= 1, para que a heurística
+    euclidiana continue admissível. Vai de um canto ao canto oposto.
+    """
+    rng = np.random.default_rng(seed)
+    lado = max(2, math.isqrt(n))
+    pos = np.indices((lado, lado)).reshape(2, -1).T * 10.0 + rng.uniform(-3, 3, (lado * lado, 2))
+    ids = np.arange(lado * lado).reshape(lado, lado)
+    pares = [(ids[:, :-1], ids[:, 1:]), (ids[:-1, :], ids[1:, :]), (ids[:-1, :-1], ids[1:, 1:])]
+    u = np.concatenate([a.ravel() for a, _ in pares])
+    v = np.concatenate([b.ravel() for _, b in pares])
+    # mantém todas as estradas retas e só ~30% das diagonais
+    manter = np.ones(len(u), dtype=bool)
+    n_retas = len(u) - pares[2][0].size
+    manter[n_retas:] = rng.random(len(u) - n_retas) < 0.3
+    u, v = u[manter], v[manter]
+    pesos = np.hypot(*(pos[u] - pos[v]).T) * rng.uniform(1.0, 1.5, len(u))
+
+    grafo = nx.Graph()
+    grafo.add_nodes_from((i, {'pos': (x, y)}) for i, (x, y) in enumerate(pos.tolist()))
+    grafo.add_weighted_edges_from(zip(u.tolist(), v.tolist(), pesos.tolist()))
+    return grafo, 0, lado * lado - 1
+
+def _medir(funcao, *args):
+    """Executa funcao(*args) medindo tempo (perf_counter) e pico de memória (tracemalloc)."""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    tempo = time.perf_counter() - inicio
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return resultado, tempo, pico
+
+def benchmark_fronteira(tamanhos=(10**3, 10**4, 10**5, 10**6), limite_antigo=2 * 10**4):
+    """
+    Compara BFS e Gulosa com ponteiros de pai contra as versões que copiam
+    o caminho. As versões antigas só rodam até `limite_antigo` nós (acima
+    disso o custo quadrático fica proibitivo).
+    """
+    bfs_game = importlib.import_module("01_busca_em_largura").bfs_game
+    busca_gulosa = importlib.import_module("02_busca_gulosa").busca_gulosa
+
+    print("\n" + "=" * 101)
+    print("                  FRONTEIRA COM PONTEIROS DE PAI x CÓPIA DO CAMINHO")
+    print("=" * 101)
+    print(f"| {'Grafo':<8} | {'Busca':<7} | {'Nós':<8} | {'T antigo':<10} | {'T novo':<10} | "
+          f"{'Mem. antiga':<12} | {'Mem. nova':<12} | {'Iguais':<6} |")
+    print("-" * 101)
+    for nome_grafo, gerador in (("corredor", grafo_corredor), ("grade", grafo_grade)):
+        for n in tamanhos:
+            grafo, inicio, objetivo = gerador(n)
+            for nome, nova, antiga in (("BFS", bfs_game, _bfs_copiando_caminho),
+                                       ("Gulosa", busca_gulosa, _gulosa_copiando_caminho)):
+                res_novo, t_novo, mem_novo = _medir(nova, grafo, inicio, objetivo)
+                if n <= limite_antigo:
+                    res_antigo, t_antigo, mem_antigo = _medir(antiga, grafo, inicio, objetivo)
+                    t_antigo_str = f"{t_antigo:>9.4f}s"
+                    mem_antigo_str = f"{mem_antigo / 2**20:>8.1f} MiB"
+                    iguais = str(res_antigo == res_novo)
+                else:
+                    t_antigo_str = mem_antigo_str = iguais = "-"
+                print(f"| {nome_grafo:<8} | {nome:<7} | {n:<8} | {t_antigo_str:<10} | {t_novo:>9.4f}s | "
+                      f"{mem_antigo_str:<12} | {mem_novo / 2**20:>8.1f} MiB | {iguais:<6} |")
+            del grafo
+    print("=" * 101)
+
+def benchmark_bidirecional(tamanhos=(10**4, 10**5, 10**6), seed=0):
+    """
+    Dijkstra/A* de uma fronteira contra as versões bidirecionais em mapas
+    gerados por grafo_reino, com tempo e nós expandidos de cada busca.
+    """
+    print("\n" + "=" * 86)
+    print("                  BUSCA UNIDIRECIONAL x BIDIRECIONAL (mapas de reino)")
+    print("=" * 86)
+    print(f"| {'Nós':<8} | {'Busca':<22} | {'Custo':<12} | {'Tempo (T)':<10} | {'Nós Expandidos':<14} |")
+    print("-" * 86)
+    for n in tamanhos:
+        grafo, inicio, objetivo = grafo_reino(n, seed)
+        csr = compilar_grafo(grafo)
+        del grafo
+        h = heuristica_euclidiana(csr)
+        for nome, busca, heuristica in (("Dijkstra", busca_unidirecional, None),
+                                        ("Dijkstra bidirecional", busca_bidirecional, None),
+                                        ("A*", busca_unidirecional, h),
+                                        ("A* bidirecional", busca_bidirecional, h)):
+            _, custo, tempo, expandidos = busca(csr, inicio, objetivo, heuristica)
+            print(f"| {len(csr):<8} | {nome:<22} | {custo:<12.2f} | {tempo:>9.4f}s | {expandidos:<14} |")
+        print("-" * 86)
+    print("=" * 86)
+
+if __name__ == "__main__":
+    if "--bidirecional" in sys.argv:
+        benchmark_bidirecional()
+    else:
+        benchmark_fronteira()
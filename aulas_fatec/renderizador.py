@@ -0,0 +1,254 @@
+# Renderização sem janela (Agg) dos mapas e grades, com cache do fundo
+#
+# O mapa base (nós, arestas, rótulos e pesos) é desenhado uma única vez e
+# guardado como raster (copy_from_bbox); cada caminho só restaura esse fundo
+# e desenha por cima as arestas/nós do caminho (blitting). As figuras são
+# criadas fora do pyplot, então não ficam abertas acumulando memória.
+# Para grades grandes, raster_grade monta a imagem direto do array NumPy
+# (sem imshow nem figura).
+
+import os
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')   # backend sem janelas
+import matplotlib.image as mpimg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import networkx as nx
+import numpy as np
+
+
+# --- Mapa do reino (grafo) ---
+
+class RenderizadorMapa:
+    """
+    Mesmo estilo do plot_mapa/plot_mapa_path: fundo com tudo em cinza,
+    caminho em vermelho (arestas mais grossas e nós) por cima.
+    """
+
+    def __init__(self, grafo, figsize=(15, 10), dpi=100):
+        self.grafo = grafo
+        self.pos = nx.get_node_attributes(grafo, 'pos')
+        self.figura = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figura)
+        self.eixo = ax = self.figura.add_subplot()
+
+        pesos = nx.get_edge_attributes(grafo, 'weight')
+        labels = {node: str(node).replace(' ', '\n') for node in grafo.nodes()}
+        nx.draw_networkx_nodes(grafo, self.pos, node_size=1000, node_color='lightgray', ax=ax)
+        nx.draw_networkx_edges(grafo, self.pos, width=1.0, alpha=0.6, edge_color='lightgray', ax=ax)
+        self.rotulos = nx.draw_networkx_labels(grafo, self.pos, labels=labels, font_size=10, font_weight='bold', ax=ax,
+                                               bbox=dict(facecolor='lightblue', alpha=0.5, edgecolor='none',
+                                                         boxstyle='round,pad=0.2'))
+        self.rotulos_pesos = nx.draw_networkx_edge_labels(grafo, self.pos, edge_labels=pesos, font_size=8,
+                                                          label_pos=0.5, ax=ax)
+
+        # o layout reserva o espaço do título, mas o fundo fica sem texto
+        ax.set_title('Mapa do reino')
+        ax.axis('off')
+        self.figura.tight_layout()
+        ax.set_title('')
+        self.canvas.draw()
+        self.fundo = self.canvas.copy_from_bbox(self.figura.bbox)
+
+    def _rotulo_peso(self, a, b):
+        return self.rotulos_pesos.get((a, b)) or self.rotulos_pesos.get((b, a))
+
+    def imagem(self, caminho_encontrado=None, titulo='Mapa do reino'):
+        """Fundo + caminho + título; retorna o array RGBA (altura x largura x 4)."""
+        ax = self.eixo
+        artistas = []
+        if caminho_encontrado:
+            if len(caminho_encontrado) >= 2:
+                arestas = list(zip(caminho_encontrado, caminho_encontrado[1:]))
+                desenho = nx.draw_networkx_edges(self.grafo, self.pos, edgelist=arestas, width=3.5,
+                                                 edge_color='red', ax=ax)
+                artistas.extend(desenho if isinstance(desenho, list) else [desenho])
+            artistas.append(nx.draw_networkx_nodes(self.grafo, self.pos, nodelist=list(caminho_encontrado),
+                                                   node_size=1000, node_color='red', ax=ax))
+            # rótulos do caminho voltam para cima das camadas novas
+            artistas.extend(self.rotulos[n] for n in caminho_encontrado)
+            artistas.extend(filter(None, (self._rotulo_peso(a, b)
+                                          for a, b in zip(caminho_encontrado, caminho_encontrado[1:]))))
+        return self._compor(artistas, titulo)
+
+    def imagem_linha_direta(self, inicio, destino, titulo=None):
+        """Fundo + linha reta inicio-destino com a distância euclidiana no meio; retorna (RGBA, distância)."""
+        ax = self.eixo
+        (x0, y0), (x1, y1) = self.pos[inicio], self.pos[destino]
+        distancia = float(np.hypot(x0 - x1, y0 - y1))
+        artistas = list(ax.plot([x0, x1], [y0, y1], color='red', linewidth=3, linestyle='-', scalex=False, scaley=False))
+        artistas.append(nx.draw_networkx_nodes(self.grafo, self.pos, nodelist=[inicio, destino],
+                                               node_size=1100, node_color='red', ax=ax))
+        artistas.extend(self.rotulos[n] for n in (inicio, destino))
+        artistas.append(ax.text((x0 + x1) / 2.0, (y0 + y1) / 2.0, f'{distancia:.2f}', fontsize=12,
+                                fontweight='bold', color='black',
+                                bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2')))
+        if titulo is None:
+            titulo = f'Linha reta entre "{inicio}" e "{destino}" — custo (euclid) = {distancia:.2f}'
+        return self._compor(artistas, titulo), distancia
+
+    def _compor(self, artistas, titulo):
+        """Restaura o fundo, desenha os artistas e o título por cima e os descarta em seguida."""
+        ax = self.eixo
+        self.canvas.restore_region(self.fundo)
+        for artista in artistas:
+            ax.draw_artist(artista)
+        ax.title.set_text(titulo)
+        ax.draw_artist(ax.title)
+        imagem = np.asarray(self.canvas.buffer_rgba()).copy()
+
+        for artista in artistas:
+            if artista.axes is ax and artista not in self.rotulos.values() \
+                    and artista not in self.rotulos_pesos.values():
+                artista.remove()
+        ax.title.set_text('')
+        return imagem
+
+    def desenhar(self, caminho_encontrado=None, titulo='Mapa do reino', arquivo_saida='mapa.png'):
+        return salvar_raster(self.imagem(caminho_encontrado, titulo)[..., :3], arquivo_saida)
+
+    def desenhar_linha_direta(self, inicio, destino, arquivo_saida='mapa_direto.png', titulo=None):
+        """Grava o mapa com a linha reta; retorna (arquivo, distância)."""
+        imagem, distancia = self.imagem_linha_direta(inicio, destino, titulo)
+        return salvar_raster(imagem[..., :3], arquivo_saida), distancia
+
+# Um renderizador por grafo (o fundo só vale enquanto o grafo não mudar)
+_renderizadores = weakref.WeakKeyDictionary()
+
+def renderizador_para(grafo):
+    renderizador = _renderizadores.get(grafo)
+    if renderizador is None:
+        renderizador = _renderizadores[grafo] = RenderizadorMapa(grafo)
+    return renderizador
+
+# Lote: cada processo monta o fundo uma vez e desenha vários caminhos
+_renderizador_worker = None
+
+def _renderizador_init(grafo):
+    global _renderizador_worker
+    _renderizador_worker = RenderizadorMapa(grafo)
+
+def _renderizar_trabalho(trabalho):
+    caminho, titulo, arquivo = trabalho
+    return _renderizador_worker.desenhar(caminho, titulo, arquivo)
+
+def renderizar_lote(grafo, trabalhos, max_workers=None, chunksize=8):
+    """trabalhos: lista de (caminho, título, arquivo). Retorna os arquivos gerados, na ordem."""
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_renderizador_init,
+                             initargs=(grafo,)) as executor:
+        return list(executor.map(_renderizar_trabalho, trabalhos, chunksize=chunksize))
+
+
+# --- Grades (03_algoritmo_a_star.py) ---
+
+COR_LIVRE = (255, 255, 255)
+COR_OBSTACULO = (0, 0, 0)
+COR_CAMINHO = (0, 0, 255)
+COR_INICIO = (128, 128, 128)
+COR_FIM = (0, 160, 0)
+
+def raster_grade(grid, caminho=None, inicio=None, fim=None, escala=1):
+    """
+    Imagem RGB (uint8) da grade direto do array: livre em branco, obstáculo
+    em preto, caminho em azul, início cinza e fim verde (cores do
+    visualize_results). `escala` repete cada célula em escala x escala pixels.
+    """
+    grid = np.asarray(grid)
+    imagem = np.empty(grid.shape + (3,), dtype=np.uint8)
+    imagem[:] = COR_LIVRE
+    imagem[grid != 0] = COR_OBSTACULO
+    if caminho:
+        celulas = np.asarray(caminho)
+        imagem[celulas[:, 0], celulas[:, 1]] = COR_CAMINHO
+    if inicio is not None:
+        imagem[tuple(inicio)] = COR_INICIO
+    if fim is not None:
+        imagem[tuple(fim)] = COR_FIM
+    if escala > 1:
+        imagem = imagem.repeat(escala, axis=0).repeat(escala, axis=1)
+    return imagem
+
+def salvar_raster(imagem, arquivo):
+    """
+    Grava o array: .ppm/.pgm em binário puro (só NumPy), outros formatos via
+    matplotlib.image.imsave (PNG com compressão rápida, que domina o tempo).
+    """
+    if arquivo.endswith(('.ppm', '.pgm')):
+        altura, largura = imagem.shape[:2]
+        magico = b"P6" if imagem.ndim == 3 else b"P5"
+        with open(arquivo, "wb") as f:
+            f.write(magico + f"\n{largura} {altura}\n255\n".encode("ascii"))
+            f.write(np.ascontiguousarray(imagem, dtype=np.uint8).tobytes())
+    elif arquivo.endswith('.png'):
+        mpimg.imsave(arquivo, imagem, pil_kwargs={"compress_level": 1})
+    else:
+        mpimg.imsave(arquivo, imagem)
+    return arquivo
+
+def _salvar_grade(trabalho):
+    grid = trabalho["grid"]
+    if isinstance(grid, (str, os.PathLike)):
+        grid = np.load(grid, mmap_mode="r")
+    imagem = raster_grade(grid, trabalho.get("caminho"), trabalho.get("inicio"), trabalho.get("fim"),
+                          trabalho.get("escala", 1))
+    return salvar_raster(imagem, trabalho["arquivo"])
+
+def salvar_grades_lote(trabalhos, max_workers=None, chunksize=1):
+    """
+    trabalhos: lista de dicts com grid (array ou caminho .npy, aberto com mmap
+    no processo), arquivo e, opcionalmente, caminho/inicio/fim/escala.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_salvar_grade, trabalhos, chunksize=chunksize))
+
+
+if __name__ == "__main__":
+    import importlib
+    import tempfile
+
+    import matplotlib.pyplot as plt
+
+    modulo = importlib.import_module("02_busca_gulosa")
+    grafo = modulo.G_game
+    pares = [(a, b) for a in grafo for b in grafo if a != b][:40]
+    caminhos = [modulo.busca_gulosa(grafo, a, b) for a, b in pares]
+
+    with tempfile.TemporaryDirectory() as pasta:
+        inicio = time.time()
+        for i, caminho in enumerate(caminhos):
+            # figura inteira refeita a cada caminho (como plot_mapa_path, sem os prints)
+            plt.figure(figsize=(15, 10))
+            pos = nx.get_node_attributes(grafo, 'pos')
+            cores = ['red' if node in caminho else 'lightgray' for node in grafo.nodes()]
+            nx.draw_networkx_nodes(grafo, pos, node_size=1000, node_color=cores)
+            nx.draw_networkx_edges(grafo, pos, width=1.0, alpha=0.6, edge_color='lightgray')
+            nx.draw_networkx_edges(grafo, pos, edgelist=list(zip(caminho, caminho[1:])), width=3.5,
+                                   edge_color='red')
+            nx.draw_networkx_labels(grafo, pos, labels={n: n.replace(' ', '\n') for n in grafo}, font_size=10,
+                                    font_weight='bold', bbox=dict(facecolor='lightblue', alpha=0.5,
+                                                                  edgecolor='none', boxstyle='round,pad=0.2'))
+            nx.draw_networkx_edge_labels(grafo, pos, edge_labels=nx.get_edge_attributes(grafo, 'weight'),
+                                         font_size=8, label_pos=0.5)
+            plt.axis('off')
+            plt.tight_layout()
+            plt.savefig(os.path.join(pasta, f"completo_{i}.png"))
+            plt.close()
+        t_completo = time.time() - inicio
+
+        inicio = time.time()
+        renderizador = RenderizadorMapa(grafo)
+        for i, caminho in enumerate(caminhos):
+            renderizador.desenhar(caminho, f"Caminho {i}", os.path.join(pasta, f"cache_{i}.png"))
+        t_cache = time.time() - inicio
+
+        inicio = time.time()
+        renderizar_lote(grafo, [(caminho, f"Caminho {i}", os.path.join(pasta, f"lote_{i}.png"))
+                                for i, caminho in enumerate(caminhos)])
+        t_lote = time.time() - inicio
+
+    print(f"{len(caminhos)} mapas: figura completa {t_completo:.2f}s | fundo em cache {t_cache:.2f}s | "
+          f"lote em processos {t_lote:.2f}s")
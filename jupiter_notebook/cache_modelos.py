@@ -0,0 +1,168 @@
+# Cache em disco de estimadores já ajustados (scikit-learn) para o Aula 01
+#
+# A chave é o SHA-256 da classe do estimador, dos seus parâmetros
+# (get_params, com estimadores aninhados normalizados recursivamente) e do
+# conteúdo dos arrays passados ao fit; a mesma divisão dos dados com os
+# mesmos hiperparâmetros sempre cai no mesmo arquivo. Cada entrada é um
+# pickle <chave>.pkl; o mtime marca o último uso e, quando o total passa de
+# tamanho_max_bytes, os arquivos usados há mais tempo são apagados (LRU).
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import sklearn
+
+
+# --- Chave ---
+
+def _normalizar(valor):
+    """Representação estável (e picklável sem objetos) de um parâmetro."""
+    if hasattr(valor, "get_params") and not isinstance(valor, type):
+        classe = type(valor)
+        return ("estimador", f"{classe.__module__}.{classe.__qualname__}",
+                _normalizar(valor.get_params(deep=False)))
+    if isinstance(valor, dict):
+        return ("dict", tuple(sorted((repr(k), _normalizar(v)) for k, v in valor.items())))
+    if isinstance(valor, (list, tuple)):
+        return (type(valor).__name__, tuple(_normalizar(v) for v in valor))
+    if isinstance(valor, np.ndarray):
+        return ("ndarray", _resumo_array(valor))
+    # geradores aleatórios: o repr traz o endereço de memória, então entra o estado
+    if isinstance(valor, np.random.RandomState):
+        return ("RandomState", _normalizar(valor.get_state(legacy=False)))
+    if isinstance(valor, np.random.Generator):
+        return ("Generator", _normalizar(valor.bit_generator.state))
+    return repr(valor)
+
+def _resumo_array(array):
+    array = np.ascontiguousarray(array)
+    if array.dtype == object:
+        conteudo = pickle.dumps(array.tolist(), protocol=4)
+    else:
+        conteudo = array.view(np.uint8).tobytes() if array.size else b""
+    return (array.dtype.str, array.shape, hashlib.sha256(conteudo).hexdigest())
+
+def _colunas(x):
+    """Nomes e dtypes das colunas de um DataFrame (o sklearn guarda os nomes em feature_names_in_)."""
+    colunas = getattr(x, "columns", None)
+    if colunas is None:
+        return None
+    return tuple((str(nome), str(dtype)) for nome, dtype in zip(colunas, x.dtypes))
+
+def chave_ajuste(estimador, x, y=None, fit_params=None):
+    """Hash hexadecimal de (versão do sklearn, classe + get_params, x e suas colunas, y, parâmetros extras do fit)."""
+    partes = (
+        sklearn.__version__,
+        _normalizar(estimador),
+        _resumo_array(np.asarray(x)),
+        _colunas(x),
+        _resumo_array(np.asarray(y)) if y is not None else None,
+        _normalizar(fit_params or {}),
+    )
+    return hashlib.sha256(repr(partes).encode()).hexdigest()
+
+
+# --- Cache ---
+
+def _ja_ajustado(estimador):
+    """Mesmo critério do sklearn (check_is_fitted): algum atributo terminado em "_"."""
+    return any(nome.endswith("_") and not nome.startswith("__") for nome in vars(estimador))
+
+class CacheModelos:
+    """
+    Memoização de estimador.fit(x, y) em disco. Em um acerto o estado
+    ajustado lido do arquivo é copiado para o próprio estimador passado
+    (como faria o fit); nas falhas ele é ajustado e gravado.
+    """
+
+    def __init__(self, diretorio=".cache_modelos", tamanho_max_bytes=256 * 2**20):
+        self.diretorio = diretorio
+        self.tamanho_max_bytes = tamanho_max_bytes
+        self.acertos = 0
+        self.falhas = 0
+        os.makedirs(diretorio, exist_ok=True)
+
+    def _arquivo(self, chave):
+        return os.path.join(self.diretorio, chave + ".pkl")
+
+    def ajustar(self, estimador, x, y=None, **fit_params):
+        """
+        Equivale a estimador.fit(x, y, **fit_params), reaproveitando um ajuste
+        igual já gravado; retorna o próprio estimador, já ajustado.
+        Um estimador já ajustado com warm_start=True continuaria do estado
+        atual, que a chave não cobre: nesse caso o fit roda sem o cache.
+        """
+        if estimador.get_params().get("warm_start") and _ja_ajustado(estimador):
+            self.falhas += 1
+            return estimador.fit(x, **fit_params) if y is None else estimador.fit(x, y, **fit_params)
+
+        arquivo = self._arquivo(chave_ajuste(estimador, x, y, fit_params))
+        try:
+            with open(arquivo, "rb") as f:
+                ajustado = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError, ModuleNotFoundError):
+            # pickle incompleto ou de outra versão do sklearn/organização de módulos: falha
+            ajustado = None
+        if ajustado is not None:
+            os.utime(arquivo)   # último uso, para o LRU
+            self.acertos += 1
+            # substitui (não mescla): atributos ajustados antigos do estimador não sobram
+            estimador.__dict__.clear()
+            estimador.__dict__.update(ajustado.__dict__)
+            return estimador
+
+        self.falhas += 1
+        if y is None:
+            estimador.fit(x, **fit_params)
+        else:
+            estimador.fit(x, y, **fit_params)
+        self._gravar(arquivo, estimador)
+        self._despejar()
+        return estimador
+
+    def _gravar(self, arquivo, estimador):
+        # grava num temporário e renomeia: leitores nunca veem um pickle pela metade
+        descritor, temporario = tempfile.mkstemp(dir=self.diretorio, suffix=".tmp")
+        try:
+            with os.fdopen(descritor, "wb") as f:
+                pickle.dump(estimador, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporario, arquivo)
+        except BaseException:
+            os.unlink(temporario)
+            raise
+
+    def _entradas(self):
+        entradas = []
+        with os.scandir(self.diretorio) as it:
+            for entrada in it:
+                if entrada.name.endswith(".pkl"):
+                    info = entrada.stat()
+                    entradas.append((info.st_mtime_ns, info.st_size, entrada.path))
+        return entradas
+
+    def tamanho_total(self):
+        return sum(tamanho for _, tamanho, _ in self._entradas())
+
+    def _despejar(self):
+        """Apaga os arquivos menos usados até o total caber em tamanho_max_bytes."""
+        entradas = sorted(self._entradas())
+        total = sum(tamanho for _, tamanho, _ in entradas)
+        for _, tamanho, caminho in entradas:
+            if total <= self.tamanho_max_bytes:
+                break
+            try:
+                os.unlink(caminho)
+            except FileNotFoundError:
+                pass
+            total -= tamanho
+
+    def limpar(self):
+        for _, _, caminho in self._entradas():
+            os.unlink(caminho)
+        self.acertos = self.falhas = 0
+
+    def __len__(self):
+        return len(self._entradas())
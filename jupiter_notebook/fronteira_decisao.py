@@ -0,0 +1,119 @@
+# Avaliação da fronteira de decisão para os gráficos do Aula 01
+#
+# A malha (meshgrid) de um conjunto de dados é montada uma única vez e
+# reaproveitada em todos os folds; o predict roda em blocos de tamanho fixo,
+# então o pico de memória não cresce com a resolução. No modo grosso_fino o
+# modelo é avaliado numa malha esparsa e só as células em que a classe muda
+# (mais uma vizinhança) são refinadas na resolução cheia.
+
+import hashlib
+
+import numpy as np
+
+
+# --- Malha ---
+
+class GradeFronteira:
+    """Malha resolucao x resolucao cobrindo os dados (Attack, Speed) com uma margem."""
+
+    def __init__(self, x, margem=5, resolucao=500):
+        x = np.asarray(x, dtype=np.float64)
+        x_min, x_max = x[:, 0].min() - margem, x[:, 0].max() + margem
+        y_min, y_max = x[:, 1].min() - margem, x[:, 1].max() + margem
+        self.resolucao = resolucao
+        self.xx, self.yy = np.meshgrid(np.linspace(x_min, x_max, resolucao),
+                                       np.linspace(y_min, y_max, resolucao))
+        # mesmo layout do np.c_[xx.ravel(), yy.ravel()], contíguo para fatiar em blocos
+        self.pontos = np.column_stack((self.xx.ravel(), self.yy.ravel()))
+
+    @property
+    def shape(self):
+        return self.xx.shape
+
+# Uma malha por conjunto de dados (chave: conteúdo do array + parâmetros)
+_grades = {}
+
+def grade_para(x, margem=5, resolucao=500):
+    x = np.ascontiguousarray(x)
+    chave = (hashlib.sha1(x.tobytes()).hexdigest(), x.shape, str(x.dtype), margem, resolucao)
+    grade = _grades.get(chave)
+    if grade is None:
+        grade = _grades[chave] = GradeFronteira(x, margem, resolucao)
+    return grade
+
+
+# --- Predição ---
+
+def prever_em_blocos(model, pontos, tamanho_bloco=65536):
+    """model.predict em fatias de `tamanho_bloco` linhas; junta tudo num único array."""
+    if len(pontos) == 0:
+        return np.empty(0, dtype=np.int64)
+    saida = None
+    for inicio in range(0, len(pontos), tamanho_bloco):
+        parte = model.predict(pontos[inicio:inicio + tamanho_bloco])
+        if saida is None:
+            saida = np.empty(len(pontos), dtype=parte.dtype)
+        saida[inicio:inicio + len(parte)] = parte
+    return saida
+
+def _indices_grossos(n, passo):
+    indices = np.arange(0, n, passo)
+    if indices[-1] != n - 1:
+        indices = np.append(indices, n - 1)
+    return indices
+
+def avaliar_fronteira(model, grade, modo="completo", passo=10, vizinhanca=1, tamanho_bloco=65536):
+    """
+    Classe prevista em cada ponto da malha, no formato grade.shape.
+
+    modo="completo": predict em todos os pontos (em blocos).
+    modo="grosso_fino": predict só nos pontos a cada `passo` linhas/colunas;
+    células cujos quatro cantos têm a mesma classe são preenchidas com ela e
+    as demais (mais `vizinhanca` células em volta) são avaliadas ponto a ponto.
+    Uma região menor que uma célula grossa pode passar despercebida.
+    """
+    if modo == "completo":
+        return prever_em_blocos(model, grade.pontos, tamanho_bloco).reshape(grade.shape)
+    if modo != "grosso_fino":
+        raise ValueError(f"modo desconhecido: {modo}")
+
+    n_linhas, n_colunas = grade.shape
+    linhas = _indices_grossos(n_linhas, passo)
+    colunas = _indices_grossos(n_colunas, passo)
+    indices = (linhas[:, None] * n_colunas + colunas[None, :]).ravel()
+    grosso = prever_em_blocos(model, grade.pontos[indices], tamanho_bloco).reshape(len(linhas), len(colunas))
+
+    # célula (i, j) vai do ponto grosso i ao i+1 (linhas) e do j ao j+1 (colunas)
+    canto = grosso[:-1, :-1]
+    uniforme = (canto == grosso[1:, :-1]) & (canto == grosso[:-1, 1:]) & (canto == grosso[1:, 1:])
+    refinar = ~uniforme
+    for _ in range(vizinhanca):
+        expandida = refinar.copy()
+        expandida[1:, :] |= refinar[:-1, :]
+        expandida[:-1, :] |= refinar[1:, :]
+        expandida[:, 1:] |= refinar[:, :-1]
+        expandida[:, :-1] |= refinar[:, 1:]
+        refinar = expandida
+
+    # célula de cada linha/coluna fina (a última linha fica na última célula)
+    celula_linha = np.minimum(np.searchsorted(linhas, np.arange(n_linhas), side="right") - 1, len(linhas) - 2)
+    celula_coluna = np.minimum(np.searchsorted(colunas, np.arange(n_colunas), side="right") - 1, len(colunas) - 2)
+    z = canto[celula_linha[:, None], celula_coluna[None, :]]
+    pendentes = np.flatnonzero(refinar[celula_linha[:, None], celula_coluna[None, :]])
+    if len(pendentes):
+        z.ravel()[pendentes] = prever_em_blocos(model, grade.pontos[pendentes], tamanho_bloco)
+    return z
+
+
+# --- Nomes dos pontos ---
+
+def indice_nomes(df, colunas=("Attack", "Speed"), coluna_nome="Nome"):
+    """Dicionário (Attack, Speed) -> Nome; em coordenadas repetidas fica o primeiro nome."""
+    indice = {}
+    for *chave, nome in df[list(colunas) + [coluna_nome]].itertuples(index=False, name=None):
+        indice.setdefault(tuple(chave), nome)
+    return indice
+
+def nomes_dos_pontos(indice, pontos):
+    """Nome de cada linha de `pontos` (None quando a coordenada não está no índice)."""
+    return [indice.get(tuple(ponto)) for ponto in np.asarray(pontos).tolist()]
@@ -0,0 +1,151 @@
+# Validação cruzada em paralelo para os experimentos do Aula 01
+#
+# x e y vão uma única vez para memória compartilhada (multiprocessing.shared_memory);
+# cada processo abre os mesmos blocos como arrays somente leitura e recebe
+# só os índices de treino/teste de cada fold. Os folds são agrupados em
+# blocos contíguos: com warm_start, cada fold de um bloco parte dos
+# coeficientes do fold anterior do mesmo bloco (o primeiro parte do zero).
+# O tamanho desses blocos é fixo, então o resultado não depende de quantos
+# processos existem.
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score
+
+
+# --- Dados compartilhados ---
+
+def _compartilhar(array):
+    array = np.ascontiguousarray(array)
+    # dtype=object guarda ponteiros para objetos deste processo: não vale em outro processo
+    if array.dtype.hasobject:
+        raise TypeError("arrays com dtype=object não podem ir para memória compartilhada")
+    bloco = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=bloco.buf)[...] = array
+    return bloco, (bloco.name, array.shape, array.dtype.str)
+
+def _abrir(descricao):
+    nome, shape, dtype = descricao
+    bloco = shared_memory.SharedMemory(name=nome)
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=bloco.buf)
+    array.flags.writeable = False
+    return bloco, array
+
+_dados_worker = None
+
+def _cv_init(fabrica_modelo, desc_x, desc_y, warm_start):
+    global _dados_worker
+    bloco_x, x = _abrir(desc_x)
+    bloco_y, y = _abrir(desc_y)
+    # os blocos ficam referenciados enquanto o processo viver
+    _dados_worker = (fabrica_modelo, x, y, warm_start, bloco_x, bloco_y)
+
+
+# --- Folds ---
+
+def _rodar_folds(fabrica_modelo, x, y, folds, warm_start):
+    """Treina e avalia uma sequência de folds; retorna uma linha (dict) por fold."""
+    linhas = []
+    anterior = None
+    for fold, treino, teste in folds:
+        classes = np.unique(y[treino])
+        if warm_start and anterior is not None and np.array_equal(anterior.classes_, classes):
+            modelo = anterior
+            modelo.set_params(warm_start=True)
+        else:
+            modelo = fabrica_modelo()
+
+        inicio = time.perf_counter()
+        modelo.fit(x[treino], y[treino])
+        tempo_fit = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        previsto = modelo.predict(x[teste])
+        tempo_predict = time.perf_counter() - inicio
+
+        iteracoes = getattr(modelo, "n_iter_", None)
+        linhas.append({
+            "fold": fold,
+            "n_treino": len(treino),
+            "n_teste": len(teste),
+            "acuracia": accuracy_score(y[teste], previsto),
+            "tempo_fit_s": tempo_fit,
+            "tempo_predict_s": tempo_predict,
+            "iteracoes": int(np.max(iteracoes)) if iteracoes is not None else None,
+        })
+        anterior = modelo
+    return linhas
+
+def _rodar_bloco(folds):
+    fabrica_modelo, x, y, warm_start = _dados_worker[:4]
+    return _rodar_folds(fabrica_modelo, x, y, folds, warm_start)
+
+def _blocos(folds, tamanho):
+    return [folds[i:i + tamanho] for i in range(0, len(folds), tamanho)]
+
+
+# --- Execução ---
+
+def executar_cv(fabrica_modelo, divisor, x, y, max_workers=None, warm_start=False, blocos_por_worker=4,
+                folds_por_bloco=16):
+    """
+    Roda todos os folds de `divisor.split(x, y)` e retorna um DataFrame com
+    fold, tamanhos, acurácia, tempo de fit, tempo de predict e iterações.
+
+    fabrica_modelo: chamável sem argumentos que devolve um estimador novo
+    (ex.: LogisticRegression ou functools.partial(LogisticRegression, C=0.5));
+    precisa ser picklável quando max_workers != 1.
+    warm_start: o estimador precisa aceitar o parâmetro warm_start (set_params).
+    Os folds são encadeados em blocos de `folds_por_bloco` (o primeiro de cada
+    bloco parte do zero), iguais com qualquer max_workers. O resultado é uma
+    aproximação: o solver para na tolerância a partir de outro ponto inicial,
+    então coeficientes, iterações e até a acurácia podem diferir um pouco
+    do ajuste sem warm_start.
+    Com max_workers=1 tudo roda no próprio processo, sem pool.
+    Rótulos y com dtype=object (ex.: strings de uma coluna do pandas) viram
+    strings de tamanho fixo (dtype '<U'); x precisa ser numérico.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if y.dtype.hasobject:
+        y = np.array(y.tolist(), dtype=str)
+    if x.dtype.hasobject:
+        raise TypeError("x com dtype=object: converta para numérico (ex.: x.astype(float)) antes do executar_cv")
+    folds = [(fold, treino, teste) for fold, (treino, teste) in enumerate(divisor.split(x, y), start=1)]
+    if warm_start and "warm_start" not in fabrica_modelo().get_params():
+        raise ValueError("o estimador não aceita warm_start")
+
+    if max_workers == 1:
+        linhas = [linha for bloco in _blocos(folds, folds_por_bloco)
+                  for linha in _rodar_folds(fabrica_modelo, x, y, bloco, warm_start)]
+    else:
+        bloco_x, desc_x = _compartilhar(x)
+        bloco_y, desc_y = _compartilhar(y)
+        workers = max_workers or os.cpu_count() or 1
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_cv_init,
+                                     initargs=(fabrica_modelo, desc_x, desc_y, warm_start)) as executor:
+                # sem warm_start os blocos só dividem o trabalho entre os processos
+                tamanho = folds_por_bloco if warm_start else -(-len(folds) // (workers * blocos_por_worker))
+                linhas = [linha for bloco in executor.map(_rodar_bloco, _blocos(folds, tamanho))
+                          for linha in bloco]
+        finally:
+            for bloco in (bloco_x, bloco_y):
+                bloco.close()
+                bloco.unlink()
+    return pd.DataFrame(linhas).set_index("fold")
+
+def resumo_cv(tabela):
+    """Média e desvio da acurácia e tempos totais de fit/predict de uma tabela do executar_cv."""
+    return {
+        "folds": len(tabela),
+        "acuracia_media": float(tabela["acuracia"].mean()),
+        "acuracia_desvio": float(tabela["acuracia"].std(ddof=0)),
+        "tempo_fit_total_s": float(tabela["tempo_fit_s"].sum()),
+        "tempo_predict_total_s": float(tabela["tempo_predict_s"].sum()),
+    }